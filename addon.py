@@ -111,32 +111,42 @@ def print_exc(text=None):
     traceback.print_exc()
 
 
+# Legacy_TODO: Remove or Enhance
+# Support for 2.79 and 2.8+
+BL28_ICONS = dict(
+    ZOOMIN="ADD",
+    ZOOMOUT="REMOVE",
+    ROTACTIVE="TRIA_RIGHT",
+    ROTATE="TRIA_RIGHT_BAR",
+    ROTATECOLLECTION="NEXT_KEYFRAME",
+    NORMALIZE_FCURVES="ANIM_DATA",
+    OOPS="NODETREE",
+    SPLITSCREEN="MOUSE_MMB",
+    GHOST="DUPLICATE",
+)
+
+# Resolved icons. Lookups in ICON_ENUM_ITEMS scan the enum items.
+_ic_cache = {}
+
+
 def ic(icon):
-    # Legacy_TODO: Remove or Enhance
-    # Support for 2.79 and 2.8+
     if not icon:
         return icon
 
-    if icon in ICON_ENUM_ITEMS:
-        return icon
-
-    bl28_icons = dict(
-        ZOOMIN="ADD",
-        ZOOMOUT="REMOVE",
-        ROTACTIVE="TRIA_RIGHT",
-        ROTATE="TRIA_RIGHT_BAR",
-        ROTATECOLLECTION="NEXT_KEYFRAME",
-        NORMALIZE_FCURVES="ANIM_DATA",
-        OOPS="NODETREE",
-        SPLITSCREEN="MOUSE_MMB",
-        GHOST="DUPLICATE",
-    )
+    ret = _ic_cache.get(icon)
+    if ret is not None:
+        return ret
 
-    if icon in bl28_icons and bl28_icons[icon] in ICON_ENUM_ITEMS:
-        return bl28_icons[icon]
+    if icon in ICON_ENUM_ITEMS:
+        ret = icon
+    elif icon in BL28_ICONS and BL28_ICONS[icon] in ICON_ENUM_ITEMS:
+        ret = BL28_ICONS[icon]
+    else:
+        print("Icon not found:", icon)
+        ret = 'BLENDER'
 
-    print("Icon not found:", icon)
-    return 'BLENDER'
+    _ic_cache[icon] = ret
+    return ret
 
 
 def ic_rb(value):
@@ -171,8 +181,9 @@ import importlib
 import inspect
 import pkgutil
 import re
+import time
 from collections import defaultdict
-from typing import Dict, List, Pattern, Set
+from typing import Dict, List, Optional, Pattern, Set
 
 from .infra.debug import (
     DBG_DEPS,
@@ -193,6 +204,13 @@ MODULE_NAMES: List[str] = []  # Load-order resolved module list
 MODULE_PATTERNS: List[Pattern] = []  # Patterns for target modules
 _class_cache: List[type] = None
 
+# Startup timings (ms) per module, see startup_report()
+MODULE_IMPORT_TIMES: Dict[str, float] = {}
+MODULE_REGISTER_TIMES: Dict[str, float] = {}
+
+# Editor mode -> edit module imported and registered by load_editor()
+_loaded_editors: Dict[str, Optional[str]] = {}
+
 # sys.modules["pme"] alias management (Phase 8-D)
 _pme_alias_module = None
 
@@ -304,6 +322,8 @@ def init_addon(
 
     # Reset class cache
     _class_cache = None
+    MODULE_IMPORT_TIMES.clear()
+    MODULE_REGISTER_TIMES.clear()
 
     # Update prefixes if provided
     if prefix:
@@ -350,6 +370,7 @@ def init_addon(
                     data={"module": module_name},
                     location="addon.init_addon",
                 )
+                t = time.perf_counter()
                 try:
                     do_reload = (
                         use_reload
@@ -374,6 +395,7 @@ def init_addon(
                     print(f">>> Failed to load module {module_name}: {str(e)}")
                     traceback.print_exception(type(e), e, e.__traceback__, limit=2)
                 else:
+                    MODULE_IMPORT_TIMES[module_name] = (time.perf_counter() - t) * 1000.0
                     dbg_log(
                         "deps",
                         "Import ok",
@@ -485,9 +507,11 @@ def register_modules() -> None:
         print_subsection_header(f"Registering {len(classes)} classes")
 
     for cls in classes:
+        t = time.perf_counter()
         try:
             _validate_class(cls)
             bpy.utils.register_class(cls)
+            _add_register_time(cls.__module__, t)
             class_success_count += 1
             dbg_log("deps", f"Registered: {cls.__name__}", location="addon.register_modules")
         except Exception as e:
@@ -517,7 +541,9 @@ def register_modules() -> None:
             try:
                 mod = sys.modules[mod_name]
                 if hasattr(mod, "register"):
+                    t = time.perf_counter()
                     mod.register()
+                    _add_register_time(mod_name, t)
                     module_success_count += 1
                     dbg_log("deps", f"Initialized: {_short_name(mod_name)}", location="addon.register_modules")
             except Exception as e:
@@ -537,6 +563,19 @@ def register_modules() -> None:
         print()
         print_failure("Some components failed to initialize")
 
+    dbg_log(
+        "profile",
+        "Startup timings",
+        data={
+            "import_ms": round(sum(MODULE_IMPORT_TIMES.values()), 2),
+            "register_ms": round(sum(MODULE_REGISTER_TIMES.values()), 2),
+            "slowest": [
+                (_short_name(m), round(ms, 2)) for m, ms in _slowest_modules(5)
+            ],
+        },
+        location="addon.register_modules",
+    )
+
 
 def unregister_modules() -> None:
     """
@@ -617,10 +656,160 @@ def unregister_modules() -> None:
         else:
             print_failure("Some components failed to unregister")
 
+    _loaded_editors.clear()
+
     # Uninstall sys.modules["pme"] alias (Phase 8-D)
     _uninstall_pme_alias()
 
 
+# ======================================================
+# Deferred Editor Modules
+# ======================================================
+#
+# Editor modules may move edit-only classes (slot/row editing operators,
+# editor menus) into a private sibling module named by a module-level
+# EDIT_MODULE attribute. Private modules are skipped by
+# _collect_module_names(), so they are neither imported nor registered at
+# startup; load_editor(mode) imports the module and registers its classes
+# the first time a menu of that mode is edited or invoked. The Editor
+# instance itself and the runtime classes stay eager so the preferences
+# list and hotkeys work.
+# ======================================================
+
+
+def _deferred_modules(mode: str = None):
+    for mod_name in MODULE_NAMES:
+        mod = sys.modules.get(mod_name)
+        if mod is None or not getattr(mod, "EDIT_MODULE", None):
+            continue
+        if mode is None or getattr(mod, "EDITOR_MODE", None) == mode:
+            yield mod
+
+
+def _edit_modules():
+    """Edit modules imported by load_editor() in this session."""
+    for mod_name in _loaded_editors.values():
+        mod = sys.modules.get(mod_name) if mod_name else None
+        if mod:
+            yield mod
+
+
+def load_editor(mode: str) -> bool:
+    """Import and register the edit module of the editor for the given mode.
+
+    Safe to call repeatedly; returns True if classes were registered now.
+    """
+    global _class_cache
+    if mode in _loaded_editors or bpy.app.background:
+        return False
+
+    _loaded_editors[mode] = None
+
+    loaded = False
+    start = time.perf_counter()
+    for mod in _deferred_modules(mode):
+        mod_name = f"{mod.__package__}.{mod.EDIT_MODULE}"
+        t = time.perf_counter()
+        try:
+            # Left over from a previous enable, still bound to old modules
+            if mod_name in sys.modules:
+                edit_mod = importlib.reload(sys.modules[mod_name])
+            else:
+                edit_mod = importlib.import_module(mod_name)
+        except Exception as e:
+            print(f">>> Failed to load module {mod_name}: {str(e)}")
+            traceback.print_exception(type(e), e, e.__traceback__, limit=2)
+            continue
+        MODULE_IMPORT_TIMES[mod_name] = (time.perf_counter() - t) * 1000.0
+        _loaded_editors[mode] = mod_name
+        _class_cache = None
+
+        t = time.perf_counter()
+        for _, cls in inspect.getmembers(edit_mod, _is_bpy_class):
+            if cls.__module__ != mod_name or getattr(cls, "is_registered", False):
+                continue
+            try:
+                _validate_class(cls)
+                bpy.utils.register_class(cls)
+                loaded = True
+            except Exception as e:
+                print_failure(f"Class: {cls.__name__}")
+                print(f"     Reason: {str(e)}")
+        _add_register_time(mod_name, t)
+
+    if loaded:
+        dbg_log(
+            "profile",
+            f"Editor loaded: {mode}",
+            data={"load_ms": round((time.perf_counter() - start) * 1000.0, 2)},
+            location="addon.load_editor",
+        )
+    return loaded
+
+
+def is_editor_loaded(mode: str) -> bool:
+    return mode in _loaded_editors
+
+
+# ======================================================
+# Startup Report
+# ======================================================
+
+
+def _add_register_time(mod_name: str, start: float):
+    MODULE_REGISTER_TIMES[mod_name] = (
+        MODULE_REGISTER_TIMES.get(mod_name, 0.0)
+        + (time.perf_counter() - start) * 1000.0
+    )
+
+
+def _slowest_modules(limit: int = None):
+    totals = {
+        m: MODULE_IMPORT_TIMES.get(m, 0.0) + MODULE_REGISTER_TIMES.get(m, 0.0)
+        for m in set(MODULE_IMPORT_TIMES) | set(MODULE_REGISTER_TIMES)
+    }
+    ret = sorted(totals.items(), key=lambda item: -item[1])
+    return ret[:limit] if limit else ret
+
+
+def startup_report(limit: int = None) -> str:
+    """Per-module import and registration times, slowest first.
+
+    Import time includes the module's own imports that were not loaded yet,
+    so the first module of a package usually carries its dependencies.
+    Registration time covers class registration and the module's register().
+    Deferred edit modules are added when load_editor() imports them.
+    """
+    lines = [
+        "=== PME Startup Report ===",
+        "",
+        f"{'Module':<40} {'Import':>9} {'Register':>9}",
+    ]
+    for mod_name, _ in _slowest_modules(limit):
+        lines.append(
+            f"{_short_name(mod_name):<40} "
+            f"{MODULE_IMPORT_TIMES.get(mod_name, 0.0):>7.2f}ms "
+            f"{MODULE_REGISTER_TIMES.get(mod_name, 0.0):>7.2f}ms"
+        )
+
+    lines.append("")
+    lines.append(
+        f"Total: import {sum(MODULE_IMPORT_TIMES.values()):.2f}ms, "
+        f"register {sum(MODULE_REGISTER_TIMES.values()):.2f}ms"
+    )
+
+    pending = sorted(
+        {
+            getattr(mod, "EDITOR_MODE", "")
+            for mod in _deferred_modules()
+        } - _loaded_editors.keys()
+    )
+    if pending:
+        lines.append(f"Deferred editors (not loaded): {', '.join(pending)}")
+
+    return "\n".join(lines)
+
+
 # ======================================================
 # Internal Helper Functions
 # ======================================================
@@ -1077,9 +1266,11 @@ def _get_classes(force: bool = True) -> List[type]:
     class_deps = defaultdict(set)
     pdtype = getattr(props, "_PropertyDeferred", tuple)
 
+    modules = [sys.modules.get(mod_name) for mod_name in MODULE_NAMES]
+    modules.extend(_edit_modules())
+
     all_classes = []
-    for mod_name in MODULE_NAMES:
-        mod = sys.modules.get(mod_name)
+    for mod in modules:
         if not mod:
             continue
 
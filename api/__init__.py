@@ -10,7 +10,7 @@
 #
 # Design principles:
 # - This layer is a thin facade over submodules
-# - Implementation lives in execution.py, menu.py, validation.py
+# - Implementation lives in execution.py, menu.py, properties.py, validation.py
 # - Blender runtime dependencies live in infra/, not here
 #
 # Example:
@@ -51,6 +51,7 @@ __all__ = [
     # Menu API (from menu.py)
     "find_pm",
     "list_pms",
+    "search_menus",
     "list_tags",
     "invoke_pm",
     # Validation API (from validation.py) - top-level access
@@ -59,6 +60,8 @@ __all__ = [
     "validate_uid",
     # User Properties
     "props",
+    "update_props",
+    "snapshot_props",
     # Preferences
     "preferences",
     # Context (backward compat)
@@ -82,7 +85,10 @@ from . import _types as types
 from .execution import execute, evaluate, check_syntax
 
 # Menu API
-from .menu import find_pm, list_pms, invoke_pm, list_tags
+from .menu import find_pm, list_pms, search_menus, invoke_pm, list_tags
+
+# User Property Bulk API
+from .properties import update_props, snapshot_props
 
 # Validation API
 from .validation import validate_json
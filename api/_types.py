@@ -30,6 +30,7 @@ __all__ = [
     "ExecuteResult",
     "SyntaxResult",
     "PMHandle",
+    "MenuSearchResult",
     "ValidationIssue",
     "ValidationResult",
 ]
@@ -108,6 +109,30 @@ class PMHandle:
     tag: str = ""
 
 
+@dataclass
+class MenuSearchResult:
+    """A ranked hit returned by menu search.
+
+    Attributes:
+        pm: Handle of the matched menu.
+        score: Match quality (0.0 - 1.0), higher is better.
+        field: Best matching field ('name', 'tag', 'hotkey', 'keymap',
+               'slot' or 'command').
+        match: Normalized text of the best matching field.
+
+    Example:
+        >>> for hit in pme.search_menus("sculpt", limit=5):
+        ...     print(hit.pm.name, hit.field, round(hit.score, 2))
+
+    Stability: Experimental
+    """
+
+    pm: PMHandle
+    score: float
+    field: str = "name"
+    match: str = ""
+
+
 # =============================================================================
 # JSON Validation Types (Experimental)
 # =============================================================================
@@ -55,6 +55,7 @@ __all__ = [
     # Debug utilities
     "validate_namespace",
     "namespace_report",
+    "startup_report",
     # Constants (for advanced use)
     "PUBLIC_NAMES",
 ]
@@ -141,3 +142,22 @@ def namespace_report() -> str:
     lines.append(f"Public: {len(PUBLIC_NAMES)}, Internal: {len(internal_present)}")
 
     return "\n".join(lines)
+
+
+def startup_report(limit: int | None = None) -> str:
+    """Generate a per-module import/registration time report.
+
+    Args:
+        limit: Max number of modules to list (slowest first).
+
+    Returns:
+        Multi-line string with module timings in milliseconds.
+
+    Example:
+        >>> print(pme.dev.startup_report(10))
+        === PME Startup Report ===
+        ...
+    """
+    from .. import addon
+
+    return addon.startup_report(limit)
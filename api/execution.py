@@ -24,10 +24,10 @@ Stability: Experimental
 
 LAYER = "api"
 
-import ast
 from typing import Any
 
 from ._types import ExecuteResult, SyntaxResult
+from ..core.syntax import compile_cache
 
 __all__ = [
     "execute",
@@ -132,7 +132,9 @@ def evaluate(expr: str, *, extra_globals: dict[str, Any] | None = None) -> Any:
 def check_syntax(code: str, *, mode: str = "exec") -> SyntaxResult:
     """Check Python code syntax without executing it.
 
-    Uses ast.parse() for Pythonic syntax validation.
+    Compiles the code the way PME runs it, so compile-time errors such as
+    'return' outside a function are reported too. Results are shared with
+    the slot editors and reused when the code is executed.
 
     Args:
         code: Python code to validate.
@@ -164,16 +166,16 @@ def check_syntax(code: str, *, mode: str = "exec") -> SyntaxResult:
     if not code.strip():
         return SyntaxResult(valid=True)
 
-    try:
-        ast.parse(code, mode=mode)
+    diagnostic = compile_cache.check(code, mode)
+    if diagnostic is None:
         return SyntaxResult(valid=True)
-    except SyntaxError as e:
-        return SyntaxResult(
-            valid=False,
-            error=e.msg,
-            line=e.lineno,
-            column=e.offset,
-        )
+
+    return SyntaxResult(
+        valid=False,
+        error=diagnostic.message,
+        line=diagnostic.lineno or None,
+        column=diagnostic.col or None,
+    )
 
 
 # =============================================================================
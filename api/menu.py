@@ -25,11 +25,12 @@ LAYER = "api"
 
 import bpy
 
-from ._types import PMHandle
+from ._types import MenuSearchResult, PMHandle
 
 __all__ = [
     "find_pm",
     "list_pms",
+    "search_menus",
     "invoke_pm",
     "list_tags",
 ]
@@ -149,6 +150,66 @@ def list_pms(mode: str | None = None, *, enabled_only: bool = False) -> list[PMH
     return result
 
 
+def search_menus(
+    query: str,
+    limit: int | None = 20,
+    *,
+    mode: str | set[str] | None = None,
+) -> list[MenuSearchResult]:
+    """Search menus by name, tags, keymaps, hotkeys and slot contents.
+
+    Matching is done per word with prefix, substring and trigram
+    (typo tolerant) matching. Results are ranked best first.
+    The index is shared with the search popups and updated incrementally.
+
+    Args:
+        query: Search string (e.g. "sculpt brush", "ctrl+shift+a", "Mesh").
+        limit: Max number of results. None returns all matches.
+        mode: Optional menu type or set of types to search in.
+
+    Returns:
+        List of MenuSearchResult sorted by score.
+
+    Example:
+        >>> for hit in pme.search_menus("subdiv", limit=5):
+        ...     print(hit.pm.name, hit.field)
+
+        >>> popups = pme.search_menus("uv", mode={'DIALOG', 'PANEL'})
+
+    Stability: Experimental
+    """
+    prefs = _get_prefs()
+    if prefs is None:
+        return []
+
+    pie_menus = getattr(prefs, "pie_menus", None)
+    if pie_menus is None:
+        return []
+
+    from ..infra.menu_search import search_menus as _search
+
+    modes = {mode} if isinstance(mode, str) else mode
+    result = []
+    for hit in _search(query, limit=limit, modes=modes):
+        pm = pie_menus.get(hit.key)
+        if pm is None:
+            continue
+
+        result.append(MenuSearchResult(
+            pm=PMHandle(
+                name=pm.name,
+                mode=getattr(pm, "mode", None),
+                enabled=getattr(pm, "enabled", True),
+                uid=getattr(pm, "uid", ""),
+                tag=getattr(pm, "tag", ""),
+            ),
+            score=hit.score,
+            field=hit.field,
+            match=hit.text,
+        ))
+    return result
+
+
 def list_tags() -> list[str]:
     """List all tags currently used by menus.
 
@@ -170,16 +231,8 @@ def list_tags() -> list[str]:
     if pie_menus is None:
         return []
 
-    tags = set()
-    for pm in pie_menus:
-        pm_tag = getattr(pm, "tag", "")
-        if pm_tag:
-            for t in pm_tag.split(","):
-                t = t.strip()
-                if t:
-                    tags.add(t)
-
-    return sorted(tags)
+    from ..infra.tag_index import tag_index
+    return tag_index.tags()
 
 
 # =============================================================================
@@ -0,0 +1,83 @@
+# api/properties.py - User Property Bulk API
+# LAYER = "api"
+#
+# Bulk access to the user properties behind pme.props.
+# These are module functions rather than methods of the property group, so
+# a user property can use any name without shadowing them.
+#
+# Example:
+#     >>> import pme
+#     >>> pme.update_props({"MyCounter": 10, "MyColor": (1, 0, 0)})
+#     >>> values = pme.snapshot_props()
+
+"""PME User Property Bulk API.
+
+This module sets and reads many user properties in one pass.
+
+Example:
+    >>> import pme
+    >>> pme.update_props({"MyCounter": 10})
+    ['MyCounter']
+
+Stability: Experimental
+"""
+
+LAYER = "api"
+
+from ..infra import property as property_utils
+
+__all__ = [
+    "update_props",
+    "snapshot_props",
+]
+
+
+def _get_props():
+    """Get the user properties group (pme.props)."""
+    from ..addon import get_prefs
+    prefs = get_prefs()
+    props = getattr(prefs, "props", None) if prefs else None
+    if props is None:
+        raise RuntimeError("PME user properties are not available")
+    return props
+
+
+def update_props(values: dict, skip_equal: bool = True) -> list[str]:
+    """Set many user properties in one pass.
+
+    Unknown names raise KeyError before any value is set. Values equal to
+    the current ones are skipped, and each property's Update script runs
+    once after all values are set.
+
+    Args:
+        values: Mapping of property name to value.
+        skip_equal: Skip values equal to the current ones.
+
+    Returns:
+        Names of the properties that were set.
+
+    Example:
+        >>> pme.update_props({"MyCounter": 10, "MyColor": (1, 0, 0)})
+
+    Stability: Experimental
+    """
+    return property_utils.update_many(_get_props(), values, skip_equal)
+
+
+def snapshot_props(names: list[str] | None = None, flat: bool = False) -> dict | list:
+    """Read many user properties in one pass.
+
+    Args:
+        names: Property names to read (default: all user properties).
+        flat: Return a flat list with array values expanded, ready for
+            foreach_set() or array.array().
+
+    Returns:
+        Dict of name to value (arrays as tuples) or a flat list.
+
+    Example:
+        >>> values = pme.snapshot_props(["MyCounter", "MyColor"])
+
+    Stability: Experimental
+    """
+    return property_utils.snapshot(_get_props(), names, flat)
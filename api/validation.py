@@ -26,14 +26,16 @@ Stability: Experimental
 LAYER = "api"
 
 import json
-from typing import Any
+from typing import Any, Iterator
 
 from ._types import ValidationIssue, ValidationResult
+from ..core import validator
 
 __all__ = [
     "validate",
     "validate_json",
     "validate_file",
+    "iter_issues",
     "ValidationIssue",
     "ValidationResult",
     "ERROR_CODES",
@@ -82,6 +84,40 @@ ERROR_CODES = {
 }
 
 
+# =============================================================================
+# Validation Engine
+# =============================================================================
+#
+# The checks live in core/validator.py, which imports without bpy so large
+# libraries can be checked in worker processes and from the command line.
+
+
+def iter_issues(
+    data: Any,
+    *,
+    check_references: bool = True,
+    workers: int | None = None,
+) -> Iterator[ValidationIssue]:
+    """Yield validation issues of parsed PME JSON data as they are found.
+
+    Args:
+        data: Already-parsed JSON (PME2 dict, PME1 dict or PME1 list).
+        check_references: Verify menu references and report cycles.
+        workers: Processes for libraries larger than SHARD_SIZE menus.
+            None uses os.cpu_count(). Always 1 inside Blender.
+
+    Example:
+        >>> for issue in pme.validation.iter_issues(data):
+        ...     print(issue.code, issue.path)
+
+    Stability: Experimental
+    """
+    for issue in validator.iter_issues(
+        data, check_references=check_references, workers=workers
+    ):
+        yield ValidationIssue(*issue)
+
+
 # =============================================================================
 # Validation API
 # =============================================================================
@@ -92,6 +128,7 @@ def validate(
     *,
     strict: bool = False,
     check_references: bool = True,
+    workers: int | None = None,
 ) -> ValidationResult:
     """Validate parsed PME JSON data.
 
@@ -99,6 +136,7 @@ def validate(
         data: Already-parsed JSON dict.
         strict: If True, treat warnings as errors.
         check_references: Verify menu uid references exist within the data.
+        workers: Processes for large libraries, see iter_issues().
 
     Returns:
         ValidationResult with detailed error/warning information.
@@ -111,45 +149,21 @@ def validate(
 
     Stability: Experimental
     """
-    # Placeholder - will be implemented with Schema v2
-    # For now, just do basic structure check
     errors: list[ValidationIssue] = []
     warnings: list[ValidationIssue] = []
     schema_version: str | None = None
     menu_count = 0
 
-    if not data:
-        errors.append(ValidationIssue(
-            severity="error",
-            code="E102",
-            path="",
-            message="Empty data",
-        ))
-        return ValidationResult(valid=False, errors=errors, warnings=warnings)
+    for issue in iter_issues(
+        data, check_references=check_references, workers=workers
+    ):
+        (errors if issue.severity == "error" else warnings).append(issue)
 
-    # Detect format
     if isinstance(data, list):
-        # PME1 legacy format (list of tuples)
-        warnings.append(ValidationIssue(
-            severity="warning",
-            code="W301",
-            path="",
-            message="PME1 legacy format detected (will be converted on import)",
-        ))
         menu_count = len(data)
     elif isinstance(data, dict):
-        # PME1 dict or PME2 format
         if "$schema" in data:
-            # PME2 format
             schema_version = data.get("schema_version")
-        elif "menus" in data:
-            # PME1 dict format
-            warnings.append(ValidationIssue(
-                severity="warning",
-                code="W301",
-                path="",
-                message="PME1 format detected (will be converted on import)",
-            ))
 
         menus = data.get("menus", [])
         if isinstance(menus, list):
@@ -173,6 +187,7 @@ def validate_json(
     *,
     strict: bool = False,
     check_references: bool = True,
+    workers: int | None = None,
 ) -> ValidationResult:
     """Validate PME JSON string before import.
 
@@ -182,6 +197,7 @@ def validate_json(
         json_string: JSON string to validate.
         strict: If True, treat warnings as errors.
         check_references: Verify menu uid references exist.
+        workers: Processes for large libraries, see iter_issues().
 
     Returns:
         ValidationResult with detailed error/warning information.
@@ -217,7 +233,9 @@ def validate_json(
         ))
         return ValidationResult(valid=False, errors=errors)
 
-    return validate(data, strict=strict, check_references=check_references)
+    return validate(
+        data, strict=strict, check_references=check_references, workers=workers
+    )
 
 
 def validate_file(
@@ -225,6 +243,7 @@ def validate_file(
     *,
     strict: bool = False,
     check_references: bool = True,
+    workers: int | None = None,
 ) -> ValidationResult:
     """Validate a PME JSON file.
 
@@ -234,6 +253,7 @@ def validate_file(
         filepath: Path to the JSON file.
         strict: If True, treat warnings as errors.
         check_references: Verify menu uid references exist.
+        workers: Processes for large libraries, see iter_issues().
 
     Returns:
         ValidationResult with file-specific error handling.
@@ -275,7 +295,12 @@ def validate_file(
         ))
         return ValidationResult(valid=False, errors=errors)
 
-    return validate_json(json_string, strict=strict, check_references=check_references)
+    return validate_json(
+        json_string,
+        strict=strict,
+        check_references=check_references,
+        workers=workers,
+    )
 
 
 # =============================================================================
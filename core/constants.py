@@ -28,6 +28,8 @@ PMIF_DISABLED = 1
 PANEL_FILE = "sub"
 PANEL_FOLDER = ""
 BL_TIMER_STEP = 0.01
+ICON_PAGE_ROWS = 12
+MAX_PARSE_CACHE = 4096
 
 PME_TEMP_SCREEN = "PME Temp "
 PME_SCREEN = "PME "
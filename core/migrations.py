@@ -0,0 +1,281 @@
+# core/migrations.py - Versioned migration registry and JSON import migrations
+# LAYER = "core"
+#
+# Blender-independent. Migrations are registered with their target version
+# when the module is imported:
+#
+#     JSON_MIGRATIONS = MigrationRegistry()
+#
+#     @JSON_MIGRATIONS.register(1, 17, 1)
+#     def fix_json_1_17_1(menu): ...
+#
+# pending(from_version, to_version) returns the sorted migrations newer than
+# from_version, so importing a library no longer scans globals() per menu.
+#
+# JSON migrations work on raw menu lists from an export file
+# ([name, km_name, hotkey, items, mode, data, open_mode, poll_cmd, ...])
+# and run in a single pass (migrate_json) before any RNA objects exist.
+# RNA migrations (infra.compat) use the same registry class.
+
+LAYER = "core"
+
+import re
+from bisect import bisect_right
+
+# NOTE: Same pragmatic core -> infra exception as core/schema.py.
+try:
+    from ..infra.debug import logi, DBG_INIT
+except ImportError:
+    # Fallback for standalone testing
+    DBG_INIT = False
+    def logi(*args): pass
+
+# Mirrors core.constants (which imports bpy)
+KEYMAP_SPLITTER = ';'
+F_RIGHT = "_right"
+F_PRE = "_pre"
+
+# Modes whose editors have no hotkey (EditorBase.has_hotkey = False)
+NO_HOTKEY_MODES = {'PANEL', 'HPANEL', 'PROPERTY'}
+
+VALID_PROP_TYPES = {'BOOL', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+
+
+class MigrationRegistry:
+    """Migrations sorted by version."""
+
+    def __init__(self):
+        self._versions = []
+        self._funcs = []
+
+    def __len__(self):
+        return len(self._versions)
+
+    def register(self, *version):
+        def decorator(func):
+            idx = bisect_right(self._versions, version)
+            self._versions.insert(idx, version)
+            self._funcs.insert(idx, func)
+            return func
+
+        return decorator
+
+    def pending(self, from_version, to_version=None):
+        """Migrations with from_version < version <= to_version."""
+        start = bisect_right(self._versions, tuple(from_version))
+        end = (
+            len(self._versions)
+            if to_version is None
+            else bisect_right(self._versions, tuple(to_version))
+        )
+        return self._funcs[start:end]
+
+
+JSON_MIGRATIONS = MigrationRegistry()
+
+
+def migrate_json(menus, version):
+    """Apply JSON migrations newer than version to menus in place."""
+    fixes = JSON_MIGRATIONS.pending(version)
+    if not fixes:
+        return
+
+    DBG_INIT and logi("PME JSON Fixes", f"version={version}", f"fixes={len(fixes)}")
+    for menu in menus:
+        for fix_func in fixes:
+            fix_func(menu)
+
+
+def menu_mode(menu):
+    return menu[4] if len(menu) > 4 else 'PMENU'
+
+
+def extract_flags(name):
+    """Strip PME1 extend suffixes. Returns (tp_name, is_right, is_prepend)."""
+    is_right = is_prepend = False
+    if name.endswith(F_PRE):
+        is_prepend = True
+        name = name[: -len(F_PRE)]
+    if name.endswith(F_RIGHT):
+        is_right = True
+        name = name[: -len(F_RIGHT)]
+    return name, is_right, is_prepend
+
+
+@JSON_MIGRATIONS.register(1, 17, 1)
+def fix_json_1_17_1(menu):
+    if menu_mode(menu) in NO_HOTKEY_MODES:
+        return
+
+    menu[1] = (KEYMAP_SPLITTER + " ").join(menu[1].split(","))
+
+
+# =============================================================================
+# PME2 2.0.0 Migrations: Prefix standardization (#92)
+# =============================================================================
+# MODAL: confirm, block_ui, lock → md_confirm, md_block_ui, md_lock
+# PROPERTY: prop? → pr?, vector → pr_vector, etc.
+
+
+def migrate_modal_data(data):
+    """Migrate MODAL data string to use md_ prefix."""
+    if "md_confirm" not in data:
+        data = re.sub(r'\bconfirm\b', 'md_confirm', data)
+    if "md_block_ui" not in data:
+        data = re.sub(r'\bblock_ui\b', 'md_block_ui', data)
+    if "md_lock" not in data:
+        data = re.sub(r'\block\b', 'md_lock', data)
+    return data
+
+
+def migrate_property_data(data):
+    """Migrate PROPERTY data string to use pr_ prefix."""
+    # Change type prefix: prop? → pr?
+    if data.startswith("prop?"):
+        data = "pr?" + data[5:]
+
+    # Migrate property names
+    if "pr_vector" not in data:
+        data = re.sub(r'\bvector\b', 'pr_vector', data)
+    if "pr_mulsel" not in data:
+        data = re.sub(r'\bmulsel\b', 'pr_mulsel', data)
+    if "pr_hor_exp" not in data:
+        data = re.sub(r'\bhor_exp\b', 'pr_hor_exp', data)
+    if "pr_exp" not in data:
+        data = re.sub(r'(?<!hor_)\bexp\b', 'pr_exp', data)
+    if "pr_save" not in data:
+        data = re.sub(r'\bsave\b', 'pr_save', data)
+    return data
+
+
+def _migrate_json_property_poll_cmd(menu):
+    """Migrate PROPERTY prop_type from menu[7] to menu[5] in JSON import.
+
+    PME1 JSON format stores prop_type in menu[7] (poll_cmd field).
+    PME2 stores it in menu[5] (pm.data) as pr_prop_type.
+
+    This migration:
+    1. Reads prop_type from menu[7] if valid
+    2. Adds pr_prop_type to menu[5] (data string)
+    3. Clears menu[7] to use default poll condition
+    """
+    # Get prop_type from menu[7] if present
+    prop_type = 'BOOL'
+    if len(menu) > 7 and menu[7] in VALID_PROP_TYPES:
+        prop_type = menu[7]
+
+    # Get current data string
+    data = menu[5] if len(menu) > 5 else ""
+    if not data:
+        data = "pr?"
+
+    # Add pr_prop_type to data if not already present
+    if "pr_prop_type" not in data:
+        # Parse and append to data string
+        if "?" in data:
+            prefix, _, params = data.partition("?")
+            if params:
+                data = f"{prefix}?pr_prop_type={prop_type}&{params}"
+            else:
+                data = f"{prefix}?pr_prop_type={prop_type}"
+        else:
+            data = f"pr?pr_prop_type={prop_type}"
+        menu[5] = data
+
+    # Clear menu[7] (poll_cmd) - use default poll condition
+    if len(menu) > 7:
+        menu[7] = ""
+
+
+def _migrate_json_extend_target(menu):
+    """Migrate extend_target from menu[0] (pm.name) to menu[5] (pm.data) for JSON import.
+
+    PME1 JSON format encodes extend information in pm.name:
+    - "VIEW3D_PT_tools_pre" → prepend to VIEW3D_PT_tools
+    - "TOPBAR_HT_upper_bar_right" → right region of TOPBAR_HT_upper_bar
+
+    PME2 stores these in pm.data:
+    - pd_extend_target / rm_extend_target: Blender Panel/Menu ID
+    - pd_extend_side / rm_extend_side: "prepend" | "append"
+    - pd_extend_order: int (0 = innermost)
+    - pd_extend_is_right: bool (Header right region, DIALOG only)
+
+    Args:
+        menu: JSON menu array [name, km_name, hotkey, icon, mode, data, ...]
+    """
+    mode = menu[4]
+    if mode not in ('DIALOG', 'RMENU'):
+        return
+
+    name = menu[0]
+    # Parse name for Blender ID and position flags
+    tp_name, is_right, is_prepend = extract_flags(name)
+
+    # Check if tp_name is a valid Blender type ID
+    if not any(x in tp_name for x in ('_PT_', '_MT_', '_HT_')):
+        return
+
+    # Determine prefix and values
+    prefix = "pd" if mode == 'DIALOG' else "rm"
+    extend_side = "prepend" if is_prepend else "append"
+
+    # Get current data string
+    data = menu[5] if len(menu) > 5 else ""
+
+    new_params = [
+        f"{prefix}_extend_target={tp_name}",
+        f"{prefix}_extend_side={extend_side}",
+        f"{prefix}_extend_order=0",
+    ]
+    if prefix == "pd" and is_right:
+        new_params.append(f"{prefix}_extend_is_right=True")
+
+    # Parse existing data to preserve other settings
+    if data and "?" in data:
+        base_prefix, _, params = data.partition("?")
+        # Remove any existing extend properties (shouldn't exist, but be safe)
+        param_pairs = [p for p in params.split("&") if p and not p.startswith(f"{prefix}_extend")]
+        data = f"{base_prefix}?{'&'.join(new_params + param_pairs)}"
+    else:
+        # No existing data, create new
+        data = f"{prefix}?{'&'.join(new_params)}"
+
+    menu[5] = data
+
+    DBG_INIT and logi(
+        "PME JSON: migrated extend_target",
+        f"name={name!r}",
+        f"extend_target={tp_name!r}",
+        f"extend_side={extend_side!r}",
+        f"is_right={is_right}"
+    )
+
+
+@JSON_MIGRATIONS.register(2, 0, 0)
+def fix_json_2_0_0(menu):
+    """
+    Migrate MODAL, PROPERTY, and Extend properties in JSON import.
+
+    JSON menu structure (PME1 format):
+      menu[0] = name (may contain Blender type ID for Extend menus)
+      menu[4] = mode
+      menu[5] = data (pm.data string)
+      menu[7] = poll_cmd (or prop_type for PROPERTY mode in PME1)
+    """
+    if len(menu) < 6:
+        return
+
+    mode = menu[4]
+    data = menu[5]
+
+    if mode == 'MODAL' and data:
+        menu[5] = migrate_modal_data(data)
+    elif mode == 'PROPERTY':
+        if data:
+            menu[5] = migrate_property_data(data)
+        # Migrate prop_type from menu[7] to menu[5] (pm.data)
+        _migrate_json_property_poll_cmd(menu)
+
+    # Migrate extend_target from pm.name to pm.data (DIALOG/RMENU)
+    if mode in ('DIALOG', 'RMENU'):
+        _migrate_json_extend_target(menu)
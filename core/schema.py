@@ -102,14 +102,18 @@ class SchemaRegistry:
         Results are cached. If the prop_map has grown since parsing,
         missing properties are added with their defaults.
         """
-        if text not in self.parsed_data:
-            self.parsed_data[text] = ParsedData(text)
-
-        pd = self.parsed_data[text]
-        for k, prop in self.prop_map.items():
-            if prop.type == pd.type and not hasattr(pd, k):
-                setattr(pd, k, prop.default)
-                DBG_RUNTIME and logw("PME: defaulted missing prop", f"type={pd.type}", f"prop={k}")
+        pd = self.parsed_data.get(text)
+        if pd is None:
+            pd = self.parsed_data[text] = ParsedData(text)
+
+        # Only re-check defaults if properties were registered since
+        num_props = len(self.prop_map)
+        if pd._num_props != num_props:
+            for k, prop in self.prop_map.items():
+                if prop.type == pd.type and not hasattr(pd, k):
+                    setattr(pd, k, prop.default)
+                    DBG_RUNTIME and logw("PME: defaulted missing prop", f"type={pd.type}", f"prop={k}")
+            pd._num_props = num_props
 
         return pd
 
@@ -118,11 +122,15 @@ class SchemaRegistry:
 
         Only stores values that differ from defaults.
         """
+        return self.encode_many(text, {prop: value})
+
+    def encode_many(self, text, values):
+        """Encode several property values into a data string at once."""
         tp, _, data = text.partition("?")
 
         data = data.split("&")
         lst = []
-        has_prop = False
+        encoded = set()
         for pr in data:
             if not pr:
                 continue
@@ -131,15 +139,16 @@ class SchemaRegistry:
             if k not in self.prop_map:
                 continue
 
-            if k == prop:
-                v = value
-                has_prop = True
+            if k in values:
+                v = values[k]
+                encoded.add(k)
 
             if v != self.get(k).default:
                 lst.append("%s=%s" % (k, v))
 
-        if not has_prop and value != self.prop_map[prop].default:
-            lst.append("%s=%s" % (prop, value))
+        for k, v in values.items():
+            if k not in encoded and v != self.prop_map[k].default:
+                lst.append("%s=%s" % (k, v))
 
         lst.sort()
 
@@ -173,6 +182,39 @@ class SchemaRegistry:
 schema = SchemaRegistry()
 
 
+class DataEdit:
+    """Pending property changes of a data string (pm.data).
+
+    Values are kept in the form parse() would return them, so reads
+    through an edit match reads after encoding. Cleared properties are
+    stored as their defaults, which encode_many() drops.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def get(self, key):
+        return self.values[key]
+
+    def set(self, key, value):
+        prop = schema.prop_map[key]
+        if value != prop.default:
+            value = prop.decode_value("%s" % value)
+        self.values[key] = value
+
+    def clear(self, *keys):
+        for key in keys:
+            prop = schema.get(key)
+            if prop:
+                self.values[key] = prop.default
+
+    def encode(self, text):
+        return schema.encode_many(text, self.values)
+
+
 class ParsedData:
     """Container for parsed property data.
 
@@ -185,6 +227,7 @@ class ParsedData:
     def __init__(self, text):
         self.type, _, data = text.partition("?")
         self._initialized = False  # Track if prop_map was available
+        self._num_props = len(schema.prop_map)
 
         for k, prop in schema.prop_map.items():
             if prop.type == self.type:
@@ -0,0 +1,334 @@
+# core/search.py - Ranked text search index
+# LAYER = "core"
+#
+# Blender-independent in-memory index used by menu search.
+# Documents are small records of named text fields (name, tags, hotkey, ...).
+# Candidates are collected from a word-prefix index and a trigram index,
+# then ranked by match quality multiplied by field weight.
+#
+# The index is updated per document, so callers can keep it in sync
+# incrementally instead of rebuilding it on every search.
+
+LAYER = "core"
+
+import re
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+MAX_PREFIX_LEN = 4
+MIN_TRIGRAM_RATIO = 0.5
+
+DEFAULT_WEIGHTS = {
+    "name": 1.0,
+    "tag": 0.8,
+    "hotkey": 0.8,
+    "keymap": 0.5,
+    "slot": 0.6,
+    "command": 0.4,
+}
+
+_re_word = re.compile(r"[^\W_]+|[^\w\s]+")
+
+
+class SearchHit(NamedTuple):
+    key: Hashable
+    score: float
+    field: str
+    text: str
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def split_words(text: str) -> List[str]:
+    return _re_word.findall(text)
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return word-boundary padded trigrams of a normalized text."""
+    ret = set()
+    for word in split_words(text):
+        padded = " %s " % word
+        for i in range(len(padded) - 2):
+            ret.add(padded[i : i + 3])
+    return ret
+
+
+def match_score(term: str, text: str, text_trigrams: Set[str], term_trigrams: Set[str]) -> float:
+    """Rate how well a normalized term matches a normalized field text (0..1)."""
+    if text == term:
+        return 1.0
+    if text.startswith(term):
+        return 0.9
+    idx = text.find(term)
+    if idx != -1:
+        if idx == 0 or not text[idx - 1].isalnum():
+            return 0.75
+        return 0.6
+
+    if not term_trigrams:
+        return 0.0
+
+    ratio = len(term_trigrams & text_trigrams) / len(term_trigrams)
+    if ratio < MIN_TRIGRAM_RATIO:
+        return 0.0
+    return 0.5 * ratio
+
+
+class _Field:
+    __slots__ = ("name", "text", "trigrams")
+
+    def __init__(self, name, text):
+        self.name = name
+        self.text = text
+        self.trigrams = trigrams(text)
+
+
+class SearchIndex:
+    """Incremental trigram + prefix index over documents with text fields.
+
+    Example:
+        >>> index = SearchIndex()
+        >>> index.update("Pie", {"name": "Modeling Pie", "tag": ["Mesh"]})
+        >>> [h.key for h in index.search("mod")]
+        ['Pie']
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+
+        self._docs: Dict[Hashable, Tuple[_Field, ...]] = {}
+        self._trigram_map: Dict[str, Set[Hashable]] = {}
+        self._prefix_map: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, key):
+        return key in self._docs
+
+    def keys(self):
+        return self._docs.keys()
+
+    def clear(self):
+        self._docs.clear()
+        self._trigram_map.clear()
+        self._prefix_map.clear()
+
+    @staticmethod
+    def _doc_postings(fields: Tuple[_Field, ...]):
+        grams = set()
+        prefixes = set()
+        for f in fields:
+            grams |= f.trigrams
+            for word in split_words(f.text):
+                for i in range(1, min(len(word), MAX_PREFIX_LEN) + 1):
+                    prefixes.add(word[:i])
+        return grams, prefixes
+
+    def update(self, key: Hashable, fields: Dict[str, object]):
+        """Add or replace a document.
+
+        Args:
+            key: Document key (e.g. menu name)
+            fields: Mapping of field name to a string or an iterable of strings
+        """
+        self.remove(key)
+
+        entries = []
+        for name, value in fields.items():
+            values = (value,) if isinstance(value, str) else value or ()
+            for v in values:
+                v = normalize(v) if v else ""
+                if v:
+                    entries.append(_Field(name, v))
+
+        entries = tuple(entries)
+        self._docs[key] = entries
+
+        grams, prefixes = self._doc_postings(entries)
+        for g in grams:
+            self._trigram_map.setdefault(g, set()).add(key)
+        for p in prefixes:
+            self._prefix_map.setdefault(p, set()).add(key)
+
+    def remove(self, key: Hashable) -> bool:
+        entries = self._docs.pop(key, None)
+        if entries is None:
+            return False
+
+        grams, prefixes = self._doc_postings(entries)
+        for index, postings in ((self._trigram_map, grams), (self._prefix_map, prefixes)):
+            for p in postings:
+                keys = index.get(p)
+                if keys is None:
+                    continue
+                keys.discard(key)
+                if not keys:
+                    del index[p]
+        return True
+
+    def _candidates(self, term: str, term_trigrams: Set[str]) -> Set[Hashable]:
+        ret = set()
+        if len(term) <= MAX_PREFIX_LEN:
+            ret |= self._prefix_map.get(term, set())
+        else:
+            ret |= self._prefix_map.get(term[:MAX_PREFIX_LEN], set())
+
+        if term_trigrams:
+            votes = {}
+            for g in term_trigrams:
+                for key in self._trigram_map.get(g, ()):
+                    votes[key] = votes.get(key, 0) + 1
+
+            min_votes = max(1, int(len(term_trigrams) * MIN_TRIGRAM_RATIO + 0.5))
+            ret.update(k for k, v in votes.items() if v >= min_votes)
+
+        return ret
+
+    def _score_term(self, key, term, term_trigrams):
+        best = (0.0, "", "")
+        for f in self._docs[key]:
+            weight = self.weights.get(f.name, 0.5)
+            if weight <= best[0]:
+                continue
+            score = match_score(term, f.text, f.trigrams, term_trigrams) * weight
+            if score > best[0]:
+                best = (score, f.name, f.text)
+        return best
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 20,
+        keys: Optional[Iterable[Hashable]] = None,
+    ) -> List[SearchHit]:
+        """Return documents matching every word of the query, best first.
+
+        Args:
+            query: Search string, words are matched independently
+            limit: Max number of hits (None - no limit)
+            keys: Optional subset of document keys to search in
+        """
+        terms = split_words(normalize(query))
+        if not terms:
+            return []
+
+        subset = set(keys) if keys is not None else None
+        candidates = None
+        term_grams = []
+        for term in terms:
+            tg = trigrams(term) if len(term) >= 3 else set()
+            term_grams.append(tg)
+            found = self._candidates(term, tg)
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                return []
+
+        if subset is not None:
+            candidates &= subset
+
+        hits = []
+        for key in candidates:
+            total = 0.0
+            best = None
+            for term, tg in zip(terms, term_grams, strict=True):
+                score, field, text = self._score_term(key, term, tg)
+                if score <= 0:
+                    break
+                total += score
+                if best is None or score > best[0]:
+                    best = (score, field, text)
+            else:
+                hits.append(SearchHit(key, total / len(terms), best[1], best[2]))
+
+        hits.sort(key=lambda h: (-h.score, str(h.key)))
+        if limit is not None:
+            del hits[limit:]
+        return hits
+
+
+class SubstringIndex:
+    """Names with an n-gram index for plain substring filtering.
+
+    filter() returns the names containing the query, in index order
+    (sorted unless sort=False), with the same result as a linear
+    `query in name` scan. Results are cached per query; a query extending
+    a cached one only re-checks the cached result.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        n: int = 3,
+        max_cached: int = 64,
+        sort: bool = True,
+    ):
+        self.n = n
+        self.max_cached = max_cached
+        names = dict.fromkeys(names)
+        self.names: Tuple[str, ...] = tuple(sorted(names) if sort else names)
+        self._grams: Dict[str, Set[int]] = {}
+        self._cache: Dict[str, Tuple[str, ...]] = {}
+
+        for idx, name in enumerate(self.names):
+            for gram in self._ngrams(name):
+                self._grams.setdefault(gram, set()).add(idx)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _ngrams(self, text: str) -> Set[str]:
+        n = self.n
+        return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+    def _narrow(self, query: str) -> Optional[Tuple[str, ...]]:
+        # Longest cached prefix of the query, if any
+        for end in range(len(query) - 1, 0, -1):
+            ret = self._cache.get(query[:end])
+            if ret is not None:
+                return ret
+        return None
+
+    def filter(self, query: str) -> Tuple[str, ...]:
+        if not query:
+            return self.names
+
+        ret = self._cache.get(query)
+        if ret is not None:
+            return ret
+
+        base = self._narrow(query)
+        if base is not None:
+            ret = tuple(name for name in base if query in name)
+
+        elif len(query) < self.n:
+            ret = tuple(name for name in self.names if query in name)
+
+        else:
+            postings = []
+            for gram in self._ngrams(query):
+                found = self._grams.get(gram)
+                if not found:
+                    postings = None
+                    break
+                postings.append(found)
+
+            if postings:
+                postings.sort(key=len)
+                candidates = set(postings[0])
+                for found in postings[1:]:
+                    candidates &= found
+                names = self.names
+                ret = tuple(
+                    names[idx] for idx in sorted(candidates) if query in names[idx]
+                )
+            else:
+                ret = ()
+
+        if len(self._cache) >= self.max_cached:
+            self._cache.clear()
+        self._cache[query] = ret
+        return ret
@@ -0,0 +1,132 @@
+# core/syntax.py - Shared compile cache for slot code
+# LAYER = "core"
+#
+# Blender-independent. Every place that needs to know whether a slot,
+# description or poll string parses (EditorBase.on_pmi_check, the property
+# and modal editors, api.check_syntax) and every place that runs one
+# (runtime_context.exe/eval, poll methods, description tooltips) goes
+# through compile_cache, so a string is compiled once per
+# (mode, prefix, text):
+#
+#     code, diagnostic = compile_cache.compile(text, 'exec')
+#
+# prefix wraps the text before compiling ("def poll(cls, context):" ...)
+# and is stripped again from diagnostic positions.
+#
+# infra.syntax_check fills the same cache from its worker thread.
+
+LAYER = "core"
+
+from typing import NamedTuple
+
+MAX_CACHE = 1024
+
+DESCRIPTION_PREFIX = "def _get_desc():"
+POLL_PREFIX = "def poll(cls, context):"
+GETTER_PREFIX = "def _():"
+
+
+class Diagnostic(NamedTuple):
+    message: str
+    lineno: int = 0
+    col: int = 0
+    end_lineno: int = 0
+    end_col: int = 0
+
+    @staticmethod
+    def from_error(e, prefix=""):
+        if not isinstance(e, SyntaxError):
+            return Diagnostic(str(e))
+
+        lineno = e.lineno or 0
+        col = e.offset or 0
+        end_lineno = e.end_lineno or lineno
+        end_col = e.end_offset or col
+
+        # Map positions back to the user's text
+        if prefix:
+            num_lines = prefix.count("\n")
+            width = len(prefix.rpartition("\n")[2])
+            if lineno == num_lines + 1:
+                col = max(col - width, 1)
+            if end_lineno == num_lines + 1:
+                end_col = max(end_col - width, 1)
+            lineno = max(lineno - num_lines, 1)
+            end_lineno = max(end_lineno - num_lines, 1)
+
+        return Diagnostic(e.msg or str(e), lineno, col, end_lineno, end_col)
+
+    def location(self):
+        if not self.lineno:
+            return ""
+        ret = "line %d, col %d" % (self.lineno, self.col)
+        if self.end_lineno != self.lineno:
+            ret += " - line %d, col %d" % (self.end_lineno, self.end_col)
+        elif self.end_col > self.col + 1:
+            ret += "-%d" % (self.end_col - 1)
+        return ret
+
+    def format(self):
+        location = self.location()
+        if location:
+            return "%s (%s)" % (self.message, location)
+        return self.message
+
+
+def compile_entry(mode, prefix, text):
+    """Compile prefix + text. Returns (code, None) or (None, Diagnostic).
+
+    Thread safe, does not touch the cache.
+    """
+    try:
+        return compile(prefix + text, "<string>", mode), None
+    except Exception as e:
+        return None, Diagnostic.from_error(e, prefix)
+
+
+class CompileCache:
+    """(mode, prefix, text) -> (code, Diagnostic or None), oldest evicted first."""
+
+    def __init__(self, max_size=MAX_CACHE):
+        self.max_size = max_size
+        self._entries = {}
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def store(self, key, entry):
+        if key not in self._entries and len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = entry
+
+    def compile(self, text, mode='exec', prefix=""):
+        """Return (code, diagnostic), compiling text on a miss."""
+        key = (mode, prefix, text)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = compile_entry(*key)
+            self.store(key, entry)
+        return entry
+
+    def check(self, text, mode='exec', prefix=""):
+        """Return None if text compiles, a Diagnostic otherwise."""
+        return self.compile(text, mode, prefix)[1]
+
+    def check_many(self, entries):
+        """Diagnostics for (text, mode, prefix) entries, in order.
+
+        Each distinct text is compiled at most once.
+        """
+        return [self.compile(*entry)[1] for entry in entries]
+
+    def clear(self):
+        self._entries.clear()
+
+
+compile_cache = CompileCache()
@@ -0,0 +1,558 @@
+# core/validator.py - PME JSON validation engine
+# LAYER = "core"
+#
+# Pure Python, no bpy. api/validation.py wraps it for pme.validate_json();
+# it also runs on its own, outside Blender:
+#
+#     python core/validator.py library.json --workers 8
+#
+# This module has no package-relative imports, so it can be imported as a
+# top-level module. The addon package __init__ imports bpy, which a plain
+# interpreter (and every spawned worker) would fail on.
+#
+# Menus are checked in shards of SHARD_SIZE; each shard returns its issues
+# plus a (key, name, references) record per menu. Shards run in a
+# ProcessPoolExecutor when there is more than one and we are not inside
+# Blender. Duplicate, reference (E601) and cycle (E602) checks need every
+# record and run in the calling process.
+
+LAYER = "core"
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Iterator, NamedTuple
+
+PME1 = "PME1"
+PME2 = "PME2"
+
+SCHEMA_VERSIONS = {"2.0"}
+
+# Mirrors core.uid.MODE_PREFIX_MAP (see the import note above)
+MODE_PREFIX_MAP = {
+    'PMENU': 'pm',
+    'RMENU': 'rm',
+    'DIALOG': 'pd',
+    'PANEL': 'pg',
+    'HPANEL': 'hpg',
+    'SCRIPT': 's',
+    'MACRO': 'mc',
+    'MODAL': 'md',
+    'STICKY': 'sk',
+    'PROPERTY': 'pr',
+}
+MENU_MODES = frozenset(MODE_PREFIX_MAP)
+UID_PREFIXES = frozenset(MODE_PREFIX_MAP.values())
+UID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz234567")
+
+# PME2 action types (schema v2, D8/D14)
+ACTION_TYPES = {
+    "command", "custom", "prop", "menu", "hotkey", "empty",
+    "invoke", "finish", "cancel", "update",
+}
+MODAL_ACTION_TYPES = {"invoke", "finish", "cancel", "update"}
+
+# PME1 item modes (core.constants.MODE_ITEMS)
+ITEM_MODES = {
+    "EMPTY", "COMMAND", "PROP", "MENU", "HOTKEY", "CUSTOM",
+    "INVOKE", "FINISH", "CANCEL", "UPDATE",
+}
+MODAL_ITEM_MODES = {"INVOKE", "FINISH", "CANCEL", "UPDATE"}
+
+# core.constants.OPEN_MODE_ITEMS
+ACTIVATION_MODES = {
+    "PRESS", "HOLD", "DOUBLE_CLICK", "TWEAK", "CHORDS", "CLICK", "CLICK_DRAG",
+}
+
+EXTENSION_VENDORS = {"pme"}
+
+# Mirrors core.constants.F_EXPAND (core.constants imports bpy)
+F_EXPAND = "@"
+
+# MENU slots of these menus hold Blender panel IDs, not PME menu names
+PANEL_MENU_MODES = {'PANEL', 'HPANEL'}
+
+# Blender panel/menu/header type IDs, e.g. VIEW3D_PT_tools, VIEW3D_MT_add
+BL_TYPE_SEPARATORS = ("_PT_", "_MT_", "_HT_")
+
+SHARD_SIZE = 256
+
+# Workers import this module by name, so they never run the addon's
+# package __init__ (bpy). fork would also copy the caller's state.
+MP_CONTEXT = "spawn"
+
+
+class Issue(NamedTuple):
+    """A validation issue. Field order matches api ValidationIssue."""
+
+    severity: str
+    code: str
+    path: str
+    message: str
+    suggestion: str | None = None
+
+
+def validate_uid(uid):
+    """Mirrors core.uid.validate_uid."""
+    if not uid or not isinstance(uid, str) or '_' not in uid:
+        return False
+
+    prefix, random_id = uid.split('_', 1)
+    return (
+        prefix in UID_PREFIXES
+        and len(random_id) == 8
+        and all(c in UID_CHARS for c in random_id)
+    )
+
+
+def _error(code, path, message, suggestion=None):
+    return Issue("error", code, path, message, suggestion)
+
+
+def _warning(code, path, message, suggestion=None):
+    return Issue("warning", code, path, message, suggestion)
+
+
+def _menu_ref(text):
+    """PME1 submenu name without the expand flags."""
+    for _ in range(2):
+        if text.startswith(F_EXPAND):
+            text = text[len(F_EXPAND):]
+    return text
+
+
+def _is_menu_ref(mode, target):
+    """False for MENU targets that are not PME menus."""
+    if mode in PANEL_MENU_MODES:
+        return False
+    return not any(sep in target for sep in BL_TYPE_SEPARATORS)
+
+
+def _check_extensions(owner, path, issues):
+    extensions = owner.get("extensions")
+    if not isinstance(extensions, dict):
+        return
+
+    for vendor in extensions:
+        if vendor not in EXTENSION_VENDORS:
+            issues.append(_warning(
+                "W201", f"{path}.extensions.{vendor}",
+                f"Unknown extension vendor: '{vendor}'",
+            ))
+
+
+def _check_pme2_item(item, path, mode, refs, issues):
+    if not isinstance(item, dict):
+        issues.append(_error("E404", path, "Item is not an object"))
+        return
+
+    _check_extensions(item, path, issues)
+
+    if "action" not in item:
+        issues.append(_error("E401", path, "Missing action"))
+        return
+
+    path += ".action"
+    action = item["action"]
+    if not isinstance(action, dict):
+        issues.append(_error("E404", path, "action is not an object"))
+        return
+
+    tp = action.get("type")
+    if tp not in ACTION_TYPES:
+        issues.append(_error(
+            "E402", f"{path}.type", f"Invalid action type: {tp!r}",
+            "Use one of: " + ", ".join(sorted(ACTION_TYPES)),
+        ))
+        return
+
+    if tp in MODAL_ACTION_TYPES and mode != 'MODAL':
+        issues.append(_error(
+            "E402", f"{path}.type",
+            f"Action type '{tp}' is only valid in MODAL menus",
+        ))
+
+    if tp == "empty":
+        return
+
+    value = action.get("value")
+    if not isinstance(value, str) or not value:
+        issues.append(_error(
+            "E403", f"{path}.value", f"Missing value for '{tp}' action",
+        ))
+        return
+
+    if tp == "menu" and _is_menu_ref(mode, value):
+        refs.append((f"{path}.value", value))
+
+
+def _check_pme2_menu(menu, path, refs, issues):
+    """Returns (key, name) or None. The uid is the reference key."""
+    if not isinstance(menu, dict):
+        issues.append(_error("E304", path, "Menu is not an object"))
+        return None
+
+    uid = menu.get("uid")
+    if not uid:
+        issues.append(_error("E301", f"{path}.uid", "Missing uid"))
+    elif not validate_uid(uid):
+        issues.append(_error(
+            "E302", f"{path}.uid", f"Invalid uid: {uid!r}",
+            "Use '{mode_prefix}_{8 base32 chars}', e.g. 'pm_9f7c2k3h'",
+        ))
+
+    name = menu.get("name")
+    if not isinstance(name, str) or not name:
+        issues.append(_error("E304", f"{path}.name", "Missing name"))
+        name = None
+
+    mode = menu.get("mode")
+    if mode not in MENU_MODES:
+        issues.append(_error(
+            "E305", f"{path}.mode", f"Invalid menu mode: {mode!r}",
+            "Use one of: " + ", ".join(sorted(MENU_MODES)),
+        ))
+
+    hotkey = menu.get("hotkey")
+    if isinstance(hotkey, dict):
+        activation = hotkey.get("activation", "PRESS")
+        if activation not in ACTIVATION_MODES:
+            issues.append(_error(
+                "E502", f"{path}.hotkey.activation",
+                f"Invalid activation mode: {activation!r}",
+            ))
+
+    _check_extensions(menu, path, issues)
+
+    if "items" not in menu:
+        issues.append(_error("E306", f"{path}.items", "Missing items"))
+    elif not isinstance(menu["items"], list):
+        issues.append(_error("E307", f"{path}.items", "items is not an array"))
+    elif not menu["items"]:
+        issues.append(_warning("W103", f"{path}.items", "Menu has no items"))
+    else:
+        for i, item in enumerate(menu["items"]):
+            _check_pme2_item(item, f"{path}.items[{i}]", mode, refs, issues)
+
+    return uid if isinstance(uid, str) else None, name
+
+
+def _check_pme1_item(item, path, mode, refs, issues):
+    if not isinstance(item, list) or len(item) in (0, 2):
+        issues.append(_error("E404", path, "Item is not a [name, mode, icon, text] list"))
+        return
+
+    if len(item) < 4:
+        return
+
+    item_mode, text = item[1], item[3]
+    if item_mode not in ITEM_MODES:
+        issues.append(_error(
+            "E402", f"{path}[1]", f"Invalid item mode: {item_mode!r}",
+        ))
+        return
+
+    if item_mode in MODAL_ITEM_MODES and mode != 'MODAL':
+        issues.append(_error(
+            "E402", f"{path}[1]",
+            f"Item mode '{item_mode}' is only valid in MODAL menus",
+        ))
+
+    if item_mode == 'EMPTY':
+        return
+
+    if not isinstance(text, str) or not text:
+        issues.append(_error(
+            "E403", f"{path}[3]", f"Missing value for '{item_mode}' item",
+        ))
+        return
+
+    if item_mode == 'MENU':
+        target = _menu_ref(text)
+        if _is_menu_ref(mode, target):
+            refs.append((f"{path}[3]", target))
+
+
+def _check_pme1_menu(menu, path, refs, issues):
+    """Returns (key, name) or None. The name is the reference key."""
+    if not isinstance(menu, list) or not menu:
+        issues.append(_error("E304", path, "Menu is not a list"))
+        return None
+
+    name = menu[0]
+    if not isinstance(name, str) or not name:
+        issues.append(_error("E304", f"{path}[0]", "Missing name"))
+        name = None
+
+    mode = menu[4] if len(menu) > 4 else 'PMENU'
+    if mode not in MENU_MODES:
+        issues.append(_error(
+            "E305", f"{path}[4]", f"Invalid menu mode: {mode!r}",
+        ))
+
+    if len(menu) > 6 and menu[6] not in ACTIVATION_MODES:
+        issues.append(_error(
+            "E502", f"{path}[6]", f"Invalid activation mode: {menu[6]!r}",
+        ))
+
+    if len(menu) < 4:
+        issues.append(_error("E306", f"{path}[3]", "Missing items"))
+    elif not isinstance(menu[3], list):
+        issues.append(_error("E307", f"{path}[3]", "items is not an array"))
+    elif not menu[3]:
+        if mode != 'PROPERTY':
+            issues.append(_warning("W103", f"{path}[3]", "Menu has no items"))
+    else:
+        for i, item in enumerate(menu[3]):
+            _check_pme1_item(item, f"{path}[3][{i}]", mode, refs, issues)
+
+    return name, name
+
+
+def _check_shard(shard):
+    """Check a slice of menus. Runs in worker processes."""
+    fmt, start, menus = shard
+    check_menu = _check_pme2_menu if fmt == PME2 else _check_pme1_menu
+    issues = []
+    records = []
+    for idx, menu in enumerate(menus, start):
+        refs = []
+        ret = check_menu(menu, f"menus[{idx}]", refs, issues)
+        if ret:
+            records.append((idx, *ret, refs))
+
+    return issues, records
+
+
+def _in_blender():
+    try:
+        import bpy
+    except ImportError:
+        return False
+    return getattr(bpy, "app", None) is not None
+
+
+def _run_shards(shards, workers):
+    """Yield shard results in order, in worker processes when worthwhile."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    workers = min(workers, len(shards))
+    if workers <= 1 or _in_blender():
+        for shard in shards:
+            yield _check_shard(shard)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context(MP_CONTEXT)
+    )
+    try:
+        yield from executor.map(_check_shard, shards)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _find_cycles(graph):
+    """Yield (path, cycle) for every reference cycle, once per cycle.
+
+    graph: {key: [(path, target key)]}. Iterative DFS, so deep menu
+    chains do not hit the recursion limit.
+    """
+    WHITE, GRAY, BLACK = 0, 1, 2
+    state = dict.fromkeys(graph, WHITE)
+    seen = set()
+
+    for root in graph:
+        if state[root] != WHITE:
+            continue
+
+        state[root] = GRAY
+        stack = [root]
+        edges = [iter(graph[root])]
+        while edges:
+            for path, target in edges[-1]:
+                target_state = state.get(target)
+                if target_state == WHITE:
+                    state[target] = GRAY
+                    stack.append(target)
+                    edges.append(iter(graph[target]))
+                    break
+
+                if target_state == GRAY:
+                    cycle = stack[stack.index(target):]
+                    i = cycle.index(min(cycle))
+                    canonical = tuple(cycle[i:] + cycle[:i])
+                    if canonical not in seen:
+                        seen.add(canonical)
+                        yield path, cycle + [target]
+            else:
+                state[stack.pop()] = BLACK
+                edges.pop()
+
+
+def _detect(data):
+    """Returns (format, menus or None, root issues)."""
+    if isinstance(data, list):
+        return PME1, data, [_warning(
+            "W301", "", "PME1 legacy format detected (will be converted on import)",
+        )]
+
+    if not isinstance(data, dict):
+        return None, None, [_error("E204", "", "Data is not a JSON object or array")]
+
+    issues = []
+    if "$schema" in data:
+        fmt = PME2
+        version = data.get("schema_version")
+        if version is None:
+            issues.append(_error("E202", "schema_version", "Missing schema_version"))
+        elif version not in SCHEMA_VERSIONS:
+            issues.append(_error(
+                "E203", "schema_version", f"Unknown schema version: {version!r}",
+            ))
+        _check_extensions(data, "", issues)
+    else:
+        fmt = PME1
+        if "menus" in data:
+            issues.append(_warning(
+                "W301", "", "PME1 format detected (will be converted on import)",
+            ))
+        if "version" not in data:
+            issues.append(_error("E202", "version", "Missing version"))
+
+    if "menus" not in data:
+        issues.append(_error("E204", "menus", "Missing menus array"))
+        return fmt, None, issues
+
+    menus = data["menus"]
+    if not isinstance(menus, list):
+        issues.append(_error("E205", "menus", "menus is not an array"))
+        return fmt, None, issues
+
+    return fmt, menus, issues
+
+
+def iter_issues(
+    data: Any,
+    *,
+    check_references: bool = True,
+    workers: int | None = None,
+) -> Iterator[Issue]:
+    """Yield validation issues of parsed PME JSON data as they are found.
+
+    Args:
+        data: Already-parsed JSON (PME2 dict, PME1 dict or PME1 list).
+        check_references: Verify menu references and report cycles.
+        workers: Processes for libraries larger than SHARD_SIZE menus.
+            None uses os.cpu_count(). Always 1 inside Blender.
+
+    Example:
+        >>> for issue in iter_issues(data, workers=4):
+        ...     print(issue.code, issue.path)
+    """
+    if not data:
+        yield _error("E102", "", "Empty data")
+        return
+
+    fmt, menus, issues = _detect(data)
+    yield from issues
+    if menus is None:
+        return
+
+    dup_code = "E303" if fmt == PME2 else "W102"
+    keys = {}
+    names = {}
+    graph = {}
+    shards = [
+        (fmt, start, menus[start:start + SHARD_SIZE])
+        for start in range(0, len(menus), SHARD_SIZE)
+    ]
+    for shard_issues, records in _run_shards(shards, workers):
+        yield from shard_issues
+
+        for idx, key, name, refs in records:
+            path = f"menus[{idx}]"
+            if key is not None:
+                if key in keys:
+                    yield (_error if fmt == PME2 else _warning)(
+                        dup_code, path,
+                        f"Duplicate {'uid' if fmt == PME2 else 'menu name'} "
+                        f"{key!r} (first at menus[{keys[key]}])",
+                    )
+                else:
+                    keys[key] = idx
+                    graph[key] = refs
+
+            if fmt == PME2 and name is not None:
+                if name in names:
+                    yield _warning(
+                        "W102", f"{path}.name",
+                        f"Duplicate menu name {name!r} (first at menus[{names[name]}])",
+                    )
+                else:
+                    names[name] = idx
+
+    if not check_references:
+        return
+
+    for refs in graph.values():
+        for path, target in refs:
+            if target not in graph:
+                yield _error(
+                    "E601", path, f"Menu reference not found: {target!r}",
+                )
+
+    for path, cycle in _find_cycles(graph):
+        yield _error(
+            "E602", path,
+            "Circular menu reference: " + " -> ".join(map(str, cycle)),
+        )
+
+
+def main(argv=None):
+    """Validate PME JSON files. Returns 1 if any file has errors."""
+    parser = argparse.ArgumentParser(
+        prog="validator", description="Validate PME JSON menu libraries."
+    )
+    parser.add_argument("files", nargs="+", help="PME JSON files")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-references", action="store_true",
+        help="skip menu reference and cycle checks",
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="treat warnings as errors",
+    )
+    args = parser.parse_args(argv)
+
+    ret = 0
+    for filepath in args.files:
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{filepath}: error E101: {e}")
+            ret = 1
+            continue
+
+        for issue in iter_issues(
+            data,
+            check_references=not args.no_references,
+            workers=args.workers,
+        ):
+            print(f"{filepath}: {issue.severity} {issue.code} "
+                  f"{issue.path}: {issue.message}")
+            if issue.severity == "error" or args.strict:
+                ret = 1
+
+    return ret
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+# pyright: reportInvalidTypeForm=false
+# editors/_hpanel_group_ops.py - Hidden Panel Group editor edit-only operators
+# LAYER = "editors"
+#
+# Split from editors/hpanel_group.py. Private (_) modules are skipped by the addon
+# loader, so this module is imported and its classes registered by
+# addon.load_editor('HPANEL') the first time a menu of that mode is edited.
+
+LAYER = "editors"
+
+from bpy.props import IntProperty
+from bpy.types import Operator
+from ..addon import get_prefs
+from ..ui.layout import lh
+from ..ui import panels as PAU
+from ..ui import tag_redraw
+
+
+class PME_OT_hpanel_menu(Operator):
+    bl_idname = "pme.panel_hide_menu"
+    bl_label = "Hide Panels"
+    bl_description = "Hide panels"
+
+    def _draw(self, menu, context):
+        pr = get_prefs()
+        lh.lt(menu.layout, 'INVOKE_DEFAULT')
+        lh.operator("pme.panel_hide", None, 'ADD', group=pr.selected_pm.name)
+        lh.operator("pme.panel_hide_by", None, 'ADD')
+        lh.sep()
+
+        lh.prop(pr, "interactive_panels")
+
+    def execute(self, context):
+        context.window_manager.popup_menu(self._draw, title=self.bl_description)
+        return {'FINISHED'}
+
+
+class PME_OT_hpanel_remove(Operator):
+    bl_idname = "pme.hpanel_remove"
+    bl_label = "Unhide Panel"
+    bl_description = "Unhide panel"
+    bl_options = {'INTERNAL'}
+
+    idx: IntProperty()
+
+    def execute(self, context):
+        pm = get_prefs().selected_pm
+
+        if self.idx == -1:
+            PAU.unhide_panels([pmi.text for pmi in pm.pmis])
+
+            pm.pmis.clear()
+
+        else:
+            pmi = pm.pmis[self.idx]
+            PAU.unhide_panel(pmi.text)
+            pm.pmis.remove(self.idx)
+
+        tag_redraw()
+        return {'FINISHED'}
@@ -0,0 +1,57 @@
+# pyright: reportInvalidTypeForm=false
+# editors/_panel_group_ops.py - Panel Group editor edit-only operators
+# LAYER = "editors"
+#
+# Split from editors/panel_group.py. Private (_) modules are skipped by the addon
+# loader, so this module is imported and its classes registered by
+# addon.load_editor('PANEL') the first time a menu of that mode is edited.
+
+LAYER = "editors"
+
+from bpy.props import IntProperty
+from bpy.types import Operator
+from ..core.constants import PANEL_FOLDER, PANEL_FILE
+from ..infra.collections import MoveItemOperator
+from ..addon import get_prefs
+from ..ui import tag_redraw
+from ..ui import panels as PAU
+
+
+class PME_OT_panel_item_move(MoveItemOperator, Operator):
+    bl_idname = "pme.panel_item_move"
+
+    def get_icon(self, item, idx):
+        return 'FILE' if item.icon == PANEL_FILE else 'FILE_FOLDER'
+
+    def get_collection(self):
+        return get_prefs().selected_pm.pmis
+
+    def finish(self):
+        pr = get_prefs()
+        pm = pr.selected_pm
+        if self.new_idx == 0:
+            pm.pmis[0].icon = PANEL_FOLDER
+
+        pm.update_panel_group()
+        tag_redraw()
+
+
+class PME_OT_panel_item_remove(Operator):
+    bl_idname = "pme.panel_item_remove"
+    bl_label = "Remove Panel"
+    bl_description = "Remove the panel"
+    bl_options = {'INTERNAL'}
+
+    idx: IntProperty(options={'SKIP_SAVE'})
+
+    def execute(self, context):
+        pr = get_prefs()
+        pm = pr.selected_pm
+
+        PAU.remove_panel(pm.name, self.idx)
+
+        pm.pmis.remove(self.idx)
+
+        pr.update_tree()
+        tag_redraw()
+        return {'CANCELLED'}
@@ -11,6 +11,7 @@ from bpy import types as bpy_types
 from bpy.types import Header, Menu, Panel
 from ..addon import get_prefs, temp_prefs, ic_cb, ic_eye, ic_fb, ic
 from ..core.constants import (
+    DEFAULT_POLL,
     ED_DATA,
     EMODE_ITEMS,
     F_EXPAND,
@@ -25,7 +26,7 @@ from ..core.constants import (
 )
 from ..infra.debug import *
 from ..bl_utils import re_operator, re_prop, bp, uname
-from ..ui import shorten_str, gen_prop_name, gen_op_name, utitle
+from ..ui import shorten_str, gen_prop_name, gen_op_name, utitle, tag_redraw
 from ..keymap_helper import MOUSE_BUTTONS, parse_hotkey, remove_mouse_button, to_ui_hotkey
 from ..infra.utils import extract_str_flags, extract_str_flags_b
 from ..ui import screen as SU
@@ -42,6 +43,18 @@ from ..operators import (
     PME_OT_extend_target_search,
 )
 from ..infra.extend import extend_manager
+from ..infra.hotkey_index import hotkey_index
+from ..infra.tag_index import tag_index
+from ..infra.menu_search import menu_search
+from ..infra import invalidation as INV
+from ..infra.invalidation import invalidation
+from ..infra import syntax_check
+from ..core.syntax import (
+    DESCRIPTION_PREFIX,
+    GETTER_PREFIX,
+    POLL_PREFIX,
+    compile_cache,
+)
 
 # Re-export operators from operators/ed/ for backward compatibility
 from ..operators.ed import (
@@ -121,6 +134,77 @@ def unextend_panel(pm):
     extend_manager.unregister(pm_uid)
 
 
+def _recheck_pmi_data():
+    pr = get_prefs()
+    if pr.mode != 'PMI':
+        return
+
+    pr.pmi_data.check_pmi_errors(bpy.context)
+    tag_redraw()
+
+
+def _check_syntax(data, slot, text, mode, warning, prefix=""):
+    """Report a cached syntax check result. Returns True while pending."""
+    result = syntax_check.check(
+        text, mode, prefix, slot=slot, on_ready=_recheck_pmi_data
+    )
+    if result is syntax_check.PENDING:
+        return True
+
+    if result:
+        data.info(warning)
+        data.diagnostics[warning] = result
+    return False
+
+
+def slot_syntax_entries(pm):
+    """Yield (slot, (text, mode, prefix)) for every code string of pm.
+
+    slot is "poll", "description" or (pmi index, field).
+    """
+    if pm.poll_cmd and pm.poll_cmd != DEFAULT_POLL:
+        yield "poll", (pm.poll_cmd, 'exec', POLL_PREFIX)
+
+    if pm.description and pm.description_is_expr:
+        yield "description", (pm.description, 'exec', DESCRIPTION_PREFIX)
+
+    for idx, pmi in enumerate(pm.pmis):
+        pmi_mode = 'COMMAND' if pmi.mode in MODAL_CMD_MODES else pmi.mode
+        if pmi.text:
+            if pmi_mode == 'COMMAND' or pmi_mode == 'CUSTOM':
+                prefix = ""
+                if pm.mode == 'PROPERTY' and pmi.name == 'GET':
+                    prefix = GETTER_PREFIX
+                yield (idx, "text"), (pmi.text, 'exec', prefix)
+            elif pmi_mode == 'PROP':
+                yield (idx, "text"), (pmi.text, 'eval', "")
+
+        if pmi.description and pmi.description_is_expr:
+            yield (idx, "description"), (
+                pmi.description, 'exec', DESCRIPTION_PREFIX
+            )
+
+
+def check_menus_syntax(pms):
+    """Check every code string of pms in one pass.
+
+    Returns {(pm.name, slot): Diagnostic} for strings that do not compile.
+    Results stay in compile_cache, so the editor and execution reuse them.
+    """
+    keys = []
+    entries = []
+    for pm in pms:
+        for slot, entry in slot_syntax_entries(pm):
+            keys.append((pm.name, slot))
+            entries.append(entry)
+
+    return {
+        key: result
+        for key, result in zip(keys, compile_cache.check_many(entries), strict=True)
+        if result
+    }
+
+
 
 class EditorBase:
     def __init__(self):
@@ -209,6 +293,7 @@ class EditorBase:
 
     def on_pm_select(self, pm):
         self.register_props(pm)
+        check_menus_syntax((pm,))
 
     def on_pm_add(self, pm):
         pass
@@ -293,12 +378,14 @@ class EditorBase:
                     link.path[i] = name
 
         pm.name = name
+        hotkey_index.update_pm(pm, old_name)
+        tag_index.update_pm(pm, old_name)
+        menu_search.update_pm(pm, old_name)
 
         if pm.name not in pm.kmis_map:
             pm.register_hotkey()
 
-        Tag.filter()
-        pr.update_tree()
+        invalidation.invalidate(INV.TAGS, INV.TREE)
 
     def on_pmi_check(self, pm, pmi_data):
         pr = get_prefs()
@@ -307,50 +394,44 @@ class EditorBase:
         data.info()
         pmi_mode = 'COMMAND' if data.mode in MODAL_CMD_MODES else data.mode
 
+        pending = False
         if pmi_mode == 'COMMAND':
             if data.cmd:
-                try:
-                    compile(data.cmd, '<string>', 'exec')
-                except:
-                    data.info(W_PMI_SYNTAX)
+                pending |= _check_syntax(data, "cmd", data.cmd, 'exec', W_PMI_SYNTAX)
 
             # Phase 9-X (#102): Check description expression syntax
             if data.description and data.description_is_expr:
-                try:
-                    compile(
-                        "def _get_desc():" + data.description,
-                        '<description>',
-                        'exec'
-                    )
-                except:
-                    data.info(W_PMI_DESC_SYNTAX)
-
-            data.sname = ""
-            if not data.has_errors():
-                mo = re_operator.search(data.cmd)
-                if mo:
-                    data.sname = gen_op_name(mo, True)
-                else:
-                    mo = re_prop.search(data.cmd)
+                pending |= _check_syntax(
+                    data, "description", data.description, 'exec',
+                    W_PMI_DESC_SYNTAX, prefix=DESCRIPTION_PREFIX
+                )
+
+            # Keep the suggested name until the result lands
+            if not pending:
+                data.sname = ""
+                if not data.has_errors():
+                    mo = re_operator.search(data.cmd)
                     if mo:
-                        data.sname, icon = gen_prop_name(mo, False, True)
+                        data.sname = gen_op_name(mo, True)
                     else:
-                        data.sname = shorten_str(data.cmd, 20)
+                        mo = re_prop.search(data.cmd)
+                        if mo:
+                            data.sname, icon = gen_prop_name(mo, False, True)
+                        else:
+                            data.sname = shorten_str(data.cmd, 20)
 
         elif pmi_mode == 'PROP':
             if data.prop:
-                try:
-                    compile(data.prop, '<string>', 'eval')
-                except:
-                    data.info(W_PMI_SYNTAX)
-
-            data.sname = ""
-            if not data.has_errors():
-                prop = bp.get(data.prop)
-                if prop:
-                    data.sname = prop.name or utitle(prop.identifier)
-                else:
-                    data.sname = utitle(data.prop.rpartition(".")[2])
+                pending |= _check_syntax(data, "prop", data.prop, 'eval', W_PMI_SYNTAX)
+
+            if not pending:
+                data.sname = ""
+                if not data.has_errors():
+                    prop = bp.get(data.prop)
+                    if prop:
+                        data.sname = prop.name or utitle(prop.identifier)
+                    else:
+                        data.sname = utitle(data.prop.rpartition(".")[2])
 
         elif pmi_mode == 'MENU':
             data.sname = data.menu
@@ -364,14 +445,14 @@ class EditorBase:
                 data.info(W_PMI_HOTKEY)
 
         elif pmi_mode == 'CUSTOM':
-            data.sname = ""
-
             if data.custom:
-                try:
-                    compile(data.custom, '<string>', 'exec')
-                    data.sname = shorten_str(data.custom, 20)
-                except:
-                    data.info(W_PMI_SYNTAX)
+                pending = _check_syntax(data, "custom", data.custom, 'exec', W_PMI_SYNTAX)
+                if not pending:
+                    data.sname = ""
+                    if not data.has_errors():
+                        data.sname = shorten_str(data.custom, 20)
+            else:
+                data.sname = ""
 
     def on_pmi_add(self, pm, pmi):
         pmi.mode = 'COMMAND'
@@ -446,11 +527,9 @@ class EditorBase:
         sub = row.row(align=True)
         # Check expression syntax if is_expr is enabled
         if pm.description and pm.description_is_expr:
-            try:
-                compile("def _get_desc():" + pm.description, '<description>', 'exec')
-                sub.alert = False
-            except:
-                sub.alert = True
+            sub.alert = bool(
+                compile_cache.check(pm.description, 'exec', DESCRIPTION_PREFIX)
+            )
         desc_placeholder = "return 'Description'" if pm.description_is_expr else "Description"
         sub.prop(pm, "description", text="", icon=ic('CURRENT_FILE'), placeholder=desc_placeholder)
         row.prop(pm, "description_is_expr", text="", icon=ic('SCRIPTPLUGINS'))
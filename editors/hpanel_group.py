@@ -16,50 +16,6 @@ from ..ui import panels as PAU
 from ..ui import tag_redraw
 
 
-class PME_OT_hpanel_menu(Operator):
-    bl_idname = "pme.panel_hide_menu"
-    bl_label = "Hide Panels"
-    bl_description = "Hide panels"
-
-    def _draw(self, menu, context):
-        pr = get_prefs()
-        lh.lt(menu.layout, 'INVOKE_DEFAULT')
-        lh.operator("pme.panel_hide", None, 'ADD', group=pr.selected_pm.name)
-        lh.operator("pme.panel_hide_by", None, 'ADD')
-        lh.sep()
-
-        lh.prop(pr, "interactive_panels")
-
-    def execute(self, context):
-        context.window_manager.popup_menu(self._draw, title=self.bl_description)
-        return {'FINISHED'}
-
-
-class PME_OT_hpanel_remove(Operator):
-    bl_idname = "pme.hpanel_remove"
-    bl_label = "Unhide Panel"
-    bl_description = "Unhide panel"
-    bl_options = {'INTERNAL'}
-
-    idx: IntProperty()
-
-    def execute(self, context):
-        pm = get_prefs().selected_pm
-
-        if self.idx == -1:
-            PAU.unhide_panels([pmi.text for pmi in pm.pmis])
-
-            pm.pmis.clear()
-
-        else:
-            pmi = pm.pmis[self.idx]
-            PAU.unhide_panel(pmi.text)
-            pm.pmis.remove(self.idx)
-
-        tag_redraw()
-        return {'FINISHED'}
-
-
 class Editor(EditorBase):
 
     def __init__(self):
@@ -104,6 +60,7 @@ class Editor(EditorBase):
         pass
 
     def draw_items(self, layout, pm):
+        from ._hpanel_group_ops import PME_OT_hpanel_menu, PME_OT_hpanel_remove
         tpr = temp_prefs()
 
         row = layout.row()
@@ -125,5 +82,11 @@ class Editor(EditorBase):
         lh.layout.prop(get_prefs(), "panel_info_visibility", text="", expand=True)
 
 
+# Edit-only classes live in _hpanel_group_ops.py, imported and registered by
+# addon.load_editor() on first use
+EDITOR_MODE = 'HPANEL'
+EDIT_MODULE = "_hpanel_group_ops"
+
+
 def register():
     Editor()
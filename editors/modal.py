@@ -9,6 +9,7 @@ import bpy
 from .. import pme
 from ..core.constants import MODAL_CMD_MODES, W_PMI_HOTKEY, I_MODAL_PROP_MOVE, W_PMI_EXPR
 from ..core.schema import schema
+from ..core.syntax import compile_cache
 from ..bl_utils import uname
 from .base import EditorBase
 from ..addon import temp_prefs
@@ -74,9 +75,7 @@ class Editor(EditorBase):
         tpr = temp_prefs()
         if pmi_data.mode in {'COMMAND', 'PROP'}:
             if tpr.modal_item_custom:
-                try:
-                    compile(tpr.modal_item_custom, "<string>", "eval")
-                except:
+                if compile_cache.check(tpr.modal_item_custom, 'eval'):
                     pmi_data.info(W_PMI_EXPR)
 
         if (
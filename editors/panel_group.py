@@ -810,46 +810,6 @@ class PME_OT_panel_add(Operator):
         return {'FINISHED'}
 
 
-class PME_OT_panel_item_move(MoveItemOperator, Operator):
-    bl_idname = "pme.panel_item_move"
-
-    def get_icon(self, item, idx):
-        return 'FILE' if item.icon == PANEL_FILE else 'FILE_FOLDER'
-
-    def get_collection(self):
-        return get_prefs().selected_pm.pmis
-
-    def finish(self):
-        pr = get_prefs()
-        pm = pr.selected_pm
-        if self.new_idx == 0:
-            pm.pmis[0].icon = PANEL_FOLDER
-
-        pm.update_panel_group()
-        tag_redraw()
-
-
-class PME_OT_panel_item_remove(Operator):
-    bl_idname = "pme.panel_item_remove"
-    bl_label = "Remove Panel"
-    bl_description = "Remove the panel"
-    bl_options = {'INTERNAL'}
-
-    idx: IntProperty(options={'SKIP_SAVE'})
-
-    def execute(self, context):
-        pr = get_prefs()
-        pm = pr.selected_pm
-
-        PAU.remove_panel(pm.name, self.idx)
-
-        pm.pmis.remove(self.idx)
-
-        pr.update_tree()
-        tag_redraw()
-        return {'CANCELLED'}
-
-
 class Editor(EditorBase):
 
     def __init__(self):
@@ -948,6 +908,7 @@ class Editor(EditorBase):
         lh.operator(PME_OT_panel_add.bl_idname, "Add Panel")
 
     def draw_pmi_menu(self, context, idx):
+        from ._panel_group_ops import PME_OT_panel_item_move, PME_OT_panel_item_remove
         pr = get_prefs()
         pm = pr.selected_pm
         pmi = pm.pmis[idx]
@@ -981,9 +942,14 @@ class Editor(EditorBase):
         lh.operator(PME_OT_panel_item_remove.bl_idname, "Remove", 'X', idx=idx)
 
     def update_panel_group(self, pm):
-        PAU.remove_panel_group(pm.name)
         PAU.add_panel_group(pm, draw_pme_panel, poll_pme_panel)
 
 
+# Edit-only classes live in _panel_group_ops.py, imported and registered by
+# addon.load_editor() on first use
+EDITOR_MODE = 'PANEL'
+EDIT_MODULE = "_panel_group_ops"
+
+
 def register():
     Editor()
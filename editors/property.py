@@ -25,8 +25,10 @@ from ..ui.layout import lh
 from ..ui import tag_redraw, shorten_str
 from ..bl_utils import uname
 from ..infra.collections import MoveItemOperator
+from ..infra import property as property_utils
 from .. import operator_utils
 from ..core.constants import MAX_STR_LEN
+from ..core.syntax import GETTER_PREFIX, compile_cache
 
 # =============================================================================
 # Schema Definitions (PROPERTY)
@@ -199,14 +201,8 @@ def ed_text_get(self):
 
 
 def ed_text_set(self, value):
-    try:
-        if self.name == 'GET':
-            compile("def _():" + value, "<string>", "exec")
-        else:
-            compile(value, "<string>", "exec")
-        self.icon = ""
-    except:
-        self.icon = 'ERROR'
+    prefix = GETTER_PREFIX if self.name == 'GET' else ""
+    self.icon = 'ERROR' if compile_cache.check(value, 'exec', prefix) else ""
 
     self["text"] = value
     update_user_property()
@@ -296,6 +292,9 @@ def gen_update(prop_name, mode):
         return PROP_UPDATES[key]
 
     def _update(self, context):
+        if property_utils.defer_update(prop_name, self, _update):
+            return
+
         pm = get_prefs().pie_menus[prop_name]
         pmi = pm.pmis[mode]
         pme.context.pm = pm
@@ -608,152 +607,6 @@ def update_user_property(self=None, context=None):
     register_user_property(pm)
 
 
-class PME_OT_prop_class_set(Operator):
-    bl_idname = "pme.prop_class_set"
-    bl_label = "Internal (PME)"
-    bl_description = "Where to store the data of the property"
-    bl_property = "item"
-    bl_options = {'INTERNAL'}
-
-    enum_items = None
-
-    def get_items(self, context):
-        if not PME_OT_prop_class_set.enum_items:
-            enum_items = []
-
-            ID = bpy_types.ID
-            for tp_name in dir(bpy_types):
-                tp = getattr(bpy_types, tp_name)
-                if isinstance(tp, type) and \
-                        issubclass(tp, ID) and tp is not ID:
-                    enum_items.append((
-                        tp_name, tp_name, ""))
-
-            PME_OT_prop_class_set.enum_items = enum_items
-
-        return PME_OT_prop_class_set.enum_items
-
-    item: EnumProperty(items=get_items, options={'SKIP_SAVE'})
-    add: BoolProperty(options={'SKIP_SAVE'})
-
-    def execute(self, context):
-        PME_OT_prop_class_set.enum_items = None
-        pm = get_prefs().selected_pm
-        pmi = pm.pmis.get('CLASS', None)
-        if pmi and pmi.text == self.item:
-            return {'CANCELLED'}
-
-        unregister_user_property(pm)
-
-        if pmi:
-            pmi.text = self.item
-        else:
-            pmi = pm.pmis.add()
-            pmi.mode = 'COMMAND'
-            pmi.name = 'CLASS'
-            pmi.text = self.item
-
-        register_user_property(pm)
-        pm.ed.update_preview_path(pm)
-        tag_redraw()
-        return {'FINISHED'}
-
-    def invoke(self, context, event):
-        PME_OT_prop_class_set.enum_items = None
-        if self.add:
-            context.window_manager.invoke_search_popup(self)
-        else:
-            pm = get_prefs().selected_pm
-            unregister_user_property(pm)
-            pmi_remove(pm, 'CLASS')
-
-            # rename_pm(pm)
-            register_user_property(pm)
-            pm.ed.update_preview_path(pm)
-        return {'FINISHED'}
-
-
-class PME_OT_prop_script_set(Operator):
-    bl_idname = "pme.prop_script_set"
-    bl_label = "Internal (PME)"
-    bl_description = "Add/remove the function"
-    bl_options = {'INTERNAL'}
-
-    add: BoolProperty(options={'SKIP_SAVE'})
-    mode: EnumProperty(
-        items=(
-            ('GET', "", ""),
-            ('SET', "", ""),
-            ('UPDATE', "", ""),
-            ('INIT', "", ""),
-            ('CLASS', "", ""),
-        ),
-        options={'SKIP_SAVE'},
-    )
-
-    def execute(self, context):
-        pr = get_prefs()
-        pm = pr.selected_pm
-        if self.add:
-            pmi = pm.pmis.add()
-            pmi.mode = 'COMMAND'
-            pmi.name = self.mode
-            if self.mode == 'GET':
-                prop_type = get_prop_type(pm)
-                default_value = 0
-                if prop_type == 'STRING':
-                    default_value = ""
-                elif prop_type == 'BOOL':
-                    default_value = False
-
-                size = pm.get_data("pr_vector")
-                if size > 1:
-                    default_value = [default_value] * size
-
-                pmi.text = "return self.get(menu, %s)" % repr(default_value)
-            elif self.mode == 'SET':
-                pmi.text = "self[menu] = value"
-            elif self.mode == 'UPDATE':
-                pmi.text = "print('On Update', menu, '=', repr(props(menu)))"
-            elif self.mode == 'INIT':
-                pmi.text = "print('On Init', menu, '=', repr(props(menu)))"
-
-        else:
-            for i, pmi in enumerate(pm.pmis):
-                if pmi.name == self.mode:
-                    pm.pmis.remove(i)
-                    break
-
-        register_user_property(pm)
-        tag_redraw()
-        return {'FINISHED'}
-
-
-class PME_OT_prop_pmi_move(MoveItemOperator, Operator):
-    bl_idname = "pme.prop_pmi_move"
-
-    def filter_item(self, pmi, idx):
-        return pmi.mode == 'PROP'
-
-    def get_collection(self):
-        return get_prefs().selected_pm.pmis
-
-    def get_icon(self, pmi, idx):
-        pm = get_prefs().selected_pm
-        return pm.ed.get_pmi_icon(pm, pmi, idx)
-
-    def get_title(self):
-        pm = get_prefs().selected_pm
-        pmi = pm.pmis[self.old_idx]
-        return "Move " + shorten_str(pmi.name) if pmi.name.strip() else "Move Slot"
-
-    def finish(self):
-        pm = get_prefs().selected_pm
-        pm.ed.on_pmi_move(pm)
-
-        tag_redraw()
-
-
 class Editor(EditorBase):
 
     def __init__(self):
@@ -767,7 +620,7 @@ class Editor(EditorBase):
         self.editable_slots = False
         self.default_pmi_data = "pr?"
         self.supported_slot_modes = {'EMPTY', 'COMMAND'}
-        self.pmi_move_operator = PME_OT_prop_pmi_move.bl_idname
+        self.pmi_move_operator = "pme.prop_pmi_move"
 
         self.cmd_pmis = {}
 
@@ -1097,6 +950,7 @@ class Editor(EditorBase):
         pass
 
     def draw_cmd_pmi(self, pm, mode, label, icon):
+        from ._property_ops import PME_OT_prop_script_set
         if mode not in pm.pmis:
             lh.operator(
                 PME_OT_prop_script_set.bl_idname, label, icon, mode=mode, add=True
@@ -1111,6 +965,7 @@ class Editor(EditorBase):
             lh.restore()
 
     def draw_extra_settings(self, layout, pm):
+        from ._property_ops import PME_OT_prop_class_set
         ep = temp_prefs().ed_props
         lh.save()
         lh.column(layout)
@@ -1278,6 +1133,12 @@ class Editor(EditorBase):
             lh.prop_compact(obj, pm.name, toggle=True, expand=exp)
 
 
+# Edit-only classes live in _property_ops.py, imported and registered by
+# addon.load_editor() on first use
+EDITOR_MODE = 'PROPERTY'
+EDIT_MODULE = "_property_ops"
+
+
 def register():
     Editor()
     pme.context.add_global("props", props)
@@ -11,9 +11,18 @@ from .. import addon
 from ..addon import get_prefs
 from .debug import *
 from ..core import constants as CC
+from ..core.migrations import (
+    MigrationRegistry,
+    migrate_modal_data,
+    migrate_property_data,
+    VALID_PROP_TYPES,
+)
 from .utils import extract_str_flags_b
 
 
+FIXES = MigrationRegistry()
+
+
 def fix(pms=None, version=None):
     DBG_INIT and logh("PME Fixes")
     pr = get_prefs()
@@ -21,51 +30,21 @@ def fix(pms=None, version=None):
     if pr_version == addon.VERSION:
         return
 
-    fixes = []
-    re_fix = re.compile(r"fix_(\d+)_(\d+)_(\d+)")
-    for k, v in globals().items():
-        mo = re_fix.search(k)
-        if not mo:
-            continue
-
-        fix_version = (int(mo.group(1)), int(mo.group(2)), int(mo.group(3)))
-        if fix_version <= pr_version or fix_version > addon.VERSION:
-            continue
-        fixes.append((fix_version, v))
-
-    fixes.sort(key=lambda item: item[0])
+    fixes = FIXES.pending(pr_version, addon.VERSION)
 
     if pms is None:
         pms = pr.pie_menus
 
-    for pm in pms:
-        for fix_version, fix_func in fixes:
-            fix_func(pr, pm)
+    if fixes:
+        for pm in pms:
+            with pm.edit_data():
+                for fix_func in fixes:
+                    fix_func(pr, pm)
 
     pr.version = addon.VERSION
 
 
-def fix_json(pm, menu, version):
-    DBG_INIT and logh("PME JSON Fixes")
-    pr = get_prefs()
-    fixes = []
-    re_fix = re.compile(r"fix_json_(\d+)_(\d+)_(\d+)")
-    for k, v in globals().items():
-        mo = re_fix.search(k)
-        if not mo:
-            continue
-
-        fix_version = (int(mo.group(1)), int(mo.group(2)), int(mo.group(3)))
-        if fix_version <= version:
-            continue
-        fixes.append((fix_version, v))
-
-    fixes.sort(key=lambda item: item[0])
-
-    for fix_version, fix_func in fixes:
-        fix_func(pr, pm, menu)
-
-
+@FIXES.register(1, 14, 0)
 def fix_1_14_0(pr, pm):
     if pm.mode == 'PMENU':
         for pmi in pm.pmis:
@@ -92,17 +71,20 @@ def fix_1_14_0(pr, pm):
                         pmi.text = CC.F_EXPAND + pmi.text
 
 
+@FIXES.register(1, 14, 9)
 def fix_1_14_9(pr, pm):
     if pm.mode == 'STICKY':
         pm.data = re.sub(r"([^_])block_ui", r"\1sk_block_ui", pm.data)
 
 
+@FIXES.register(1, 17, 0)
 def fix_1_17_0(pr, pm):
     if pm.mode == 'PMENU':
         for i in range(len(pm.pmis), 10):
             pm.pmis.add()
 
 
+@FIXES.register(1, 17, 1)
 def fix_1_17_1(pr, pm):
     if not pm.ed.has_hotkey:
         return
@@ -110,208 +92,20 @@ def fix_1_17_1(pr, pm):
     pm.km_name = (CC.KEYMAP_SPLITTER + " ").join(pm.km_name.split(","))
 
 
-def fix_json_1_17_1(pr, pm, menu):
-    if not pm.ed.has_hotkey:
-        return
-
-    menu[1] = (CC.KEYMAP_SPLITTER + " ").join(menu[1].split(","))
-
-# =============================================================================
-# PME2 2.0.0 Migrations: Prefix standardization (#92)
-# =============================================================================
-# MODAL: confirm, block_ui, lock → md_confirm, md_block_ui, md_lock
-# PROPERTY: prop? → pr?, vector → pr_vector, etc.
-
-
-def _migrate_modal_data(data):
-    """Migrate MODAL data string to use md_ prefix."""
-    if "md_confirm" not in data:
-        data = re.sub(r'\bconfirm\b', 'md_confirm', data)
-    if "md_block_ui" not in data:
-        data = re.sub(r'\bblock_ui\b', 'md_block_ui', data)
-    if "md_lock" not in data:
-        data = re.sub(r'\block\b', 'md_lock', data)
-    return data
-
-
-def _migrate_property_data(data):
-    """Migrate PROPERTY data string to use pr_ prefix."""
-    # Change type prefix: prop? → pr?
-    if data.startswith("prop?"):
-        data = "pr?" + data[5:]
-
-    # Migrate property names
-    if "pr_vector" not in data:
-        data = re.sub(r'\bvector\b', 'pr_vector', data)
-    if "pr_mulsel" not in data:
-        data = re.sub(r'\bmulsel\b', 'pr_mulsel', data)
-    if "pr_hor_exp" not in data:
-        data = re.sub(r'\bhor_exp\b', 'pr_hor_exp', data)
-    if "pr_exp" not in data:
-        data = re.sub(r'(?<!hor_)\bexp\b', 'pr_exp', data)
-    if "pr_save" not in data:
-        data = re.sub(r'\bsave\b', 'pr_save', data)
-    return data
-
-
-# Valid property types for JSON migration (defined here to avoid forward reference)
-_JSON_VALID_PROP_TYPES = {'BOOL', 'INT', 'FLOAT', 'STRING', 'ENUM'}
-
-
-def _migrate_json_property_poll_cmd(menu):
-    """Migrate PROPERTY prop_type from menu[7] to menu[5] in JSON import.
-
-    PME1 JSON format stores prop_type in menu[7] (poll_cmd field).
-    PME2 stores it in menu[5] (pm.data) as pr_prop_type.
-
-    This migration:
-    1. Reads prop_type from menu[7] if valid
-    2. Adds pr_prop_type to menu[5] (data string)
-    3. Clears menu[7] to use default poll condition
-    """
-    # Get prop_type from menu[7] if present
-    prop_type = 'BOOL'
-    if len(menu) > 7 and menu[7] in _JSON_VALID_PROP_TYPES:
-        prop_type = menu[7]
-
-    # Get current data string
-    data = menu[5] if len(menu) > 5 else ""
-    if not data:
-        data = "pr?"
-
-    # Add pr_prop_type to data if not already present
-    if "pr_prop_type" not in data:
-        # Parse and append to data string
-        if "?" in data:
-            prefix, _, params = data.partition("?")
-            if params:
-                data = f"{prefix}?pr_prop_type={prop_type}&{params}"
-            else:
-                data = f"{prefix}?pr_prop_type={prop_type}"
-        else:
-            data = f"pr?pr_prop_type={prop_type}"
-        menu[5] = data
-
-    # Clear menu[7] (poll_cmd) - use default poll condition
-    if len(menu) > 7:
-        menu[7] = ""
-
-
-def _migrate_json_extend_target(menu):
-    """Migrate extend_target from menu[0] (pm.name) to menu[5] (pm.data) for JSON import.
-
-    PME1 JSON format encodes extend information in pm.name:
-    - "VIEW3D_PT_tools_pre" → prepend to VIEW3D_PT_tools
-    - "TOPBAR_HT_upper_bar_right" → right region of TOPBAR_HT_upper_bar
-
-    PME2 stores these in pm.data:
-    - pd_extend_target / rm_extend_target: Blender Panel/Menu ID
-    - pd_extend_side / rm_extend_side: "prepend" | "append"
-    - pd_extend_order: int (0 = innermost)
-    - pd_extend_is_right: bool (Header right region, DIALOG only)
-
-    Args:
-        menu: JSON menu array [name, km_name, hotkey, icon, mode, data, ...]
-    """
-    mode = menu[4]
-    if mode not in ('DIALOG', 'RMENU'):
-        return
-
-    name = menu[0]
-    # Parse name for Blender ID and position flags
-    tp_name, is_right, is_prepend = extract_str_flags_b(name, CC.F_RIGHT, CC.F_PRE)
-
-    # Check if tp_name is a valid Blender type ID
-    if not any(x in tp_name for x in ('_PT_', '_MT_', '_HT_')):
-        return
-
-    # Determine prefix and values
-    prefix = "pd" if mode == 'DIALOG' else "rm"
-    extend_side = "prepend" if is_prepend else "append"
-
-    # Get current data string
-    data = menu[5] if len(menu) > 5 else ""
-
-    # Build new data string with extend properties
-    # Parse existing data to preserve other settings
-    if data and "?" in data:
-        base_prefix, _, params = data.partition("?")
-        # Remove any existing extend properties (shouldn't exist, but be safe)
-        param_pairs = [p for p in params.split("&") if p and not p.startswith(f"{prefix}_extend")]
-        new_params = [
-            f"{prefix}_extend_target={tp_name}",
-            f"{prefix}_extend_side={extend_side}",
-            f"{prefix}_extend_order=0",
-        ]
-        if prefix == "pd" and is_right:
-            new_params.append(f"{prefix}_extend_is_right=True")
-        all_params = new_params + param_pairs
-        data = f"{base_prefix}?{'&'.join(all_params)}"
-    else:
-        # No existing data, create new
-        base_prefix = prefix
-        new_params = [
-            f"{prefix}_extend_target={tp_name}",
-            f"{prefix}_extend_side={extend_side}",
-            f"{prefix}_extend_order=0",
-        ]
-        if prefix == "pd" and is_right:
-            new_params.append(f"{prefix}_extend_is_right=True")
-        data = f"{base_prefix}?{'&'.join(new_params)}"
-
-    menu[5] = data
-
-    DBG_INIT and logi(
-        "PME JSON: migrated extend_target",
-        f"name={name!r}",
-        f"extend_target={tp_name!r}",
-        f"extend_side={extend_side!r}",
-        f"is_right={is_right}"
-    )
-
-
-def fix_json_2_0_0(pr, pm, menu):
-    """
-    Migrate MODAL, PROPERTY, and Extend properties in JSON import.
-
-    JSON menu structure (PME1 format):
-      menu[0] = name (may contain Blender type ID for Extend menus)
-      menu[4] = mode
-      menu[5] = data (pm.data string)
-      menu[7] = poll_cmd (or prop_type for PROPERTY mode in PME1)
-    """
-    if len(menu) < 6:
-        return
-
-    mode = menu[4]
-    data = menu[5]
-
-    if mode == 'MODAL' and data:
-        menu[5] = _migrate_modal_data(data)
-    elif mode == 'PROPERTY':
-        if data:
-            menu[5] = _migrate_property_data(data)
-        # Migrate prop_type from menu[7] to menu[5] (pm.data)
-        _migrate_json_property_poll_cmd(menu)
-
-    # Migrate extend_target from pm.name to pm.data (DIALOG/RMENU)
-    if mode in ('DIALOG', 'RMENU'):
-        _migrate_json_extend_target(menu)
-
-
+@FIXES.register(2, 0, 0)
 def fix_2_0_0(pr, pm):
     """
     Migrate MODAL and PROPERTY properties to use standardized prefixes.
     Generate uid for menus without one.
     Migrate PROPERTY prop_type from poll_cmd to pm.data.
 
-    Uses the same helper functions as fix_json_2_0_0 for consistency.
+    Uses the same helper functions as core.migrations.fix_json_2_0_0.
     """
     if pm.mode == 'MODAL' and pm.data:
-        pm.data = _migrate_modal_data(pm.data)
+        pm.data = migrate_modal_data(pm.data)
     elif pm.mode == 'PROPERTY':
         if pm.data:
-            pm.data = _migrate_property_data(pm.data)
+            pm.data = migrate_property_data(pm.data)
         # Migrate prop_type from poll_cmd to pm.data (9-D-1)
         _migrate_property_poll_cmd(pm)
 
@@ -426,12 +220,13 @@ def _migrate_extend_target(pm):
         else:
             extend_side = "append"
 
-        pm.set_data(extend_target_key, clean_target)
-        pm.set_data(extend_side_key, extend_side)
-        pm.set_data(extend_order_key, 0)
-        # Migrate is_right from suffix (Header only)
-        if extend_is_right_key and is_right:
-            pm.set_data(extend_is_right_key, True)
+        with pm.edit_data():
+            pm.set_data(extend_target_key, clean_target)
+            pm.set_data(extend_side_key, extend_side)
+            pm.set_data(extend_order_key, 0)
+            # Migrate is_right from suffix (Header only)
+            if extend_is_right_key and is_right:
+                pm.set_data(extend_is_right_key, True)
 
         DBG_INIT and logi(
             "PME: migrated extend_target (old schema)",
@@ -454,12 +249,13 @@ def _migrate_extend_target(pm):
     extend_side = "prepend" if extend_position < 0 else "append"
 
     # Set new schema values
-    pm.set_data(extend_target_key, extend_target)
-    pm.set_data(extend_side_key, extend_side)
-    pm.set_data(extend_order_key, 0)
-    # Migrate is_right from pm.name suffix (Header only)
-    if extend_is_right_key and is_right:
-        pm.set_data(extend_is_right_key, True)
+    with pm.edit_data():
+        pm.set_data(extend_target_key, extend_target)
+        pm.set_data(extend_side_key, extend_side)
+        pm.set_data(extend_order_key, 0)
+        # Migrate is_right from pm.name suffix (Header only)
+        if extend_is_right_key and is_right:
+            pm.set_data(extend_is_right_key, True)
 
     DBG_INIT and logi(
         "PME: migrated extend_target (from name)",
@@ -470,10 +266,6 @@ def _migrate_extend_target(pm):
     )
 
 
-# Valid property types for PROPERTY mode migration
-_VALID_PROP_TYPES = {'BOOL', 'INT', 'FLOAT', 'STRING', 'ENUM'}
-
-
 def _migrate_property_poll_cmd(pm):
     """Migrate PROPERTY mode: move prop_type from poll_cmd to pm.data.
 
@@ -488,13 +280,13 @@ def _migrate_property_poll_cmd(pm):
     # Check if pr_prop_type already exists in pm.data
     if "pr_prop_type" in pm.data:
         # Already migrated, just clear poll_cmd if it has old value
-        if pm.poll_cmd in _VALID_PROP_TYPES:
+        if pm.poll_cmd in VALID_PROP_TYPES:
             DBG_INIT and logi("PME: clearing legacy poll_cmd", f"pm={pm.name}")
             pm.poll_cmd = CC.DEFAULT_POLL
         return
 
     # Read prop_type from poll_cmd
-    prop_type = pm.poll_cmd if pm.poll_cmd in _VALID_PROP_TYPES else 'BOOL'
+    prop_type = pm.poll_cmd if pm.poll_cmd in VALID_PROP_TYPES else 'BOOL'
 
     # Set pr_prop_type in pm.data
     pm.set_data("pr_prop_type", prop_type)
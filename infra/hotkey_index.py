@@ -0,0 +1,195 @@
+# infra/hotkey_index.py - Hotkey index for menu invocation
+# LAYER = "infra"
+#
+# Groups menus by hotkey so WM_OT_pme_user_pie_menu_call.invoke can find
+# mouse-button-modifier overrides, open-mode siblings and CHORDS menus
+# without scanning pr.pie_menus on every key press.
+#
+# Hotkey key: (keymap, packed key and modifiers), one per keymap name.
+# Each hotkey maps to {(open_mode, key_mod): [menu names]}. Candidates are
+# compared by packed hotkey (keymap_helper.encode_hotkey) instead of field
+# by field.
+#
+# Maintained from PMItem.register_hotkey/unregister_hotkey, the key,
+# modifier, key_mod and open mode update callbacks and menu renames.
+# The first lookup after clear() rebuilds the index from pr.pie_menus.
+#
+# Lookups re-check every condition on the candidates, so a stale entry can
+# only hide a menu, never return a wrong one.
+
+LAYER = "infra"
+
+from ..addon import get_prefs
+from ..core import constants as CC
+from .. import keymap_helper as KH
+
+
+def _km_names(km_name):
+    return {s.strip() for s in km_name.split(CC.KEYMAP_SPLITTER) if s.strip()}
+
+
+def _mods(pm):
+    return KH.encode_mods(pm.ctrl, pm.shift, pm.alt, pm.oskey)
+
+
+def _base(pm):
+    return KH.hotkey_base(pm.hotkey_code)
+
+
+class HotkeyIndex:
+    def __init__(self):
+        self._entries = {}
+        self._hotkeys = {}
+        self._mouse_mods = {}
+        self._valid = False
+
+    def clear(self):
+        self._entries.clear()
+        self._hotkeys.clear()
+        self._mouse_mods.clear()
+        self._valid = False
+
+    def _add(self, name, entry):
+        hotkeys, group, mouse_key = entry
+        for hotkey in hotkeys:
+            groups = self._hotkeys.setdefault(hotkey, {})
+            groups.setdefault(group, []).append(name)
+
+        if mouse_key:
+            self._mouse_mods.setdefault(mouse_key, []).append(name)
+
+        self._entries[name] = entry
+
+    def remove_pm(self, name):
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return
+
+        hotkeys, group, mouse_key = entry
+        for hotkey in hotkeys:
+            groups = self._hotkeys[hotkey]
+            groups[group].remove(name)
+            if not groups[group]:
+                del groups[group]
+            if not groups:
+                del self._hotkeys[hotkey]
+
+        if mouse_key:
+            names = self._mouse_mods[mouse_key]
+            names.remove(name)
+            if not names:
+                del self._mouse_mods[mouse_key]
+
+    def update_pm(self, pm, name=None):
+        """Re-index a menu. Pass the old name if the menu was renamed."""
+        self.remove_pm(name or pm.name)
+        if pm.key == 'NONE':
+            return
+
+        base = _base(pm)
+        hotkeys = tuple((km, base) for km in _km_names(pm.km_name))
+        mouse_key = None
+        if pm.key_mod in KH.MOUSE_BUTTONS:
+            mouse_key = base
+
+        self._add(pm.name, (hotkeys, (pm.open_mode, pm.key_mod), mouse_key))
+
+    def sync(self, pie_menus):
+        self.clear()
+        for pm in pie_menus:
+            self.update_pm(pm)
+        self._valid = True
+
+    def _ensure(self):
+        if not self._valid:
+            self.sync(get_prefs().pie_menus)
+
+    def _menus(self, names):
+        pie_menus = get_prefs().pie_menus
+        ret = []
+        for name in names:
+            pm = pie_menus.get(name)
+            if pm:
+                ret.append(pm)
+
+        if len(ret) > 1:
+            ret.sort(key=lambda pm: pie_menus.find(pm.name))
+        return ret
+
+    def _groups(self, keymap, pm):
+        self._ensure()
+        return self._hotkeys.get((keymap, _base(pm)), {})
+
+    def mouse_mod_menus(self, cpm, context):
+        """Enabled menus that override cpm while their mouse button modifier is held.
+
+        Keymaps are ignored, keys are compared as system mouse keys.
+        Returned in collection order.
+        """
+        cpm_key = KH.to_system_mouse_key(cpm.key, context)
+        keys = {cpm.key, cpm_key}
+        if cpm_key in {'LEFTMOUSE', 'RIGHTMOUSE'}:
+            keys.update(('ACTIONMOUSE', 'SELECTMOUSE'))
+
+        self._ensure()
+        mods = _mods(cpm)
+        names = []
+        for key in keys:
+            names.extend(
+                self._mouse_mods.get(KH.hotkey_base(KH.encode_hotkey(key) | mods), ())
+            )
+
+        return [
+            pm
+            for pm in self._menus(names)
+            if pm != cpm
+            and pm.enabled
+            and KH.to_system_mouse_key(pm.key, context) == cpm_key
+            and _mods(pm) == mods
+            and pm.key_mod in KH.MOUSE_BUTTONS
+        ]
+
+    def open_mode_menus(self, cpm, keymap):
+        """Enabled menus sharing cpm's hotkey and key_mod with another open mode."""
+        names = []
+        for (open_mode, key_mod), group in self._groups(keymap, cpm).items():
+            if open_mode != cpm.open_mode and key_mod == cpm.key_mod:
+                names.extend(group)
+
+        mask = ~KH.ANY
+        code = cpm.hotkey_code & mask
+        return [
+            pm
+            for pm in self._menus(names)
+            if pm != cpm
+            and pm.enabled
+            and pm.hotkey_code & mask == code
+            and pm.open_mode != cpm.open_mode
+            and keymap in _km_names(pm.km_name)
+        ]
+
+    def chord_menus(self, pm, keymap):
+        """CHORDS menus sharing pm's hotkey in the keymap."""
+        names = []
+        for (open_mode, _), group in self._groups(keymap, pm).items():
+            if open_mode == 'CHORDS':
+                names.extend(group)
+
+        mask = ~KH.KEY_MOD_MASK
+        code = pm.hotkey_code & mask
+        return [
+            v
+            for v in self._menus(names)
+            if v.chord
+            and v.open_mode == 'CHORDS'
+            and v.chord != 'NONE'
+            and v.hotkey_code & mask == code
+            and keymap in _km_names(v.km_name)
+        ]
+
+
+hotkey_index = HotkeyIndex()
+
+
+def unregister():
+    hotkey_index.clear()
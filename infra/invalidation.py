@@ -0,0 +1,96 @@
+# infra/invalidation.py - Deferred rebuild of derived editor state
+# LAYER = "infra"
+#
+# Update callbacks and operators used to call Tag.filter(), pr.update_tree()
+# and tag_redraw() directly, so a single user action (or a script renaming
+# or retagging many menus) rebuilt the same structures several times.
+#
+# Callers now mark structures stale with invalidate(). Stale structures are
+# rebuilt once, in ORDER, by a bpy.app.timers callback on the next event
+# loop tick, or when the outermost batch() block exits:
+#
+#     with invalidation.batch():
+#         for pm in pms:
+#             pm.label = ...        # each rename invalidates TAGS and TREE
+#     # Tag.filter() and update_tree() ran once here
+#
+# Rebuild functions are registered by the layers owning the structures
+# (preferences.register).
+
+LAYER = "infra"
+
+import bpy
+from contextlib import contextmanager
+from ..addon import print_exc
+
+TAGS = 'TAGS'      # Tag.filtered_pms
+TREE = 'TREE'      # pr.tree links
+REDRAW = 'REDRAW'  # preferences area
+
+ORDER = (TAGS, TREE, REDRAW)
+
+
+class Invalidation:
+    def __init__(self):
+        self._handlers = {}
+        self._dirty = set()
+        self._depth = 0
+
+    def add_handler(self, name, func):
+        self._handlers[name] = func
+
+    def clear(self):
+        self._handlers.clear()
+        self._dirty.clear()
+        self._depth = 0
+        if bpy.app.timers.is_registered(self._on_timer):
+            bpy.app.timers.unregister(self._on_timer)
+
+    def is_dirty(self, name):
+        return name in self._dirty
+
+    def invalidate(self, *names):
+        """Mark structures stale. They are rebuilt on the next tick."""
+        self._dirty.update(names or ORDER)
+        if not self._depth and not bpy.app.timers.is_registered(self._on_timer):
+            bpy.app.timers.register(self._on_timer, first_interval=0)
+
+    def _on_timer(self):
+        self.flush()
+        return None
+
+    def flush(self):
+        """Rebuild stale structures now."""
+        if bpy.app.timers.is_registered(self._on_timer):
+            bpy.app.timers.unregister(self._on_timer)
+
+        dirty = self._dirty
+        self._dirty = set()
+        for name in ORDER:
+            if name not in dirty:
+                continue
+
+            handler = self._handlers.get(name)
+            if handler:
+                try:
+                    handler()
+                except:
+                    print_exc()
+
+    @contextmanager
+    def batch(self):
+        """Collect invalidations and flush once the outermost block exits."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth and self._dirty:
+                self.flush()
+
+
+invalidation = Invalidation()
+
+
+def unregister():
+    invalidation.clear()
@@ -0,0 +1,156 @@
+# infra/menu_search.py - Menu search index (PMItem adapter for core.search)
+# LAYER = "infra"
+#
+# Keeps a core.search.SearchIndex in sync with pr.pie_menus.
+# Each menu is indexed by name, tags, keymaps, hotkey strings and
+# slot labels/commands.
+#
+# The index is maintained like infra/tag_index: menu add/remove/rename
+# update it directly, tag, hotkey and slot edits mark the menu stale with
+# invalidate(). Stale menus are re-indexed on the next query, so a search
+# never walks the whole collection. The first query after clear() (or a
+# change in the number of menus nobody reported) rebuilds from pr.pie_menus.
+#
+# Used by:
+#   - operators/search.py (PME_OT_pm_search_and_select, PME_OT_pmi_pm_search)
+#   - api/menu.py (pme.search_menus)
+
+LAYER = "infra"
+
+from ..addon import get_prefs
+from ..core import constants as CC
+from ..core.search import SearchIndex
+from .. import keymap_helper as KH
+
+
+def menu_fields(pm) -> dict:
+    """Collect the searchable text fields of a menu."""
+    hotkeys = []
+    if pm.key and pm.key != 'NONE':
+        hotkeys.append(pm.to_hotkey(use_key_names=True))
+        hotkeys.append(KH.to_ui_hotkey(pm))
+
+    slots = []
+    commands = []
+    for pmi in pm.pmis:
+        if pmi.name:
+            slots.append(pmi.name)
+        if pmi.text and pmi.mode != 'EMPTY':
+            commands.append(pmi.text)
+
+    return {
+        "name": pm.name,
+        "tag": tuple(pm.get_tags() or ()),
+        "keymap": tuple(
+            s.strip() for s in pm.km_name.split(CC.KEYMAP_SPLITTER) if s.strip()
+        ),
+        "hotkey": tuple(hotkeys),
+        "slot": tuple(slots),
+        "command": tuple(commands),
+    }
+
+
+class MenuSearch:
+    """Search index over PME menus.
+
+    Example:
+        >>> for hit in menu_search.search("sculpt", limit=5):
+        ...     print(hit.key, hit.field)
+    """
+
+    def __init__(self):
+        self.index = SearchIndex()
+        self._fields = {}
+        self._modes = {}
+        self._dirty = set()
+        self._valid = False
+
+    def clear(self):
+        self.index.clear()
+        self._fields.clear()
+        self._modes.clear()
+        self._dirty.clear()
+        self._valid = False
+
+    def invalidate(self, name=None):
+        """Re-index the menu (or every menu) before the next query."""
+        if name is None:
+            self._valid = False
+        else:
+            self._dirty.add(name)
+
+    def _index_pm(self, pm):
+        fields = menu_fields(pm)
+        self._modes[pm.name] = pm.mode
+        if self._fields.get(pm.name) != fields:
+            self._fields[pm.name] = fields
+            self.index.update(pm.name, fields)
+
+    def update_pm(self, pm, name=None):
+        """Re-index a menu. Pass the old name if the menu was renamed."""
+        if not self._valid:
+            return
+
+        if name and name != pm.name:
+            self.remove_pm(name)
+        self._dirty.discard(pm.name)
+        self._index_pm(pm)
+
+    def remove_pm(self, name):
+        self._dirty.discard(name)
+        self._fields.pop(name, None)
+        self._modes.pop(name, None)
+        self.index.remove(name)
+
+    def sync(self, pie_menus):
+        """Bring the index up to date with the menu collection."""
+        names = set()
+        for pm in pie_menus:
+            names.add(pm.name)
+            self._index_pm(pm)
+
+        for name in [n for n in self._fields if n not in names]:
+            self.remove_pm(name)
+
+        self._dirty.clear()
+        self._valid = True
+
+    def _ensure(self):
+        pie_menus = get_prefs().pie_menus
+        if not self._valid or len(pie_menus) != len(self._fields):
+            self.sync(pie_menus)
+            return
+
+        while self._dirty:
+            name = self._dirty.pop()
+            pm = pie_menus.get(name)
+            if pm is None:
+                self.remove_pm(name)
+            else:
+                self._index_pm(pm)
+
+    def names(self, modes=None):
+        """Indexed menu names, sorted, optionally filtered by mode."""
+        self._ensure()
+        if not modes:
+            return sorted(self._modes)
+        return sorted(k for k, v in self._modes.items() if v in modes)
+
+    def search(self, query, limit=20, modes=None):
+        self._ensure()
+        keys = None
+        if modes:
+            keys = [k for k, v in self._modes.items() if v in modes]
+        return self.index.search(query, limit=limit, keys=keys)
+
+
+menu_search = MenuSearch()
+
+
+def search_menus(query, limit=20, modes=None):
+    """Run a ranked search over the shared menu index."""
+    return menu_search.search(query, limit=limit, modes=modes)
+
+
+def unregister():
+    menu_search.clear()
@@ -95,13 +95,64 @@ add_space_group("VIEW_3D", "SpaceView3D")
 
 del add_space_group
 
+
+# ======================================================
+# Text metrics
+# ======================================================
+#
+# Painters measure text through a TextMetrics object instead of calling
+# blf directly. BlfTextMetrics caches the measured dimensions, so repeated
+# updates with the same cells do not touch blf. Another implementation can
+# be installed with set_text_metrics() to run the layout code without a
+# display (e.g. a fixed-width font stub).
+
+class TextMetrics:
+    """Measurement interface used by overlay painters."""
+
+    def dimensions(self, text, size, font_id=0):
+        """Return (width, height) of the text in pixels."""
+        raise NotImplementedError
+
+    def clear(self):
+        pass
+
+
+class BlfTextMetrics(TextMetrics):
+    max_cache_size = 4096
+
+    def __init__(self):
+        self.cache = {}
+
+    def dimensions(self, text, size, font_id=0):
+        key = (text, size, font_id)
+        ret = self.cache.get(key)
+        if ret is None:
+            if len(self.cache) >= self.max_cache_size:
+                self.cache.clear()
+            blf.size(font_id, size)
+            ret = self.cache[key] = blf.dimensions(font_id, text)
+        return ret
+
+    def clear(self):
+        self.cache.clear()
+
+
+text_metrics = BlfTextMetrics()
+
+
+def set_text_metrics(metrics=None):
+    """Install a TextMetrics implementation (None - restore blf metrics)."""
+    global text_metrics
+    text_metrics = metrics or BlfTextMetrics()
+
+
 _line_y = 0
 
 
 def _draw_line(space, r, g, b, a):
     ctx = bpy.context
     blf.size(0, space.size)
-    w, h = blf.dimensions(0, space.text)
+    w, h = text_metrics.dimensions(space.text, space.size)
 
     global _line_y
 
@@ -179,8 +230,7 @@ class Text:
 
     def update(self, text):
         self.text = text
-        blf.size(0, self.size)
-        self.width, self.height = blf.dimensions(0, text)
+        self.width, self.height = text_metrics.dimensions(text, self.size)
 
     def draw(self, x, y):
         blf.color(0, *self.style.color)
@@ -215,6 +265,7 @@ class TablePainter(Painter):
         Painter.__init__(self)
 
         self.cols = []
+        self.draw_list = []
         self.num_cols = num_cols
         self.header = Text(header) if header else None
         self.align_right = align_right
@@ -244,6 +295,14 @@ class TablePainter(Painter):
                 )
                 col_idx = (col_idx + 1) % self.num_cols
 
+        r = bpy.context.region
+        self.layout(r.width, r.height, pr.alignment, pr.offset_x, pr.offset_y)
+
+    def layout(self, region_width, region_height, alignment='TOP', offset_x=0, offset_y=0):
+        """Compute the table size, position and draw list.
+
+        Uses only cached cell sizes, so it can run without blf or a region.
+        """
         self.width = 0
         self.height = 0
         if self.header:
@@ -265,59 +324,70 @@ class TablePainter(Painter):
                 self.height += self.spacing_y
             self.height += height
 
-        r = bpy.context.region
-
-        if 'LEFT' in pr.alignment:
-            self.x = pr.offset_x
-        elif 'RIGHT' in pr.alignment:
-            self.x = r.width - self.width - pr.offset_x
+        if 'LEFT' in alignment:
+            self.x = offset_x
+        elif 'RIGHT' in alignment:
+            self.x = region_width - self.width - offset_x
         else:
-            self.x = 0.5 * r.width - 0.5 * self.width
+            self.x = 0.5 * region_width - 0.5 * self.width
 
-        if 'TOP' in pr.alignment:
-            self.y = r.height - pr.offset_y
+        if 'TOP' in alignment:
+            self.y = region_height - offset_y
         else:
-            self.y = pr.offset_y + self.height
+            self.y = offset_y + self.height
 
-    def draw(self):
+        self.draw_list = self.build_draw_list()
+
+    def build_draw_list(self):
+        """Return [(x, y, Text), ...] in region coordinates."""
+        ret = []
         if self.header:
             x = round(self.x + self.header.center(self.width))
             y = round(self.y - self.header.size)
-            self.header.draw(x, y)
-
+            ret.append((x, y, self.header))
+
+        y0 = (
+            -self.header.size
+            - self.spacing_y
+            - 2 * self.spacing_h
+            - self.line_width
+            if self.header
+            else 0
+        )
 
         x = 0
         for i in range(0, self.num_cols - self.align_right):
             col = self.cols[i]
-            y = (
-                -self.header.size
-                - self.spacing_y
-                - 2 * self.spacing_h
-                - self.line_width
-                if self.header
-                else 0
-            )
+            y = y0
             for cell in col.cells:
-                cell.draw(self.x + x, self.y + y - self.col_size)
+                ret.append((self.x + x, self.y + y - self.col_size, cell))
                 y -= self.col_size + self.spacing_y
             x += col.width + self.spacing_x
 
         x = self.width
         for i in range(0, self.align_right):
             col = self.cols[self.num_cols - i - 1]
-            y = (
-                -self.header.size
-                - self.spacing_y
-                - 2 * self.spacing_h
-                - self.line_width
-                if self.header
-                else 0
-            )
+            y = y0
             for cell in col.cells:
-                cell.draw(self.x + x - cell.width, self.y + y - self.col_size)
+                ret.append((self.x + x - cell.width, self.y + y - self.col_size, cell))
                 y -= self.col_size + self.spacing_y
             x -= col.width + self.spacing_x
 
+        return ret
+
+    def draw(self):
+        size = None
+        color = None
+        for x, y, cell in self.draw_list:
+            if cell.size != size:
+                size = cell.size
+                blf.size(0, size)
+            if cell.style.color is not color:
+                color = cell.style.color
+                blf.color(0, *color)
+            blf.position(0, x, y, 0)
+            blf.draw(0, cell.text)
+
 
 @multiton
 class Overlay:
@@ -393,6 +463,7 @@ def _split(layout, factor=None, align=True):
 
 class OverlayPrefs(PropertyGroup):
     def size_update(self, context):
+        text_metrics.clear()
         Text.default_style.size = self.size
         Text.secondary_style.size = self.size
         # TablePainter.col_styles[0].size = \
@@ -623,6 +694,9 @@ __all__ = [
     'OVERLAY_ALIGNMENT_ITEMS',
     'Timer',
     'SpaceGroup',
+    'TextMetrics',
+    'BlfTextMetrics',
+    'set_text_metrics',
     'Painter',
     'Style',
     'Text',
@@ -10,6 +10,7 @@ LAYER = "infra"
 from .. import pme
 from .debug import logw
 from .io import get_user_icons_dir, get_system_icons_dir
+from ..core.search import SubstringIndex
 
 
 class PreviewsHelper:
@@ -22,11 +23,19 @@ class PreviewsHelper:
         # New: dual-path support (system + user icons)
         self._addon_path = _addon_root
         self.preview = None
+        self._index = None
+        self._icon_ids = {}
 
     def get_icon(self, name):
-        if self.preview is None or name not in self.preview:
-            return 0
-        return self.preview[name].icon_id
+        # Cached: draw code resolves the same custom icons on every redraw
+        ret = self._icon_ids.get(name)
+        if ret is None:
+            if self.preview is None or name not in self.preview:
+                ret = 0
+            else:
+                ret = self.preview[name].icon_id
+            self._icon_ids[name] = ret
+        return ret
 
     def get_icon_name_by_id(self, id):
         if self.preview is None:
@@ -47,6 +56,12 @@ class PreviewsHelper:
             return []
         return self.preview.keys()
 
+    def get_index(self):
+        """Sorted custom icon names for the icon picker."""
+        if self._index is None:
+            self._index = SubstringIndex(self.get_names())
+        return self._index
+
     def has_icon(self, name):
         return self.preview is not None and name in self.preview
 
@@ -77,6 +92,9 @@ class PreviewsHelper:
         icon_value at class definition time, so refreshing will NOT update those
         enums - they require Blender restart.
         """
+        self._index = None
+        self._icon_ids.clear()
+
         # Clear existing preview collection
         if self.preview is not None:
             try:
@@ -110,6 +128,22 @@ class PreviewsHelper:
             # Hotfix: Reload Scripts may leave previews in unstable state
             logw("PME: previews unregister failed", str(e))
         self.preview = None
+        self._index = None
+        self._icon_ids.clear()
+
+
+_blender_icon_index = None
+
+
+def get_blender_icon_index():
+    """Blender icon identifiers (except NONE) in enum order."""
+    global _blender_icon_index
+    if _blender_icon_index is None:
+        items = bpy.types.UILayout.bl_rna.functions["prop"].parameters["icon"].enum_items
+        _blender_icon_index = SubstringIndex(
+            (i.identifier for i in items if i.identifier != 'NONE'), sort=False
+        )
+    return _blender_icon_index
 
 
 def custom_icon(icon):
@@ -332,3 +332,126 @@ def enum_id_to_value(data, key, id):
 
 def enum_value_to_id(data, key, value):
     return data.bl_rna.properties[key].enum_items[value].identifier
+
+
+# ======================================================
+# Bulk access (pme.update_props / pme.snapshot_props)
+# ======================================================
+#
+# Generated update callbacks of user properties call defer_update() first.
+# While update_many() runs they are queued (one entry per owner and
+# property) and executed once after all values are set.
+
+_deferred_updates = None
+
+
+def defer_update(prop_name, data, callback):
+    """Queue an update callback if update_many() is running.
+
+    Returns:
+        True if the callback was queued and should not run now.
+    """
+    if _deferred_updates is None:
+        return False
+
+    _deferred_updates[(data.as_pointer(), prop_name)] = (data, callback)
+    return True
+
+
+def _is_array(value):
+    return not isinstance(value, (str, set, frozenset)) and hasattr(value, "__len__")
+
+
+def _to_tuple(value):
+    if not _is_array(value):
+        return value
+    return tuple(_to_tuple(v) for v in value)
+
+
+def _flatten(value, ret):
+    if _is_array(value):
+        for v in value:
+            _flatten(v, ret)
+    else:
+        ret.append(value)
+
+
+def update_many(data, values, skip_equal=True):
+    """Set many properties of data in one pass.
+
+    Unknown names raise KeyError before any value is set.
+    Values equal to the current ones are skipped, so their set/update
+    callbacks do not fire. Deferred update callbacks run once per property
+    after all values are set.
+
+    Args:
+        data: Property owner (e.g. pme.props)
+        values: Mapping of property name to value
+        skip_equal: Skip values equal to the current ones
+
+    Returns:
+        List of property names that were set.
+    """
+    global _deferred_updates
+
+    properties = data.bl_rna.properties
+    for name in values:
+        if name not in properties:
+            raise KeyError(
+                "%s has no property '%s'" % (data.__class__.__name__, name)
+            )
+
+    outer = _deferred_updates is None
+    if outer:
+        _deferred_updates = {}
+
+    changed = []
+    try:
+        for name, value in values.items():
+            if skip_equal and _to_tuple(getattr(data, name)) == _to_tuple(value):
+                continue
+
+            setattr(data, name, value)
+            changed.append(name)
+
+    finally:
+        if outer:
+            pending, _deferred_updates = _deferred_updates, None
+            for owner, callback in pending.values():
+                try:
+                    callback(owner, bpy.context)
+                except:
+                    print_exc()
+
+    return changed
+
+
+def snapshot(data, names=None, flat=False):
+    """Read many property values in one pass.
+
+    Args:
+        data: Property owner (e.g. pme.props)
+        names: Property names to read (default: all own non-pointer props)
+        flat: Return a flat list of values in names order instead of a dict.
+            Array values are expanded, so the result can be passed to
+            foreach_set() or array.array() directly.
+
+    Returns:
+        Dict of name to value (arrays as tuples) or a flat list.
+    """
+    if names is None:
+        base = PropertyGroup.bl_rna.properties
+        names = [
+            p.identifier
+            for p in data.bl_rna.properties
+            if p.identifier not in base
+            and p.type not in {'POINTER', 'COLLECTION'}
+        ]
+
+    if flat:
+        ret = []
+        for name in names:
+            _flatten(getattr(data, name), ret)
+        return ret
+
+    return {name: _to_tuple(getattr(data, name)) for name in names}
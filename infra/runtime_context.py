@@ -22,6 +22,7 @@ LAYER = "infra"
 import bpy
 
 from ..addon import get_prefs, temp_prefs, print_exc
+from ..core.syntax import compile_cache
 
 
 class UserData:
@@ -152,14 +153,27 @@ class PMEContext:
 
         return ret
 
+    def reset_globals(self, globals, **kwargs):
+        """Reset an existing namespace dict to a fresh gen_globals() state.
+
+        The dict is updated in place so references to it stay valid.
+        """
+        globals.clear()
+        globals.update(self.gen_globals(**kwargs))
+        return globals
+
     def eval(self, expression, globals=None, menu=None, slot=None):
         """Evaluate an expression and return the result."""
         if globals is None:
             globals = self.gen_globals()
 
+        code = expression
+        if isinstance(expression, str):
+            code = compile_cache.compile(expression, 'eval')[0] or expression
+
         value = None
         try:
-            value = eval(expression, globals)
+            value = eval(code, globals)
         except:
             print_exc(expression)
 
@@ -173,12 +187,18 @@ class PMEContext:
         if globals is None:
             globals = self.gen_globals()
 
+        # Reuse the code compiled by the syntax check. Invalid text falls
+        # through as a string so exec() raises the usual SyntaxError.
+        code = data
+        if isinstance(data, str):
+            code = compile_cache.compile(data)[0] or data
+
         if not use_try:
-            exec(data, globals)
+            exec(code, globals)
             return True
 
         try:
-            exec(data, globals)
+            exec(code, globals)
         except:
             print_exc(data)
             return False
@@ -0,0 +1,153 @@
+# infra/syntax_check.py - Background syntax validation for slot editing
+# LAYER = "infra"
+#
+# PMIData fields are re-checked on every edit. Compiling a long script on
+# the main thread each time stalls typing, so EditorBase.on_pmi_check asks
+# this module for results instead of calling compile() itself:
+#
+#   check()  -> cached result, or PENDING and the text is queued per slot
+#   _flush() -> after DEBOUNCE seconds, queued texts go to a worker thread
+#   _poll()  -> main-thread timer, stores results and runs the callbacks
+#               (re-check + redraw) once every job has landed
+#   wait()   -> resolves everything synchronously (used before saving)
+#
+# Results land in core.syntax.compile_cache, keyed by (mode, prefix, text),
+# together with the compiled code so runtime_context can execute it without
+# compiling again. check() reports None for valid code, a Diagnostic with
+# line/column ranges otherwise.
+
+LAYER = "infra"
+
+import bpy
+from concurrent.futures import ThreadPoolExecutor
+from .debug import dbg_log
+from ..core.syntax import compile_cache, compile_entry
+
+DEBOUNCE = 0.15
+POLL_INTERVAL = 0.05
+
+PENDING = object()
+
+
+_queued = {}
+_futures = {}
+_callbacks = []
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pme_syntax_check"
+        )
+    return _executor
+
+
+def _set_timer(func, interval):
+    if bpy.app.timers.is_registered(func):
+        bpy.app.timers.unregister(func)
+    bpy.app.timers.register(func, first_interval=interval)
+
+
+def _flush():
+    executor = _get_executor()
+    for key in _queued.values():
+        if key not in _futures and key not in compile_cache:
+            _futures[key] = executor.submit(compile_entry, *key)
+    _queued.clear()
+
+    if not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=POLL_INTERVAL)
+    return None
+
+
+def _poll():
+    for key in [k for k, f in _futures.items() if f.done()]:
+        compile_cache.store(key, _futures.pop(key).result())
+
+    if _futures or _queued:
+        return POLL_INTERVAL
+
+    _run_callbacks()
+    return None
+
+
+def _run_callbacks():
+    callbacks = _callbacks[:]
+    _callbacks.clear()
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            dbg_log("runtime", f"syntax_check callback failed: {e}", level="error")
+
+
+def check(text, mode='exec', prefix="", slot=None, on_ready=None):
+    """Return the cached result for text, or PENDING.
+
+    On a miss the text is queued under slot (newer text for the same slot
+    replaces older, not yet submitted text) and on_ready is called on the
+    main thread once all pending results are available.
+    """
+    key = (mode, prefix, text)
+    entry = compile_cache.get(key)
+    if entry is not None:
+        return entry[1]
+
+    _queued[slot or key] = key
+    if on_ready and on_ready not in _callbacks:
+        _callbacks.append(on_ready)
+
+    _set_timer(_flush, DEBOUNCE)
+    return PENDING
+
+
+def is_pending():
+    return bool(_queued or _futures)
+
+
+def wait():
+    """Resolve queued and running checks synchronously.
+
+    Returns True if any result was pending. Callbacks are dropped, the
+    caller is expected to re-run its check.
+    """
+    if not is_pending():
+        return False
+
+    for func in (_flush, _poll):
+        if bpy.app.timers.is_registered(func):
+            bpy.app.timers.unregister(func)
+
+    for key in _queued.values():
+        if key not in _futures and key not in compile_cache:
+            compile_cache.store(key, compile_entry(*key))
+    _queued.clear()
+
+    for key, future in list(_futures.items()):
+        compile_cache.store(key, future.result())
+    _futures.clear()
+
+    _callbacks.clear()
+    return True
+
+
+def clear_cache():
+    compile_cache.clear()
+
+
+def unregister():
+    global _executor
+    for func in (_flush, _poll):
+        if bpy.app.timers.is_registered(func):
+            bpy.app.timers.unregister(func)
+
+    _queued.clear()
+    _futures.clear()
+    _callbacks.clear()
+    compile_cache.clear()
+
+    if _executor:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
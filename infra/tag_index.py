@@ -0,0 +1,118 @@
+# infra/tag_index.py - Tag index for menu filtering and grouping
+# LAYER = "infra"
+#
+# pm.tag is a comma separated string ("Modeling, UV"). Splitting it for
+# every has_tag/get_tags call made tag filtering, tree grouping and
+# TempPrefs.init_tags scan and re-split all menus. The index keeps:
+#
+#   _menus:    {menu name: (raw tag string, tags tuple)}
+#   _tags:     {tag: {menu names}}
+#   _untagged: {menu names without tags}
+#
+# Maintained from the PMItem.tag update callback (add_tag/remove_tag and
+# direct assignments), menu renames and removals. get_tags() re-indexes a
+# menu whose raw string no longer matches, so a missed update is healed on
+# the next lookup. The first lookup after clear() rebuilds from pr.pie_menus.
+
+LAYER = "infra"
+
+from ..addon import get_prefs
+from ..core import constants as CC
+
+
+def split_tags(text):
+    if not text:
+        return ()
+
+    ret = []
+    for t in text.split(","):
+        t = t.strip()
+        if t and t not in ret:
+            ret.append(t)
+    return tuple(ret)
+
+
+class TagIndex:
+    def __init__(self):
+        self._menus = {}
+        self._tags = {}
+        self._untagged = set()
+        self._valid = False
+
+    def clear(self):
+        self._menus.clear()
+        self._tags.clear()
+        self._untagged.clear()
+        self._valid = False
+
+    def remove_pm(self, name):
+        entry = self._menus.pop(name, None)
+        if entry is None:
+            return
+
+        _, tags = entry
+        if not tags:
+            self._untagged.discard(name)
+
+        for t in tags:
+            names = self._tags[t]
+            names.discard(name)
+            if not names:
+                del self._tags[t]
+
+    def update_pm(self, pm, name=None):
+        """Re-index a menu. Pass the old name if the menu was renamed."""
+        self.remove_pm(name or pm.name)
+
+        raw = pm.tag
+        tags = split_tags(raw)
+        if tags:
+            for t in tags:
+                self._tags.setdefault(t, set()).add(pm.name)
+        else:
+            self._untagged.add(pm.name)
+
+        self._menus[pm.name] = (raw, tags)
+        return tags
+
+    def sync(self, pie_menus):
+        self.clear()
+        for pm in pie_menus:
+            self.update_pm(pm)
+        self._valid = True
+
+    def _ensure(self):
+        if not self._valid:
+            self.sync(get_prefs().pie_menus)
+
+    def get_tags(self, pm):
+        self._ensure()
+        entry = self._menus.get(pm.name)
+        if entry is None or entry[0] != pm.tag:
+            return self.update_pm(pm)
+        return entry[1]
+
+    def has_tag(self, pm, tag):
+        tags = self.get_tags(pm)
+        if not tags:
+            return tag == CC.UNTAGGED
+        return tag in tags
+
+    def menus(self, tag):
+        """Names of the menus with the tag. Do not modify the result."""
+        self._ensure()
+        if tag == CC.UNTAGGED:
+            return self._untagged
+        return self._tags.get(tag, ())
+
+    def tags(self):
+        """Sorted names of the tags used by menus."""
+        self._ensure()
+        return sorted(self._tags)
+
+
+tag_index = TagIndex()
+
+
+def unregister():
+    tag_index.clear()
@@ -37,9 +37,14 @@ OSKEY = 1 << 3
 
 key_items = []
 key_names = {}
+key_ids = {'NONE': 0}
+key_idents = {0: 'NONE'}
 for i in Event.bl_rna.properties["type"].enum_items.values():
     key_items.append((i.identifier, i.name, "", i.value))
     key_names[i.identifier] = i.description or i.name
+    if i.identifier not in key_ids:
+        key_ids[i.identifier] = len(key_idents)
+        key_idents[key_ids[i.identifier]] = i.identifier
 
 _keymap_names = {
     "Window": ('EMPTY', 'WINDOW'),
@@ -343,7 +348,62 @@ def test_mods(event, mods):
     return encode_mods(event.ctrl, event.shift, event.alt, event.oskey) == mods
 
 
+# Packed hotkey: key id | key_mod id | ANY | mods (CTRL, SHIFT, ALT, OSKEY)
+# Ids are positions in the Event.type enum, 0 is 'NONE'.
+ANY = 1 << 4
+MOD_BITS = 5
+KEY_BITS = max(key_ids.values()).bit_length()
+KEY_MOD_MASK = ((1 << KEY_BITS) - 1) << MOD_BITS
+KEY_SHIFT = MOD_BITS + KEY_BITS
+
+
+def encode_hotkey(
+    key, ctrl=False, shift=False, alt=False, oskey=False, any=False, key_mod='NONE'
+):
+    """Pack a hotkey into an int. 0 if there is no key."""
+    key_id = key_ids.get(key, 0)
+    if not key_id:
+        return 0
+
+    return (
+        key_id << KEY_SHIFT
+        | key_ids.get(key_mod, 0) << MOD_BITS
+        | encode_mods(ctrl, shift, alt, oskey)
+        | (ANY if any else 0)
+    )
+
+
+def decode_hotkey(code):
+    """Return (key, ctrl, shift, alt, oskey, any, key_mod)."""
+    return (
+        key_idents.get(code >> KEY_SHIFT, 'NONE'),
+        bool(code & CTRL),
+        bool(code & SHIFT),
+        bool(code & ALT),
+        bool(code & OSKEY),
+        bool(code & ANY),
+        key_idents.get((code & KEY_MOD_MASK) >> MOD_BITS, 'NONE'),
+    )
+
+
+def hotkey_base(code):
+    """Key and modifiers of a packed hotkey, without key_mod and ANY."""
+    return code & ~(KEY_MOD_MASK | ANY)
+
+
+_parsed_hotkeys = {}
+_hotkey_strings = {}
+_ui_hotkeys = {}
+
+
 def parse_hotkey(hotkey):
+    ret = _parsed_hotkeys.get(hotkey)
+    if ret is None:
+        ret = _parsed_hotkeys[hotkey] = _parse_hotkey(hotkey)
+    return ret
+
+
+def _parse_hotkey(hotkey):
     hotkey, _, chord = hotkey.partition(",")
     chord = chord.strip() if chord else 'NONE'
     parts = hotkey.upper().split("+")
@@ -371,10 +431,9 @@ def parse_hotkey(hotkey):
     key_mod = 'NONE' if len(parts) == 1 else parts[0]
     key = parts[-1]
 
-    enum_items = Event.bl_rna.properties["type"].enum_items
-    if key_mod not in enum_items:
+    if key_mod not in key_names:
         key_mod = 'NONE'
-    if key not in enum_items:
+    if key not in key_names:
         key = 'NONE'
 
     return key, ctrl, shift, alt, oskey, any, key_mod, chord
@@ -415,7 +474,7 @@ def run_operator(context, key, ctrl, shift, alt, oskey, key_mod):
                 and kmi.alt == alt
                 and kmi.oskey == oskey
                 and kmi.key_modifier == key_mod
-                and kmi.idname != "pme.mouse_state"
+                and kmi.idname != PME_OT_mouse_btn_state.bl_idname
                 and kmi.idname != "wm.pme_user_pie_menu_call"
             ):
                 module, _, operator = kmi.idname.rpartition(".")
@@ -487,9 +546,25 @@ def to_hotkey(
     use_key_names=False,
     chord=None,
 ):
-    if not key or key == 'NONE':
+    return format_hotkey(
+        encode_hotkey(key, ctrl, shift, alt, oskey, any, key_mod or 'NONE'),
+        use_key_names,
+        chord,
+    )
+
+
+def format_hotkey(code, use_key_names=False, chord=None):
+    """Hotkey string of a packed hotkey (see to_hotkey)."""
+    if not code:
         return ""
 
+    cache_key = (code, use_key_names, chord)
+    ret = _hotkey_strings.get(cache_key)
+    if ret is not None:
+        return ret
+
+    key, ctrl, shift, alt, oskey, any, key_mod = decode_hotkey(code)
+
     hotkey = ""
     if any:
         hotkey += "any+"
@@ -502,53 +577,76 @@ def to_hotkey(
             hotkey += "alt+"
         if oskey:
             hotkey += "oskey+"
-    if key_mod and key_mod != 'NONE':
+    if key_mod != 'NONE':
         hotkey += key_names[key_mod] if use_key_names else key_mod
         hotkey += "+"
     hotkey += key_names[key] if use_key_names else key
     if chord:
         hotkey += ", " + chord
 
+    _hotkey_strings[cache_key] = hotkey
     return hotkey
 
 
 def to_ui_hotkey(data):
-    if not data.key or data.key == 'NONE':
+    code = encode_hotkey(
+        data.key, data.ctrl, data.shift, data.alt, data.oskey, data.any, data.key_mod
+    )
+    if not code:
         return ""
 
+    if hasattr(data, "open_mode"):
+        cache_key = (
+            code,
+            data.open_mode,
+            data.chord if data.open_mode == 'CHORDS' else None,
+            getattr(data, 'drag_dir', 'ANY') if data.open_mode == 'CLICK_DRAG' else None,
+        )
+    else:
+        cache_key = (code,)
+
+    ret = _ui_hotkeys.get(cache_key)
+    if ret is None:
+        ret = _ui_hotkeys[cache_key] = _format_ui_hotkey(*cache_key)
+    return ret
+
+
+def _format_ui_hotkey(code, open_mode=None, chord=None, drag_dir=None):
+    key, ctrl, shift, alt, oskey, any, key_mod = decode_hotkey(code)
+
     hotkey = ""
-    if data.any:
+    if any:
         hotkey += "?"
     else:
-        if data.ctrl:
+        if ctrl:
             hotkey += "c"
-        if data.shift:
+        if shift:
             hotkey += "s"
-        if data.alt:
+        if alt:
             hotkey += "a"
-        if data.oskey:
+        if oskey:
             hotkey += "o"
     if hotkey:
         hotkey += "+"
-    if data.key_mod and data.key_mod != 'NONE':
-        hotkey += "[%s]+" % key_names[data.key_mod]
-
-    if hasattr(data, "open_mode"):
-        if data.open_mode == 'PRESS':
-            hotkey += key_names[data.key]
-        elif data.open_mode == 'HOLD':
-            hotkey += "[%s]" % key_names[data.key]
-        elif data.open_mode == 'TWEAK':
-            hotkey += "{%s}" % key_names[data.key]
-        elif data.open_mode == 'DOUBLE_CLICK':
-            hotkey += "%sx2" % key_names[data.key]
-        elif data.open_mode == 'CHORDS':
-            hotkey += "%s, %s" % (key_names[data.key], key_names[data.chord])
-        elif data.open_mode == 'CLICK':
-            hotkey += "%s*" % key_names[data.key]
-        elif data.open_mode == 'CLICK_DRAG':
-            hotkey += "{%s}*" % key_names[data.key]
-            dir = getattr(data, 'drag_dir', 'ANY')
+    if key_mod != 'NONE':
+        hotkey += "[%s]+" % key_names[key_mod]
+
+    if open_mode:
+        if open_mode == 'PRESS':
+            hotkey += key_names[key]
+        elif open_mode == 'HOLD':
+            hotkey += "[%s]" % key_names[key]
+        elif open_mode == 'TWEAK':
+            hotkey += "{%s}" % key_names[key]
+        elif open_mode == 'DOUBLE_CLICK':
+            hotkey += "%sx2" % key_names[key]
+        elif open_mode == 'CHORDS':
+            hotkey += "%s, %s" % (key_names[key], key_names[chord])
+        elif open_mode == 'CLICK':
+            hotkey += "%s*" % key_names[key]
+        elif open_mode == 'CLICK_DRAG':
+            hotkey += "{%s}*" % key_names[key]
+            dir = drag_dir
             if dir and dir != 'ANY':
                 short = {
                     'NORTH': 'N', 'NORTH_EAST': 'NE', 'EAST': 'E', 'SOUTH_EAST': 'SE',
@@ -556,7 +654,7 @@ def to_ui_hotkey(data):
                 }.get(dir, dir)
                 hotkey += " " + short
     else:
-        hotkey += key_names[data.key]
+        hotkey += key_names[key]
 
     return hotkey
 
@@ -676,30 +774,6 @@ class KeymapHelper:
             any=any,
         )
 
-        if bl_class != PME_OT_key_state_init:
-            n = len(self.km.keymap_items)
-            i = n - 1
-            ms_items = []
-            keys = []
-            while (
-                i >= 1
-                and self.km.keymap_items[i - 1].idname
-                == PME_OT_key_state_init.bl_idname
-            ):
-                ms_item = self.km.keymap_items[i - 1]
-                ms_items.append(ms_item)
-                keys.append(ms_item.type)
-                i -= 1
-
-            if ms_items:
-                for ms_item in ms_items:
-                    self.km.keymap_items.remove(ms_item)
-
-                for key in keys:
-                    self.km.keymap_items.new(
-                        PME_OT_key_state_init.bl_idname, key, 'PRESS', 1, 1, 1, 1, 1
-                    ).properties.key = key
-
         self._add_item(self.km, item)
 
         for k, v in kwargs.items():
@@ -875,227 +949,39 @@ class Hotkey(DynamicPG):
         kmi.key_modifier = self.key_mod
 
 
-class PME_OT_mouse_state(Operator):
-    bl_idname = "pme.mouse_state"
-    bl_label = ""
-    bl_options = {'INTERNAL'}
-
-    inst = None
-
-    cancelled: BoolProperty(options={'SKIP_SAVE'})
-    key: StringProperty(options={'SKIP_SAVE'})
-
-    def stop(self):
-        self.cancelled = True
-        self.bl_timer = bpy.context.window_manager.event_timer_add(
-            0.1, window=bpy.context.window
-        )
-
-    def modal_stop(self, context):
-        if self.bl_timer:
-            context.window_manager.event_timer_remove(self.bl_timer)
-            self.bl_timer = None
-
-        if self.__class__.inst == self:
-            self.__class__.inst = None
-
-        return {'CANCELLED'}
-
-    def modal(self, context, event):
-        if event.type in TWEAKS:
-            update_mouse_state(self.key)
-            return {'PASS_THROUGH'}
-
-        if event.type == 'WINDOW_DEACTIVATE':
-            self.stop()
-            return {'PASS_THROUGH'}
-
-        if event.value == 'PRESS':
-            if event.type == 'ESC':
-                return {'CANCELLED'}
-            elif event.type != 'MOUSEMOVE' and event.type != 'INBETWEEN_MOUSEMOVE':
-                update_mouse_state(self.key)
-                return {'PASS_THROUGH'}
-
-        elif event.value == 'RELEASE':
-            if event.type == self.key or event.type == 'WINDOW_DEACTIVATE':
-                self.stop()
-
-                if to_system_mouse_key(self.key, context) == 'RIGHTMOUSE':
-                    self.key = 'NONE'
-                    return {'RUNNING_MODAL'}
-
-                self.key = 'NONE'
-
-        elif event.type == 'TIMER':
-            if self.cancelled:
-                return self.modal_stop(context)
-
-        return {'PASS_THROUGH'}
-
-    def invoke(self, context, event):
-        self.__class__.inst = self
-        context.window_manager.modal_handler_add(self)
-
-        return {'RUNNING_MODAL'}
-
-
-class PME_OT_mouse_state_wait(Operator):
-    bl_idname = "pme.mouse_state_wait"
-    bl_label = ""
-    bl_options = {'INTERNAL'}
-
-    inst = None
-
-    key: StringProperty(options={'SKIP_SAVE'})
-
-    def stop(self):
-        self.cancelled = True
-
-    def modal(self, context, event):
-        if event.type == 'ESC':
-            self.__class__.inst = None
-            return {'CANCELLED'}
-
-        if event.type == 'TIMER':
-            if self.cancelled:
-                self.__class__.inst = None
-                context.window_manager.event_timer_remove(self.bl_timer)
-                self.bl_timer = None
-                return {'CANCELLED'}
-
-            bpy.ops.pme.mouse_state('INVOKE_DEFAULT', key=self.key)
-            context.window_manager.event_timer_remove(self.bl_timer)
-            self.bl_timer = None
-            self.__class__.inst = None
-            return {'CANCELLED'}
-
-        return {'PASS_THROUGH'}
-
-    def invoke(self, context, event):
-        self.cancelled = False
-        context.window_manager.modal_handler_add(self)
-        self.bl_timer = context.window_manager.event_timer_add(
-            0.0001, window=context.window
-        )
-
-        self.__class__.inst = self
-        return {'RUNNING_MODAL'}
-
-
-class PME_OT_mouse_state_init(Operator):
-    bl_idname = "pme.mouse_state_init"
-    bl_label = "Mouse State (PME)"
-    bl_options = {'INTERNAL'}
-
-    key: StringProperty(options={'SKIP_SAVE'})
-
-    def invoke(self, context, event):
-        if PME_OT_mouse_state.inst:
-            if self.key != PME_OT_mouse_state.inst.key:
-                return {'PASS_THROUGH'}
-            PME_OT_mouse_state.inst.stop()
-        if PME_OT_mouse_state_wait.inst:
-            if self.key != PME_OT_mouse_state_wait.inst.key:
-                return {'PASS_THROUGH'}
-            PME_OT_mouse_state_wait.inst.stop()
-
-        bpy.ops.pme.mouse_state_wait('INVOKE_DEFAULT', key=self.key)
-        return {'PASS_THROUGH'}
-
-
-class PME_OT_key_state(Operator):
-    bl_idname = "pme.key_state"
-    bl_label = ""
-    bl_options = {'INTERNAL'}
-
-    inst = None
-
-    cancelled: BoolProperty(options={'SKIP_SAVE'})
-    key: StringProperty(options={'SKIP_SAVE'})
-
-    def stop(self):
-        self.cancelled = True
-
-    def modal_stop(self, context):
-        if self.bl_timer:
-            context.window_manager.event_timer_remove(self.bl_timer)
-            self.bl_timer = None
-
-        if self.__class__.inst == self:
-            self.__class__.inst = None
-
-        return {'CANCELLED'}
-
-    def modal(self, context, event):
-        # if event.type in TWEAKS:
-        #     update_mouse_state(self.key)
-        #     return {'PASS_THROUGH'}
-
-        if event.type == 'WINDOW_DEACTIVATE':
-            self.stop()
-            return {'PASS_THROUGH'}
-
-        if event.type == 'MOUSEMOVE' or event.type == 'INBETWEEN_MOUSEMOVE':
-            self.active = True
-            return {'PASS_THROUGH'}
-
-        # if event.value == 'PRESS':
-        #     if event.type == 'ESC':
-        #         return {'CANCELLED'}
-        #     # elif event.type == 'MOUSEMOVE' or \
-        #     #         event.type == 'INBETWEEN_MOUSEMOVE':
-        #     #     self.active = True
-        #     else:
-        #         update_mouse_state(self.key)
-        #         return {'PASS_THROUGH'}
-
-        if event.value == 'RELEASE':
-            if event.type == self.key:
-                self.stop()
-
-                # if to_system_mouse_key(self.key, context) == 'RIGHTMOUSE':
-                #     self.key = 'NONE'
-                #     return {'RUNNING_MODAL'}
-
-                self.key = 'NONE'
+class InputState:
+    """Held mouse button modifiers as a bitset of key_ids positions.
 
-        elif event.type == 'TIMER':
-            if self.cancelled:
-                return self.modal_stop(context)
+    Fed by the single PME_OT_mouse_btn_state handler, so any number of
+    tracked buttons cost one modal handler instead of one per key.
+    """
 
-            if not self.active:
-                bpy.ops.pme.key_state('INVOKE_DEFAULT', key=self.key)
-                return self.modal_stop(context)
-
-            context.window.cursor_warp(event.mouse_x, event.mouse_y)
-            self.active = False
+    def __init__(self):
+        self.bits = 0
 
-        return {'PASS_THROUGH'}
+    def clear(self):
+        self.bits = 0
 
-    def invoke(self, context, event):
-        self.active = True
-        self.__class__.inst = self
-        self.bl_timer = context.window_manager.event_timer_add(
-            0.01, window=bpy.context.window
-        )
-        context.window_manager.modal_handler_add(self)
+    def press(self, key):
+        idx = key_ids.get(key)
+        if idx:
+            self.bits |= 1 << idx
 
-        return {'RUNNING_MODAL'}
+    def release(self, key):
+        """Clear the key. Returns True if it was held."""
+        idx = key_ids.get(key)
+        if not idx or not self.bits >> idx & 1:
+            return False
 
+        self.bits &= ~(1 << idx)
+        return True
 
-class PME_OT_key_state_init(Operator):
-    bl_idname = "pme.key_state_init"
-    bl_label = "Key State Init (PME)"
-    bl_options = {'INTERNAL'}
+    def is_pressed(self, key):
+        idx = key_ids.get(key)
+        return bool(idx) and bool(self.bits >> idx & 1)
 
-    key: StringProperty(options={'SKIP_SAVE'})
 
-    def invoke(self, context, event):
-        if PME_OT_key_state.inst:
-            return {'PASS_THROUGH'}
-        bpy.ops.pme.key_state('INVOKE_DEFAULT', key=self.key)
-        return {'PASS_THROUGH'}
+input_state = InputState()
 
 
 class PME_OT_mouse_btn_state(Operator, CTU.HeadModalHandler):
@@ -1106,9 +992,24 @@ class PME_OT_mouse_btn_state(Operator, CTU.HeadModalHandler):
     inst = None
 
     def finish(self):
+        input_state.clear()
         self.__class__.inst = None
 
+    def modal(self, context, event):
+        if event.value == 'RELEASE' and input_state.release(event.type):
+            if not input_state.bits:
+                self.finished = True
+            return {'PASS_THROUGH'}
+
+        if event.type == 'WINDOW_DEACTIVATE':
+            input_state.clear()
+            self.finished = True
+
+        return CTU.HeadModalHandler.modal(self, context, event)
+
     def invoke(self, context, event):
+        input_state.press(self.key)
+
         cls = self.__class__
         if cls.inst:
             return {'PASS_THROUGH'}
@@ -1119,26 +1020,7 @@ class PME_OT_mouse_btn_state(Operator, CTU.HeadModalHandler):
 
 
 def is_key_pressed(key):
-    ret = PME_OT_mouse_btn_state.inst and PME_OT_mouse_btn_state.inst.key == key
-    # ret = PME_OT_key_state.inst and PME_OT_key_state.inst.key == key
-    return ret
-    # return PME_OT_mouse_state.inst and PME_OT_mouse_state.inst.key == key or \
-    #     PME_OT_mouse_state_wait.inst and \
-    #     PME_OT_mouse_state_wait.inst.key == key
-
-
-# def get_pressed_mouse_button():
-#     if PME_OT_mouse_state.inst:
-#         return PME_OT_mouse_state.inst.key
-#     if PME_OT_mouse_state_wait.inst:
-#         return PME_OT_mouse_state_wait.inst.key
-
-#     return None
-
-
-def update_mouse_state(key):
-    pass
-    # bpy.ops.pme.mouse_state_init('INVOKE_DEFAULT', key=key)
+    return input_state.is_pressed(key)
 
 
 added_mouse_buttons = dict()
@@ -1155,8 +1037,6 @@ def add_mouse_button(key, kh, km="Screen Editing"):
         kh.keymap(km)
         kh.operator(
             PME_OT_mouse_btn_state,
-            # PME_OT_key_state_init,
-            # PME_OT_mouse_state_init,
             None,
             key,
             1,
@@ -1307,6 +1187,32 @@ def mark_pressed(event):
     bpy.ops.pme.key_is_pressed('INVOKE_DEFAULT', key=event.type)
 
 
+_stack_predicates = {}
+
+
+def _stack_predicate(text):
+    """Compiled (prop, value) expressions of a 'prop = value' slot, or None."""
+    if text in _stack_predicates:
+        return _stack_predicates[text]
+
+    if len(_stack_predicates) > 512:
+        _stack_predicates.clear()
+
+    ret = None
+    prop, value = OU.find_statement(text)
+    if prop:
+        try:
+            ret = (
+                compile(prop, "<stack key>", "eval"),
+                compile(value, "<stack key>", "eval"),
+            )
+        except:
+            print_exc(text)
+
+    _stack_predicates[text] = ret
+    return ret
+
+
 class StackKey:
     name = None
     idx = -1
@@ -1328,29 +1234,27 @@ class StackKey:
             StackKey.idx = slot
             StackKey.count = 0
             StackKey.lo = None
-            StackKey.exec_globals.clear()
-            StackKey.exec_globals = pme.context.gen_globals()
+            pme.context.reset_globals(StackKey.exec_globals)
 
         elif StackKey.is_first:
-            prop = schema.parse(pm.data)
             StackKey.idx = 0
             StackKey.count = 0
             StackKey.lo = None
-            StackKey.exec_globals.clear()
-            StackKey.exec_globals = pme.context.gen_globals()
+            pme.context.reset_globals(StackKey.exec_globals)
 
             i = 0
             eglobals = StackKey.exec_globals
             while i < num_pmis:
-                if pm.pmis[i].mode != 'COMMAND':
+                pmi = pm.pmis[i]
+                if pmi.mode != 'COMMAND':
                     break
 
-                prop, value = OU.find_statement(pm.pmis[i].text)
-                if not prop:
+                predicate = _stack_predicate(pmi.text)
+                if not predicate:
                     break
 
                 try:
-                    if eval(prop, eglobals) != eval(value, eglobals):
+                    if eval(predicate[0], eglobals) != eval(predicate[1], eglobals):
                         break
                 except:
                     print_exc()
@@ -1378,8 +1282,7 @@ class StackKey:
         StackKey.idx = 0
         StackKey.count = 0
         StackKey.lo = None
-        StackKey.exec_globals.clear()
-        StackKey.exec_globals = pme.context.gen_globals()
+        pme.context.reset_globals(StackKey.exec_globals)
         StackKey.operator_mode = False
 
         return StackKey.cur_pm.pmis[0]
@@ -1499,3 +1402,8 @@ class StackKey:
 def register():
     pme.context.add_global("SK", StackKey)
     pme.context.add_global("call_operator", call_operator)
+
+
+def unregister():
+    input_state.clear()
+    PME_OT_mouse_btn_state.inst = None
@@ -5,6 +5,7 @@ import bpy
 
 LAYER = "operators"
 
+from ast import literal_eval
 from io import BytesIO
 from itertools import chain
 from tokenize import (
@@ -462,14 +463,136 @@ def _apply_properties(dct, key, value):
                 pass
 
 
+MAX_PLANS = 1024
+
+# Apply plan step kinds
+_CONST = 0
+_EXPR = 1
+_GROUP = 2
+
+
+def _plan_value(key, value):
+    if isinstance(value, dict):
+        return key, _GROUP, tuple(_plan_value(k, v) for k, v in value.items())
+    return key, _CONST, value
+
+
+def _plan_arg(arg):
+    key, _, value = arg.partition("=")
+    key = key.strip()
+    value = value.strip()
+
+    # Literals do not depend on globals, evaluate them once
+    try:
+        return _plan_value(key, literal_eval(value))
+    except Exception:
+        pass
+
+    try:
+        code = compile(value, "<string>", 'eval')
+    except Exception:
+        code = None
+    return key, _EXPR, (value, code)
+
+
+class ApplyPlan:
+    """Operator arguments of a slot compiled for apply_properties.
+
+    Literal values are evaluated when the plan is built and literal dicts
+    become groups of nested steps. Other expressions are compiled once and
+    evaluated on every apply, the globals are only generated if the plan
+    has any.
+    """
+
+    __slots__ = ("steps", "dynamic")
+
+    def __init__(self, args):
+        self.steps = tuple(_plan_arg(arg) for arg in args)
+        self.dynamic = any(self._has_expr(self.steps))
+
+    def _has_expr(self, steps):
+        for _, kind, payload in steps:
+            if kind == _EXPR:
+                yield True
+            elif kind == _GROUP:
+                yield from self._has_expr(payload)
+
+    @staticmethod
+    def _apply_steps(dct, steps, globals):
+        for key, kind, payload in steps:
+            if kind == _GROUP:
+                if key not in dct:
+                    dct[key] = dict()
+
+                d = getattr(dct, key, None)
+                if d is not None:
+                    ApplyPlan._apply_steps(d, payload, globals)
+                continue
+
+            if kind == _CONST:
+                value = payload
+            else:
+                text, code = payload
+                value = None
+                try:
+                    value = eval(code if code else text, globals)
+                except:
+                    print_exc(text)
+
+                if isinstance(value, dict):
+                    _apply_properties(dct, key, value)
+                    continue
+
+            if hasattr(dct, key):
+                try:
+                    setattr(dct, key, value)
+                except:
+                    pass
+
+    def apply(self, bl_rna_props, pm=None, pmi=None):
+        exec_globals = None
+        if self.dynamic:
+            exec_globals = pme.context.gen_globals()
+            exec_globals.update(menu=pm.name, slot=pmi.name)
+
+        self._apply_steps(bl_rna_props, self.steps, exec_globals)
+
+
+_plans = {}
+
+
+def get_apply_plan(args):
+    key = tuple(args)
+    plan = _plans.get(key)
+    if plan is None:
+        if len(_plans) >= MAX_PLANS:
+            _plans.clear()
+        plan = _plans[key] = ApplyPlan(args)
+    return plan
+
+
 def apply_properties(bl_rna_props, args, pm=None, pmi=None):
-    exec_globals = pme.context.gen_globals()
-    exec_globals.update(menu=pm.name, slot=pmi.name)
-    for arg in args:
-        key, _, value = arg.partition("=")
-        key = key.strip()
-        value = pme.context.eval(value.strip(), exec_globals)
-        _apply_properties(bl_rna_props, key, value)
+    get_apply_plan(args).apply(bl_rna_props, pm, pmi)
+
+
+_operator_plans = {}
+
+
+def get_operator_plan(text):
+    """Cached find_operator() with the arguments compiled to an ApplyPlan.
+
+    Returns (bl_idname, plan, pos_args), plan is None if text is not a
+    single operator call.
+    """
+    ret = _operator_plans.get(text)
+    if ret is None:
+        if len(_operator_plans) >= MAX_PLANS:
+            _operator_plans.clear()
+
+        bl_idname, args, pos_args = find_operator(text)
+        plan = ApplyPlan(args) if bl_idname else None
+        ret = _operator_plans[text] = (bl_idname, plan, tuple(pos_args or ()))
+    return ret
 
 
 def compare_operators(o1, o2):
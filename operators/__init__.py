@@ -16,6 +16,8 @@ import traceback
 from inspect import isclass
 from math import pi as PI
 from time import time
+from types import CodeType, FunctionType
+from typing import NamedTuple
 from ..addon import get_prefs, get_uprefs, temp_prefs, ADDON_PATH, print_exc, ic
 from ..bl_utils import (
     bl_context,
@@ -54,8 +56,10 @@ from ..infra.macro import execute_macro
 from ..infra.modal import decode_modal_data
 from .. import pme, operator_utils, keymap_helper
 from ..core.schema import schema
+from ..core.syntax import DESCRIPTION_PREFIX, compile_cache
 from ..ui import screen as SU
 from ..infra.property import PropertyData
+from ..infra.hotkey_index import hotkey_index
 from ..infra.io import get_user_scripts_dir
 from ..keymap_helper import (
     MOUSE_BUTTONS,
@@ -187,25 +191,98 @@ class WM_OT_pm_select(Operator):
 # PME_OT_pm_search_and_select moved to operators/search.py
 
 
+DESCRIPTION_TTL = 0.5
+
+
+class DescriptionCache:
+    """Compiled description expressions and their recent results.
+
+    Blender asks for a tooltip repeatedly while the cursor hovers a button.
+    Expressions are compiled once per text, results are reused for ttl
+    seconds, and each failing text is reported once. Keys are the
+    expression text, so editing a description invalidates its entry.
+    """
+
+    max_size = 512
+
+    def __init__(self, ttl=DESCRIPTION_TTL):
+        self.ttl = ttl
+        self.codes = {}
+        self.results = {}
+        self.reported = set()
+
+    def clear(self):
+        self.codes.clear()
+        self.results.clear()
+        self.reported.clear()
+
+    def _report(self, expr_text, error=None):
+        if expr_text in self.reported:
+            return
+
+        self.reported.add(expr_text)
+        if error is None:
+            print_exc(f"[PME] description_is_expr evaluation error: {expr_text[:50]}")
+        elif get_prefs().show_error_trace:
+            print(f"\n>>> [PME] description_is_expr syntax error: {expr_text[:50]}")
+            print(error.format())
+
+    def _get_code(self, expr_text):
+        if expr_text in self.codes:
+            return self.codes[expr_text]
+
+        if len(self.codes) >= self.max_size:
+            self.codes.clear()
+
+        code = None
+        module, error = compile_cache.compile(expr_text, 'exec', DESCRIPTION_PREFIX)
+        if error:
+            self._report(expr_text, error)
+        else:
+            for const in module.co_consts:
+                if isinstance(const, CodeType):
+                    code = const
+                    break
+
+        self.codes[expr_text] = code
+        return code
+
+    def evaluate(self, expr_text):
+        now = time()
+        entry = self.results.get(expr_text)
+        if entry and now - entry[0] < self.ttl:
+            return entry[1]
+
+        code = self._get_code(expr_text)
+        result = None
+        if code:
+            try:
+                value = FunctionType(code, pme.context.gen_globals())()
+                if value is not None:
+                    result = str(value)
+            except Exception:
+                self._report(expr_text)
+
+        if len(self.results) >= self.max_size:
+            self.results.clear()
+        self.results[expr_text] = (now, result)
+        return result
+
+
+description_cache = DescriptionCache()
+
+
 def _evaluate_description_expr(expr_text: str) -> str | None:
     """Evaluate description expression (return statement style).
 
     Like poll_cmd, uses 'return' statement.
     Returns None on error or if expression returns None.
+    Results are cached by description_cache.
 
     Example:
         ao = C.active_object; return f'{ao.name}' if ao else None
     """
-    exec_globals = pme.context.gen_globals()
-    try:
-        func_code = "def _get_desc():" + expr_text
-        code = compile(func_code, "<description>", "exec")
-        exec(code, exec_globals)
-        result = exec_globals["_get_desc"]()
-        return str(result) if result is not None else None
-    except Exception:
-        print_exc(f"[PME] description_is_expr evaluation error: {expr_text[:50]}")
-        return None
+    return description_cache.evaluate(expr_text)
 
 
 def _format_description_text(text: str) -> str:
@@ -308,6 +385,7 @@ class PME_OT_sticky_key_base:
     exec_globals = {}
     root_instance = None
     active_instance = None
+    restarting = False
     idx = 0
 
     pm_name: StringProperty(
@@ -318,88 +396,71 @@ class PME_OT_sticky_key_base:
     def is_root_instance(self):
         return self == self.root_instance
 
-    def add_timer(self, step=0):
-        if self.timer:
-            bpy.context.window_manager.event_timer_remove(self.timer)
-        self.timer = bpy.context.window_manager.event_timer_add(
-            step, window=bpy.context.window
-        )
-
-    def remove_timer(self):
-        if self.timer:
-            bpy.context.window_manager.event_timer_remove(self.timer)
-            self.timer = None
+    # State machine (no timer events):
+    #   HELD     root instance is running, optional child instances on top
+    #   RESTART  restart_flag is set; on the next event a child is invoked
+    #            so the handler sits above the ones added meanwhile
+    #   STOPPED  root.result is set and the release slot has run;
+    #            every instance finishes on its next event
 
     def stop(self, cancel=False):
+        root = self.root_instance
+        if not root or root.result:
+            return
+
         DBG_STICKY and logw("Stop %d" % self.idx)
-        self.result = {'CANCELLED'} if cancel else {'FINISHED'}
-        self.add_timer()
+        root.result = {'CANCELLED'} if cancel else {'FINISHED'}
+        if PME_OT_sticky_key.root_instance == root:
+            PME_OT_sticky_key.root_instance = None
+        self.execute_pmi(1)
 
     def restart(self):
         DBG_STICKY and logw("Restart %d" % self.idx)
         self.restart_flag = True
-        self.add_timer()
-
-    def modal(self, context, event):
-        if event.type == 'TIMER' and self.timer:
-            if self.result:
-                self.remove_timer()
-
-                if self.is_root_instance:
-                    PME_OT_sticky_key.root_instance = None
-                    self.execute_pmi(1)
-
-                self.root_instance = None
-
-                PME_OT_sticky_key.idx -= 1
-                return {'FINISHED'}
-
-            elif self.restart_flag:
-                self.remove_timer()
-                bpy.ops.pme.sticky_key('INVOKE_DEFAULT')
-                self.restart_flag = False
-
-                if self.is_root_instance:
-                    return {'PASS_THROUGH'}
 
-                PME_OT_sticky_key.idx -= 1
-                return {'FINISHED'}
-
-            return {'PASS_THROUGH'}
-
-        if event.type == 'WINDOW_DEACTIVATE':
-            self.stop(cancel=True)
+    def finish(self):
+        PME_OT_sticky_key.idx -= 1
+        self.root_instance = None
+        return {'FINISHED'} if self.block_ui else {'FINISHED', 'PASS_THROUGH'}
 
-        ret = {'RUNNING_MODAL'} if self.block_ui else {'PASS_THROUGH'}
+    def modal(self, context, event):
+        root = self.root_instance
+        if not root or root.result:
+            return self.finish()
 
         if not PME_OT_sticky_key.root_instance:
             DBG_STICKY and loge("BUG")
-            return ret
+            return self.finish()
 
+        finished = False
         if self.restart_flag:
-            return ret
+            PME_OT_sticky_key.restarting = True
+            bpy.ops.pme.sticky_key('INVOKE_DEFAULT', pm_name=root.pm_name)
+            PME_OT_sticky_key.restarting = False
+            self.restart_flag = False
+            finished = not self.is_root_instance
 
-        elif event.type == 'MOUSEMOVE' or event.type == 'INBETWEEN_MOUSEMOVE':
-            return ret
+        if event.type == 'WINDOW_DEACTIVATE':
+            self.stop(cancel=True)
 
-        if event.type == self.root_instance.key:
+        elif event.type == root.key:
             if event.value == 'RELEASE':
-                if self.root_instance:
-                    self.root_instance.stop()
                 self.stop()
-
             elif event.value == 'PRESS':
                 self.is_pressed = True
-                if self.root_instance and self.timer:
-                    self.remove_timer()
-
-            return ret
 
-        if not self.block_ui and event.value != 'ANY' and event.value != 'NOTHING':
+        elif (
+            not self.block_ui
+            and event.type not in {'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE'}
+            and event.value != 'ANY'
+            and event.value != 'NOTHING'
+        ):
             self.restart()
-            return ret
 
-        return ret
+        if finished or root.result:
+            return self.finish()
+
+        return {'RUNNING_MODAL'} if self.block_ui else {'PASS_THROUGH'}
 
     def execute_pmi(self, idx):
         try:
@@ -409,7 +470,7 @@ class PME_OT_sticky_key_base:
                 keymap_helper.run_operator_by_hotkey(bpy.context, pmi.text)
             elif pmi.mode == 'COMMAND':
                 if idx == 0:
-                    PME_OT_sticky_key.exec_globals = pme.context.gen_globals()
+                    pme.context.reset_globals(PME_OT_sticky_key.exec_globals)
 
                 PME_OT_sticky_key.exec_globals.update(menu=pm.name, slot=pmi.name)
                 # pme.context.exec_globals = PME_OT_sticky_key.exec_globals
@@ -434,7 +495,7 @@ class PME_OT_sticky_key_base:
             self.key = event.type
         else:
             if (
-                not PME_OT_sticky_key.root_instance.restart_flag
+                not PME_OT_sticky_key.restarting
                 and event.value == 'PRESS'
                 and event.type == PME_OT_sticky_key.root_instance.key
             ):
@@ -445,7 +506,6 @@ class PME_OT_sticky_key_base:
         self.block_ui = prop.sk_block_ui
         self.restart_flag = False
         self.result = None
-        self.timer = None
         self.is_pressed = True
         self.idx = PME_OT_sticky_key.idx
         PME_OT_sticky_key.idx += 1
@@ -459,9 +519,6 @@ class PME_OT_sticky_key_base:
             self.execute_pmi(0)
             if "return_value" in PME_OT_sticky_key.exec_globals:
                 ret = PME_OT_sticky_key.exec_globals["return_value"]
-        else:
-            # self.is_pressed = False
-            self.add_timer(0.02)
 
         if 'RUNNING_MODAL' in ret:
             context.window_manager.modal_handler_add(self)
@@ -1186,6 +1243,53 @@ class PME_OT_restore_pie_radius(Operator):
         return {'RUNNING_MODAL'}
 
 
+class PieProfile(NamedTuple):
+    """Invocation settings of a menu resolved from pm.data.
+
+    radius/confirm/threshold are -1 when the user preferences value is used.
+    """
+
+    name: str
+    mode: str
+    radius: int
+    confirm: int
+    threshold: int
+    flick: bool
+    open_mode: str
+    chord: str
+
+
+_pie_profiles = {}
+
+
+def get_pie_profile(pm):
+    """Return the cached PieProfile of the menu.
+
+    The cache entry is rebuilt when pm.data, open_mode or chord change.
+    """
+    key = (pm.mode, pm.data, pm.open_mode, pm.chord)
+    entry = _pie_profiles.get(pm.name)
+    if entry and entry[0] == key:
+        return entry[1]
+
+    mode, data, open_mode, chord = key
+    radius = confirm = threshold = -1
+    flick = True
+    if mode == 'PMENU':
+        prop = schema.parse(data)
+        flick = bool(prop.pm_flick)
+        radius = int(prop.pm_radius)
+        if flick:
+            confirm = int(prop.pm_confirm)
+            threshold = int(prop.pm_threshold)
+
+    profile = PieProfile(
+        pm.name, mode, radius, confirm, threshold, flick, open_mode, chord
+    )
+    _pie_profiles[pm.name] = (key, profile)
+    return profile
+
+
 class WM_OT_pme_user_pie_menu_call(Operator):
     bl_idname = "wm.pme_user_pie_menu_call"
     bl_label = "Call Menu (PME)"
@@ -1251,7 +1355,7 @@ class WM_OT_pme_user_pie_menu_call(Operator):
             lh.operator(WM_OT_pme_none.bl_idname, text, icon, emboss=False)
 
         elif pmi.mode == 'COMMAND':
-            op_bl_idname, args, pos_args = operator_utils.find_operator(pmi.text)
+            op_bl_idname, plan, pos_args = operator_utils.get_operator_plan(pmi.text)
 
             if op_bl_idname and not pos_args:
                 # for i, arg in enumerate(args):
@@ -1263,7 +1367,7 @@ class WM_OT_pme_user_pie_menu_call(Operator):
                 try:
                     exec("str(bpy.ops.%s.idname)" % op_bl_idname)
                     p = lh.operator(op_bl_idname, text, icon)
-                    operator_utils.apply_properties(p, args, pm, pmi)
+                    plan.apply(p, pm, pmi)
                 except:
                     msg = U.format_exception(0)
                     if msg.startswith("AttributeError: _bpy.ops.as_string: operator"):
@@ -1579,13 +1683,9 @@ class WM_OT_pme_user_pie_menu_call(Operator):
         return True
 
     def modal(self, context, event):
-        pr = get_prefs()
-        pm = pr.pie_menus[self.pie_menu_name]
-
-        if pm.mode == 'PMENU' and not pm.get_data("pm_flick"):
-            ret = {'PASS_THROUGH'}
-        else:
-            ret = {'RUNNING_MODAL'}
+        profile = self.profile
+        hold_pie = profile.mode == 'PMENU' and not profile.flick
+        ret = {'PASS_THROUGH'} if hold_pie else {'RUNNING_MODAL'}
 
         DBG_PM and event.type == 'TIMER' and logi("MODAL TIMER, id:", id(self), "cancelled:", self.cancelled)
 
@@ -1597,43 +1697,40 @@ class WM_OT_pme_user_pie_menu_call(Operator):
                 and not self.cancelled
                 and event.type not in {'MOUSEMOVE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}
             ):
-                for v in self.chord_pms:
-                    if v.chord == event.type:
-                        DBG_PM and logh("=== CHORD MATCHED ===")
-                        DBG_PM and logi("Stopping modal for:", self.pie_menu_name)
-                        DBG_PM and logi("Calling menu:", v.name)
-                        DBG_PM and logi("Active ops before:", list(self.__class__.active_ops.keys()))
-
-                        self.modal_stop()
-                        if pr.use_chord_hint:
-                            area_header_text_set()
-
-                        DBG_PM and logi("Scheduling delayed execution via timeout")
-                        menu_name_escaped = v.name.replace("\\", "\\\\").replace("'", "\\'")
-                        bpy.ops.pme.timeout(
-                            'INVOKE_DEFAULT',
-                            delay=0.0001,
-                            cmd=f"bpy.ops.wm.pme_user_pie_menu_call('INVOKE_DEFAULT', pie_menu_name='{menu_name_escaped}')"
-                        )
-                        DBG_PM and logi("After scheduling, active ops:", list(self.__class__.active_ops.keys()))
-                        DBG_PM and logi("=== RETURNING CANCELLED ===")
-                        return {'CANCELLED'}
-                else:
+                name = self.chord_names.get(event.type)
+                if name is None:
                     self.cancelled = True
-                    if pr.use_chord_hint:
+                    if self.use_chord_hint:
                         area_header_text_set()
 
                     return {'PASS_THROUGH'}
 
+                DBG_PM and logh("=== CHORD MATCHED ===")
+                DBG_PM and logi("Stopping modal for:", self.pie_menu_name)
+                DBG_PM and logi("Calling menu:", name)
+                DBG_PM and logi("Active ops before:", list(self.__class__.active_ops.keys()))
+
+                self.modal_stop()
+                if self.use_chord_hint:
+                    area_header_text_set()
+
+                DBG_PM and logi("Scheduling delayed execution via timeout")
+                menu_name_escaped = name.replace("\\", "\\\\").replace("'", "\\'")
+                bpy.ops.pme.timeout(
+                    'INVOKE_DEFAULT',
+                    delay=0.0001,
+                    cmd=f"bpy.ops.wm.pme_user_pie_menu_call('INVOKE_DEFAULT', pie_menu_name='{menu_name_escaped}')"
+                )
+                DBG_PM and logi("After scheduling, active ops:", list(self.__class__.active_ops.keys()))
+                DBG_PM and logi("=== RETURNING CANCELLED ===")
+                return {'CANCELLED'}
+
             if (
                 self.pm_tweak
                 and event.type == 'MOUSEMOVE'
                 and self.invoke_mode == 'HOTKEY'
             ):
-                tt = getattr(
-                    get_uprefs().inputs,
-                    "drag_threshold",
-                )
+                tt = self.drag_threshold
                 if abs(self.x - event.mouse_x) > tt or abs(self.y - event.mouse_y) > tt:
                     self.modal_stop()
                     self.executed = True
@@ -1671,9 +1768,7 @@ class WM_OT_pme_user_pie_menu_call(Operator):
                         )
                 else:
                     DBG_PM and logi("HOLD - DEFAULT", self)
-                    keymap_helper.run_operator(
-                        context, pm.key, pm.ctrl, pm.shift, pm.alt, pm.oskey, pm.key_mod
-                    )
+                    keymap_helper.run_operator(context, *self.hotkey)
 
                 self.hold_timer = None
                 self.__class__.hold_inst = None
@@ -1690,7 +1785,7 @@ class WM_OT_pme_user_pie_menu_call(Operator):
                 or self.chord_timer.update()
             ):
                 self.chord_timer = None
-                if pr.use_chord_hint:
+                if self.use_chord_hint:
                     area_header_text_set()
 
                 # CHORDSタイムアウト時にpm_pressメニューを呼び出す
@@ -1755,15 +1850,7 @@ class WM_OT_pme_user_pie_menu_call(Operator):
                     self.pm_timer = None
                 return self.modal_stop()
 
-        if (
-            pm.mode == 'PMENU'
-            and not schema.parse(pm.data).pm_flick
-            and (
-                self.invoke_mode == 'HOTKEY'
-                or self.invoke_mode == 'HOLD'
-                or self.invoke_mode == 'TWEAK'
-            )
-        ):
+        if hold_pie and self.invoke_mode in {'HOTKEY', 'HOLD', 'TWEAK'}:
             return {'RUNNING_MODAL'}
 
         return ret
@@ -1819,20 +1906,22 @@ class WM_OT_pme_user_pie_menu_call(Operator):
         DBG_PM and logi("invoke_mode:", self.invoke_mode)
 
         if pm.mode == 'PMENU':
-            flick = schema.parse(pm.data).pm_flick
+            profile = self.profile = get_pie_profile(pm)
+            flick = profile.flick
             view = get_uprefs().view
             if context.space_data:
-                prop = schema.parse(pm.data)
-                radius = int(prop.pm_radius)
-                confirm = int(prop.pm_confirm)
-                threshold = int(prop.pm_threshold)
-
-                if not flick:
-                    confirm = -1
-                    threshold = -1
+                radius = profile.radius
+                confirm = profile.confirm
+                threshold = profile.threshold
 
+                # Resolve defaults from the saved values, the view may still
+                # hold another menu's settings waiting to be restored
+                pr_radius = pr.pie_menu_radius
                 if radius == -1:
-                    radius = view.pie_menu_radius
+                    radius = (
+                        pr_radius.radius if pr_radius.is_saved
+                        else view.pie_menu_radius
+                    )
                 if confirm == -1:
                     confirm = pr.pie_menu_prefs.confirm
                 if threshold == -1:
@@ -1840,20 +1929,23 @@ class WM_OT_pme_user_pie_menu_call(Operator):
 
                 self.restore_radius = False
                 if view.pie_menu_radius != radius:
-                    pr.pie_menu_radius.save()
+                    pr_radius.save()
                     self.restore_radius = True
-                    view.pie_animation_timeout = 0
+                    if view.pie_animation_timeout:
+                        view.pie_animation_timeout = 0
                     view.pie_menu_radius = radius
 
                 restore_prefs = False
-                if self.invoke_mode == 'HOTKEY' and (
-                    view.pie_menu_confirm != confirm
-                    or view.pie_menu_threshold != threshold
-                ):
-                    pr.pie_menu_prefs.save()
-                    view.pie_menu_confirm = confirm
-                    view.pie_menu_threshold = threshold
-                    restore_prefs = True
+                if self.invoke_mode == 'HOTKEY':
+                    view_confirm = view.pie_menu_confirm
+                    view_threshold = view.pie_menu_threshold
+                    if view_confirm != confirm or view_threshold != threshold:
+                        pr.pie_menu_prefs.save()
+                        if view_confirm != confirm:
+                            view.pie_menu_confirm = confirm
+                        if view_threshold != threshold:
+                            view.pie_menu_threshold = threshold
+                        restore_prefs = True
 
             DBG_PM and logi("SHOW", self)
             wm.popup_menu_pie(
@@ -1927,25 +2019,21 @@ class WM_OT_pme_user_pie_menu_call(Operator):
             self.pm_press = pm
         elif pm.open_mode == 'CHORDS':
             self.pm_chord = pm
-            self.chord_pms = []
-            for v in get_prefs().pie_menus:
-                if (
-                    v.chord
-                    and keymap_helper.compare_km_names(self.keymap, v.km_name)
-                    and v.open_mode == 'CHORDS'
-                    and v.chord != 'NONE'
-                    and pm.key == v.key
-                    and pm.any == v.any
-                    and pm.ctrl == v.ctrl
-                    and pm.shift == v.shift
-                    and pm.alt == v.alt
-                    and pm.oskey == v.oskey
-                ):
-                    self.chord_pms.append(v)
+            self.chord_pms = hotkey_index.chord_menus(pm, self.keymap)
+            self.chord_names = {}
+            for v in self.chord_pms:
+                self.chord_names.setdefault(v.chord, v.name)
 
         elif pm.open_mode in {'TWEAK', 'CLICK_DRAG'} and self.invoke_mode == 'HOTKEY':
             self.pm_tweak = pm
 
+    def _snapshot_inputs(self, pr, pm):
+        """Read everything modal() needs once, instead of on every event."""
+        self.profile = get_pie_profile(pm)
+        self.drag_threshold = get_uprefs().inputs.drag_threshold
+        self.use_chord_hint = pr.use_chord_hint
+        self.hotkey = (pm.key, pm.ctrl, pm.shift, pm.alt, pm.oskey, pm.key_mod)
+
     def invoke(self, context, event):
         pr = get_prefs()
         pme.context.last_operator = self
@@ -1963,6 +2051,7 @@ class WM_OT_pme_user_pie_menu_call(Operator):
         pme.context.pm = cpm
 
         self.bl_timer = None
+        self.profile = None
         self.pm_press, self.pm_hold, self.pm_tweak, self.pm_chord = (
             None,
             None,
@@ -1983,22 +2072,8 @@ class WM_OT_pme_user_pie_menu_call(Operator):
         self.mouse_x, self.mouse_y = event.mouse_x, event.mouse_y
 
         if self.invoke_mode == 'HOTKEY' and cpm.key_mod == 'NONE':
-            cpm_key = keymap_helper.to_system_mouse_key(cpm.key, context)
-            for pm in reversed(pr.pie_menus):
-                if pm == cpm:
-                    continue
-
-                pm_key = keymap_helper.to_system_mouse_key(pm.key, context)
-                if (
-                    pm.enabled
-                    and pm_key == cpm_key
-                    and pm.ctrl == cpm.ctrl
-                    and pm.shift == cpm.shift
-                    and pm.alt == cpm.alt
-                    and pm.oskey == cpm.oskey
-                    and pm.key_mod in MOUSE_BUTTONS
-                    and is_key_pressed(pm.key_mod)
-                ):
+            for pm in reversed(hotkey_index.mouse_mod_menus(cpm, context)):
+                if is_key_pressed(pm.key_mod):
                     self.pie_menu_name = pm.name
                     cpm = pm
                     break
@@ -2034,20 +2109,8 @@ class WM_OT_pme_user_pie_menu_call(Operator):
         self._parse_open_mode(cpm)
 
         if self.invoke_mode == 'HOTKEY':
-            for pm in pr.pie_menus:
-                if (
-                    pm != cpm
-                    and pm.enabled
-                    and keymap_helper.compare_km_names(self.keymap, pm.km_name)
-                    and pm.key == cpm.key
-                    and pm.ctrl == cpm.ctrl
-                    and pm.shift == cpm.shift
-                    and pm.alt == cpm.alt
-                    and pm.oskey == cpm.oskey
-                    and pm.key_mod == cpm.key_mod
-                    and pm.open_mode != cpm.open_mode
-                ):
-                    self._parse_open_mode(pm)
+            for pm in hotkey_index.open_mode_menus(cpm, self.keymap):
+                self._parse_open_mode(pm)
 
         if cpm.mode == 'PMENU' and pr.restore_mouse_pos:
             should_restore_mouse = (
@@ -2100,6 +2163,7 @@ class WM_OT_pme_user_pie_menu_call(Operator):
 
         self.x = event.mouse_x
         self.y = event.mouse_y
+        self._snapshot_inputs(pr, cpm)
 
         if self.invoke_mode == 'HOTKEY':
             DBG_PM and logi("Mode: HOTKEY, open_mode:", cpm.open_mode)
@@ -30,6 +30,8 @@ from ...infra.collections import (
     RemoveItemOperator,
 )
 from ...infra.debug import DBG_CMD_EDITOR
+from ...infra import syntax_check
+from ...infra.menu_search import menu_search
 from ...ui import tag_redraw, shorten_str, gen_prop_name, gen_op_name, find_enum_args
 from ...ui import screen as SU
 from ...ui.layout import lh
@@ -153,6 +155,7 @@ def _edit_pmi(operator, text, event):
 
     if ed:
         ed.on_pmi_edit(pm, pmi)
+    menu_search.invalidate(pm.name)
 
     pr.update_tree()
 
@@ -517,6 +520,7 @@ class PME_OT_pmi_add(AddItemOperator, Operator):
         ed = pm.ed
         if ed:
             ed.on_pmi_add(pm, item)
+        menu_search.invalidate(pm.name)
 
         tag_redraw()
 
@@ -558,6 +562,7 @@ class PME_OT_pmi_remove(RemoveItemOperator, Operator):
         ed = pm.ed
         if ed:
             ed.on_pmi_remove(pm)
+        menu_search.invalidate(pm.name)
 
         pr.update_tree()
         tag_redraw()
@@ -589,6 +594,7 @@ class PME_OT_pmi_clear(ConfirmBoxHandler, Operator):
         ed = pm.ed
         if ed:
             ed.on_pmi_remove(pm)
+        menu_search.invalidate(pm.name)
 
         pr.update_tree()
         tag_redraw()
@@ -662,6 +668,10 @@ class WM_OT_pmi_data_edit(Operator):
         pr = get_prefs()
         tpr = temp_prefs()
 
+        # Background syntax checks must land before the item is saved
+        if self.ok and pr.mode == 'PMI' and syntax_check.wait():
+            pr.pmi_data.check_pmi_errors(context)
+
         if self.hotkey:
             if pr.mode != 'PMI' or self.ok and pr.pmi_data.has_errors():
                 return {'PASS_THROUGH'}
@@ -730,6 +740,7 @@ class WM_OT_pmi_data_edit(Operator):
             ed = pm.ed
             if ed:
                 ed.on_pmi_edit(pm, pmi)
+            menu_search.invalidate(pm.name)
 
             pr.update_tree()
 
@@ -805,6 +816,7 @@ class PME_OT_pmi_paste(Operator):
         ed = pm.ed
         if ed:
             ed.on_pmi_paste(pm, pmi)
+        menu_search.invalidate(pm.name)
 
         pr.update_tree()
         tag_redraw()
@@ -12,9 +12,10 @@ from ...addon import get_prefs, temp_prefs, ic_rb, ic
 from ...core.constants import ICON_OFF, ICON_ON, UNTAGGED
 from ...bl_utils import uname
 from ...infra.collections import sort_collection
-from ...ui import tag_redraw
+from ...infra.tag_index import tag_index
+from ...infra import invalidation as INV
+from ...infra.invalidation import invalidation
 from ...ui.layout import operator
-from ...pme_types import Tag
 
 
 class PME_OT_tags_filter(Operator):
@@ -65,9 +66,7 @@ class PME_OT_tags_filter(Operator):
         else:
             pr = get_prefs()
             pr.tag_filter = self.tag
-            Tag.filter()
-            pr.update_tree()
-            tag_redraw()
+            invalidation.invalidate(INV.TAGS, INV.TREE, INV.REDRAW)
 
         return {'FINISHED'}
 
@@ -181,15 +180,13 @@ class PME_OT_tags(Operator):
                 return {'CANCELLED'}
 
             self.tag = uname(tpr.tags, self.tag)
-            for pm in pr.pie_menus:
-                if pm.has_tag(tag.name):
-                    pm.remove_tag(tag.name)
-                    pm.add_tag(self.tag)
+            for name in list(tag_index.menus(tag.name)):
+                pm = pr.pie_menus[name]
+                pm.remove_tag(tag.name)
+                pm.add_tag(self.tag)
             tag.name = self.tag
 
-        Tag.filter()
-        pr.update_tree()
-        tag_redraw()
+        invalidation.invalidate(INV.TAGS, INV.TREE, INV.REDRAW)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -225,8 +222,8 @@ class PME_OT_tags(Operator):
                     self.draw_menu, title="Remove Tag", icon='REMOVE'
                 )
             else:
-                for pm in pr.pie_menus:
-                    pm.remove_tag(tag.name)
+                for name in list(tag_index.menus(tag.name)):
+                    pr.pie_menus[name].remove_tag(tag.name)
                 tpr.tags.remove(self.idx)
 
         elif self.action == 'TAG':
@@ -255,7 +252,5 @@ class PME_OT_tags(Operator):
                 else:
                     pm.remove_tag(tag.name)
 
-        Tag.filter()
-        pr.update_tree()
-        tag_redraw()
+        invalidation.invalidate(INV.TAGS, INV.TREE, INV.REDRAW)
         return {'FINISHED'}
@@ -177,82 +177,6 @@ class PME_OT_sidearea_toggle(Operator):
             "effective_dpi": effective_dpi,
         }
 
-    @classmethod
-    def _learn_gap_patterns_horizontal(cls, areas):
-        """Learn horizontal gap patterns from current area layout."""
-        if len(areas) < 2:
-            return None
-
-        horizontal_gaps = []
-
-        for i, area_a in enumerate(areas):
-            for j, area_b in enumerate(areas):
-                if i >= j:
-                    continue
-
-                if (
-                    abs(area_a.height - area_b.height) <= 5
-                    and abs(area_a.y - area_b.y) <= 5
-                ):
-                    if area_a.x < area_b.x:
-                        gap = area_b.x - (area_a.x + area_a.width)
-                    else:
-                        gap = area_a.x - (area_b.x + area_b.width)
-
-                    if 0 < gap < 50:
-                        horizontal_gaps.append(gap)
-
-        if horizontal_gaps:
-            h_gaps = sorted(horizontal_gaps)
-            return {
-                "gaps": h_gaps,
-                "median": h_gaps[len(h_gaps) // 2],
-                "mean": sum(h_gaps) / len(h_gaps),
-                "min": min(h_gaps),
-                "max": max(h_gaps),
-                "count": len(h_gaps),
-            }
-
-        return None
-
-    @classmethod
-    def _learn_gap_patterns_vertical(cls, areas):
-        """Learn vertical gap patterns from current area layout."""
-        if len(areas) < 2:
-            return None
-
-        vertical_gaps = []
-
-        for i, area_a in enumerate(areas):
-            for j, area_b in enumerate(areas):
-                if i >= j:
-                    continue
-
-                width_match = abs(area_a.width - area_b.width) <= 5
-                x_match = abs(area_a.x - area_b.x) <= 5
-
-                if width_match and x_match:
-                    if area_a.y < area_b.y:
-                        gap = area_b.y - (area_a.y + area_a.height)
-                    else:
-                        gap = area_a.y - (area_b.y + area_b.height)
-
-                    if 0 < gap < 50:
-                        vertical_gaps.append(gap)
-
-        if vertical_gaps:
-            v_gaps = sorted(vertical_gaps)
-            return {
-                "gaps": v_gaps,
-                "median": v_gaps[len(v_gaps) // 2],
-                "mean": sum(v_gaps) / len(v_gaps),
-                "min": min(v_gaps),
-                "max": max(v_gaps),
-                "count": len(v_gaps),
-            }
-
-        return None
-
     @classmethod
     def _get_cached_tolerance(cls):
         """Fallback tolerance calculation."""
@@ -267,40 +191,9 @@ class PME_OT_sidearea_toggle(Operator):
             return {"tolerance": 2.0, "expected_gap": 2.0}
 
     @classmethod
-    def _get_adaptive_tolerance_horizontal(cls, areas):
-        """Calculate adaptive tolerance based on learned horizontal gap patterns."""
-        gap_pattern = cls._learn_gap_patterns_horizontal(areas)
-
-        if not gap_pattern:
-            cached = cls._get_cached_tolerance()
-            return {
-                "tolerance": cached["tolerance"],
-                "expected_gap": cached["expected_gap"],
-                "method": "fallback",
-            }
-
-        expected_gap = gap_pattern["median"]
-        gap_range = gap_pattern["max"] - gap_pattern["min"]
-        if gap_range > 0:
-            adaptive_tolerance = gap_range * 0.5 + 1.0
-        else:
-            adaptive_tolerance = expected_gap * 0.5 + 1.0
-        min_tolerance = 0.5
-        max_tolerance = expected_gap * 2.0
-        final_tolerance = max(min_tolerance, min(adaptive_tolerance, max_tolerance))
-
-        return {
-            "tolerance": final_tolerance,
-            "expected_gap": expected_gap,
-            "gap_pattern": gap_pattern,
-            "method": "adaptive_learning",
-        }
-
-    @classmethod
-    def _get_adaptive_tolerance_vertical(cls, areas):
-        """Calculate adaptive tolerance based on learned vertical gap patterns."""
-        gap_pattern = cls._learn_gap_patterns_vertical(areas)
-
+    def _get_adaptive_tolerance(cls, gap_pattern):
+        """Calculate adaptive tolerance based on gap patterns learned by the
+        screen layout index."""
         if not gap_pattern:
             cached = cls._get_cached_tolerance()
             return {
@@ -339,8 +232,8 @@ class PME_OT_sidearea_toggle(Operator):
 
     def get_horizontal_areas(self, area):
         """Detect adjacent left/right areas using adaptive horizontal gap learning."""
-        all_areas = list(bpy.context.screen.areas)
-        tol_info = self._get_adaptive_tolerance_horizontal(all_areas)
+        layout = SU.get_screen_layout(area.id_data)
+        tol_info = self._get_adaptive_tolerance(layout.h_gap_pattern)
         expected_gap = tol_info["expected_gap"]
         tolerance = tol_info["tolerance"]
         max_search_gap = expected_gap * 3
@@ -352,34 +245,32 @@ class PME_OT_sidearea_toggle(Operator):
         best_right = None
         best_right_gap = float("inf")
 
-        for candidate_area in all_areas:
-            if candidate_area == area or candidate_area.ui_type in self.ia:
+        # Row neighbours already share y and height with the area
+        for candidate_area in layout.row_neighbours(area):
+            if candidate_area.ui_type in self.ia:
                 continue
-            height_match = abs(candidate_area.height - area.height) <= 5
-            y_match = abs(candidate_area.y - area.y) <= 5
-
-            if height_match and y_match:
-                left_gap = area.x - (candidate_area.x + candidate_area.width)
-                if not left_area and abs(left_gap - expected_gap) <= tolerance:
-                    left_area = candidate_area
-                elif (
-                    not left_area
-                    and 0 < left_gap <= max_search_gap
-                    and left_gap < best_left_gap
-                ):
-                    best_left = candidate_area
-                    best_left_gap = left_gap
-
-                right_gap = candidate_area.x - (area.x + area.width)
-                if not right_area and abs(right_gap - expected_gap) <= tolerance:
-                    right_area = candidate_area
-                elif (
-                    not right_area
-                    and 0 < right_gap <= max_search_gap
-                    and right_gap < best_right_gap
-                ):
-                    best_right = candidate_area
-                    best_right_gap = right_gap
+
+            left_gap = area.x - (candidate_area.x + candidate_area.width)
+            if not left_area and abs(left_gap - expected_gap) <= tolerance:
+                left_area = candidate_area
+            elif (
+                not left_area
+                and 0 < left_gap <= max_search_gap
+                and left_gap < best_left_gap
+            ):
+                best_left = candidate_area
+                best_left_gap = left_gap
+
+            right_gap = candidate_area.x - (area.x + area.width)
+            if not right_area and abs(right_gap - expected_gap) <= tolerance:
+                right_area = candidate_area
+            elif (
+                not right_area
+                and 0 < right_gap <= max_search_gap
+                and right_gap < best_right_gap
+            ):
+                best_right = candidate_area
+                best_right_gap = right_gap
 
             if left_area and right_area:
                 break
@@ -392,8 +283,8 @@ class PME_OT_sidearea_toggle(Operator):
 
     def get_vertical_areas(self, area):
         """Detect adjacent top/bottom areas using adaptive vertical gap learning."""
-        all_areas = list(bpy.context.screen.areas)
-        tol_info = self._get_adaptive_tolerance_vertical(all_areas)
+        layout = SU.get_screen_layout(area.id_data)
+        tol_info = self._get_adaptive_tolerance(layout.v_gap_pattern)
         expected_gap = tol_info["expected_gap"]
         tolerance = tol_info["tolerance"]
         max_search_gap = expected_gap * 3
@@ -405,35 +296,32 @@ class PME_OT_sidearea_toggle(Operator):
         best_bottom = None
         best_bottom_gap = float("inf")
 
-        for candidate_area in all_areas:
-            if candidate_area == area or candidate_area.ui_type in self.ia:
+        # Column neighbours already share x and width with the area
+        for candidate_area in layout.col_neighbours(area):
+            if candidate_area.ui_type in self.ia:
                 continue
 
-            width_match = abs(candidate_area.width - area.width) <= 5
-            x_match = abs(candidate_area.x - area.x) <= 5
-
-            if width_match and x_match:
-                bottom_gap = area.y - (candidate_area.y + candidate_area.height)
-                if not bottom_area and abs(bottom_gap - expected_gap) <= tolerance:
-                    bottom_area = candidate_area
-                elif (
-                    not bottom_area
-                    and 0 < bottom_gap <= max_search_gap
-                    and bottom_gap < best_bottom_gap
-                ):
-                    best_bottom = candidate_area
-                    best_bottom_gap = bottom_gap
-
-                top_gap = candidate_area.y - (area.y + area.height)
-                if not top_area and abs(top_gap - expected_gap) <= tolerance:
-                    top_area = candidate_area
-                elif (
-                    not top_area
-                    and 0 < top_gap <= max_search_gap
-                    and top_gap < best_top_gap
-                ):
-                    best_top = candidate_area
-                    best_top_gap = top_gap
+            bottom_gap = area.y - (candidate_area.y + candidate_area.height)
+            if not bottom_area and abs(bottom_gap - expected_gap) <= tolerance:
+                bottom_area = candidate_area
+            elif (
+                not bottom_area
+                and 0 < bottom_gap <= max_search_gap
+                and bottom_gap < best_bottom_gap
+            ):
+                best_bottom = candidate_area
+                best_bottom_gap = bottom_gap
+
+            top_gap = candidate_area.y - (area.y + area.height)
+            if not top_area and abs(top_gap - expected_gap) <= tolerance:
+                top_area = candidate_area
+            elif (
+                not top_area
+                and 0 < top_gap <= max_search_gap
+                and top_gap < best_top_gap
+            ):
+                best_top = candidate_area
+                best_top_gap = top_gap
 
             if top_area and bottom_area:
                 break
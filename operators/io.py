@@ -25,7 +25,9 @@ from bpy_extras.io_utils import ImportHelper, ExportHelper
 
 from ..addon import get_prefs, temp_prefs, ic_fb, ic_eye, print_exc, ADDON_PATH
 from ..ui.layout import lh
-from ..infra.compat import fix_json, fix
+from ..core.migrations import migrate_json
+from ..infra.compat import fix
+from ..infra.menu_search import menu_search
 from ..bl_utils import message_box
 from .. import keymap_helper
 from ..pme_types import Tag
@@ -146,6 +148,7 @@ class WM_OT_pm_import(Operator, ImportHelper):
             return
 
         version = tuple(int(i) for i in version.split("."))
+        migrate_json(menus, version)
 
         new_names = {}
         if self.mode == 'RENAME':
@@ -170,7 +173,6 @@ class WM_OT_pm_import(Operator, ImportHelper):
             # pm = pr.add_pm(mode, menu[0], True)
             pm = pr.pie_menus.add()
             pm.mode = mode
-            fix_json(pm, menu, version)
             pm.name = pr.unique_pm_name(menu[0] or pm.ed.default_name)
             pm.km_name = menu[1]
 
@@ -260,6 +262,7 @@ class WM_OT_pm_import(Operator, ImportHelper):
 
         for pm in pms:
             pm.ed.init_pm(pm)
+            menu_search.invalidate(pm.name)
 
     def import_file(self, filepath):
         # Use infra.io for file reading
@@ -24,9 +24,8 @@ from ..ui import tag_redraw
 from ..ui.panels import (
     hide_panel,
     hidden_panel,
-    is_panel_hidden,
-    bl_panel_types,
     bl_panel_enum_items,
+    panel_index,
 )
 from ..core.constants import SPACE_ITEMS, REGION_ITEMS
 
@@ -154,12 +153,7 @@ class PME_OT_panel_hide_by(Operator):
         if not PME_OT_panel_hide_by.ctx_items:
             enum_items = [("ANY", "Any Context", "", 'LAYER_ACTIVE', 0)]
 
-            contexts = set()
-            for tp in bl_panel_types():
-                if hasattr(tp, "bl_context"):
-                    contexts.add(tp.bl_context)
-
-            for i, c in enumerate(sorted(contexts)):
+            for i, c in enumerate(panel_index.values("context")):
                 enum_items.append((c, c, "", 'LAYER_USED', i + 1))
 
             PME_OT_panel_hide_by.ctx_items = enum_items
@@ -170,12 +164,7 @@ class PME_OT_panel_hide_by(Operator):
         if not PME_OT_panel_hide_by.cat_items:
             enum_items = [("ANY", "Any Category", "", 'LAYER_ACTIVE', 0)]
 
-            categories = set()
-            for tp in bl_panel_types():
-                if hasattr(tp, "bl_category"):
-                    categories.add(tp.bl_category)
-
-            for i, c in enumerate(sorted(categories)):
+            for i, c in enumerate(panel_index.values("category")):
                 enum_items.append((c, c, "", 'LAYER_USED', i + 1))
 
             PME_OT_panel_hide_by.cat_items = enum_items
@@ -207,42 +196,10 @@ class PME_OT_panel_hide_by(Operator):
         name="Mask", description="Mask", options={'SKIP_SAVE'}
     )
 
-    def _filtered_panels(self, num=False):
-        if num:
-            num_panels = 0
-        else:
-            panels = []
-
-        for tp in self.panel_types:
-            if (
-                tp.bl_space_type != 'PREFERENCES'
-                and (self.space == 'ANY' or tp.bl_space_type == self.space)
-                and (self.region == 'ANY' or tp.bl_region_type == self.region)
-                and (
-                    self.context == 'ANY'
-                    or hasattr(tp, "bl_context")
-                    and tp.bl_context == self.context
-                )
-                and (
-                    self.category == 'ANY'
-                    or hasattr(tp, "bl_category")
-                    and tp.bl_category == self.category
-                )
-                and (
-                    not self.mask
-                    or hasattr(tp, "bl_label")
-                    and self.mask.lower() in tp.bl_label.lower()
-                )
-            ):
-                if is_panel_hidden(tp.__name__):
-                    continue
-
-                if num:
-                    num_panels += 1
-                else:
-                    panels.append(tp)
-
-        return num_panels if num else panels
+    def _filtered_panels(self):
+        return panel_index.find(
+            self.space, self.region, self.context, self.category, self.mask
+        )
 
     def check(self, context):
         return True
@@ -260,12 +217,12 @@ class PME_OT_panel_hide_by(Operator):
         lh.sep()
         lh.row(col)
         lh.layout.alignment = 'CENTER'
-        lh.label("%d panel(s) will be hidden" % self._filtered_panels(True))
+        lh.label("%d panel(s) will be hidden" % len(self._filtered_panels()))
 
     def execute(self, context):
         pm = get_prefs().selected_pm
 
-        for tp in self._filtered_panels():
+        for tp in panel_index.panel_types(self._filtered_panels()):
             tp_name = tp.__name__
             if hasattr(tp, "bl_idname"):
                 tp_name = tp.bl_idname
@@ -285,5 +242,5 @@ class PME_OT_panel_hide_by(Operator):
         PME_OT_panel_hide_by.region_items = None
         PME_OT_panel_hide_by.ctx_items = None
         PME_OT_panel_hide_by.cat_items = None
-        self.panel_types = bl_panel_types()
+        panel_index.build()
         return context.window_manager.invoke_props_dialog(self)
@@ -29,6 +29,7 @@ from ..addon import get_prefs, get_uprefs
 from ..ui import tag_redraw, utitle
 from ..ui.layout import operator
 from ..keymap_helper import to_ui_hotkey
+from ..infra.menu_search import menu_search
 from ..ui.panels import hidden_panel, bl_panel_enum_items
 from .. import operator_utils
 from ..core import constants as CC
@@ -40,40 +41,60 @@ class PME_OT_pm_search_and_select(Operator):
     bl_label = "Search and Select Item"
     bl_description = "Search and select an item"
     bl_options = {'INTERNAL'}
-    bl_property = "item"
+    bl_property = "query"
 
-    enum_items = None
-
-    def get_items(self, context):
+    def search_items(self, context, edit_text):
+        """Ranked matches on names, tags, hotkeys and slot contents."""
         pr = get_prefs()
+        if edit_text:
+            names = [
+                hit.key
+                for hit in menu_search.search(edit_text, limit=None, modes=self.mode)
+            ]
+        else:
+            names = menu_search.names(self.mode)
 
-        if not PME_OT_pm_search_and_select.enum_items:
-            enum_items = []
-
-            for k in sorted(pr.pie_menus.keys()):
-                pm = pr.pie_menus[k]
-                if self.mode and pm.mode not in self.mode:
-                    continue
-                enum_items.append((pm.name, "%s|%s" % (pm.name, to_ui_hotkey(pm)), ""))
-
-            PME_OT_pm_search_and_select.enum_items = enum_items
-
-        return PME_OT_pm_search_and_select.enum_items
-
-    item: EnumProperty(items=get_items)
+        items = []
+        for name in names:
+            pm = pr.pie_menus.get(name)
+            if pm is None:
+                continue
+            hint = to_ui_hotkey(pm)
+            tags = pm.get_tags()
+            if tags:
+                hint = " ".join([hint, *("#" + t for t in tags)]).strip()
+            items.append((name, hint))
+
+        return items
+
+    query: StringProperty(
+        name="Menu",
+        description="Menu name, tag, hotkey, slot label or command",
+        search=search_items,
+        options={'SKIP_SAVE'},
+    )
     mode: EnumProperty(
         items=PM_ITEMS_M, default=set(), options={'SKIP_SAVE', 'ENUM_FLAG'}
     )
 
+    def draw(self, context):
+        layout = self.layout
+        layout.activate_init = True
+        layout.prop(self, "query", text="", icon='VIEWZOOM')
+
     def execute(self, context):
-        bpy.ops.wm.pm_select(pm_name=self.item)
-        PME_OT_pm_search_and_select.enum_items = None
+        name = self.query
+        if name not in get_prefs().pie_menus:
+            hits = menu_search.search(name, limit=1, modes=self.mode) if name else ()
+            if not hits:
+                return {'CANCELLED'}
+            name = hits[0].key
+
+        bpy.ops.wm.pm_select(pm_name=name)
         return {'FINISHED'}
 
     def invoke(self, context, event):
-        PME_OT_pm_search_and_select.enum_items = None
-        context.window_manager.invoke_search_popup(self)
-        return {'FINISHED'}
+        return context.window_manager.invoke_props_dialog(self)
 
 
 class PME_OT_addonpref_search(Operator):
@@ -139,15 +160,12 @@ class PME_OT_pmi_pm_search(Operator):
     items = None
 
     def get_items(self, context):
-        pr = get_prefs()
         if not PME_OT_pmi_pm_search.items:
             if PME_OT_pmi_pm_search.items is None:
                 PME_OT_pmi_pm_search.items = []
 
             items = PME_OT_pmi_pm_search.items
-            for pm in sorted(pr.pie_menus.keys()):
-                if self.custom and pr.pie_menus[pm].mode != 'DIALOG':
-                    continue
+            for pm in menu_search.names({'DIALOG'} if self.custom else None):
                 items.append((pm, pm, ""))
 
             PME_OT_pmi_pm_search.items = items
@@ -12,6 +12,7 @@
 LAYER = "infra"
 
 import bpy
+from contextlib import contextmanager
 from bpy.props import (
     BoolProperty,
     CollectionProperty,
@@ -26,10 +27,14 @@ from .ui import utils as UU
 from .ui import panels as PAU
 from .infra import macro as MAU
 from .infra import utils as U
+from .infra.hotkey_index import hotkey_index
+from .infra.menu_search import menu_search
+from .infra.tag_index import tag_index
 from .addon import get_prefs, temp_prefs, ic_fb
 from . import keymap_helper as KH
 from . import pme
-from .core.schema import schema
+from .core.schema import schema, DataEdit
+from .core.syntax import POLL_PREFIX, compile_cache
 from .ui import tag_redraw
 from .ui.descriptions import SLOT_POLL, SLOT_DESCRIPTION, SLOT_DESCRIPTION_IS_EXPR
 # NOTE: schema is now in core/schema.py (Phase 8-C rename from core/schema.py)
@@ -85,9 +90,7 @@ class Tag(PropertyGroup):
         else:
             Tag.filtered_pms.clear()
 
-        for pm in pr.pie_menus:
-            if pm.has_tag(pr.tag_filter):
-                Tag.filtered_pms.add(pm.name)
+        Tag.filtered_pms.update(tag_index.menus(pr.tag_filter))
 
     @staticmethod
     def check_pm(pm):
@@ -147,6 +150,7 @@ class PMLink(PropertyGroup):
 
 class PMIItem(PropertyGroup):
     expandable_props = {}
+    parse_cache = {}
 
     mode: EnumProperty(items=CC.MODE_ITEMS, description="Type of the item")
     text: StringProperty(maxlen=CC.MAX_STR_LEN)
@@ -210,6 +214,7 @@ class PMIItem(PropertyGroup):
 
         pm = get_prefs().selected_pm
         pm.ed.on_pmi_rename(pm, self, self.name, value)
+        menu_search.invalidate(pm.name)
 
     label: StringProperty(
         description="Label", get=get_pmi_label, set=set_pmi_label
@@ -233,9 +238,21 @@ class PMIItem(PropertyGroup):
         self.enabled = not bool(data & CC.PMIF_DISABLED)
 
     def parse(self, default_icon='NONE'):
+        """Return (text, icon, oicon, icon_only, hidden, use_cb).
+
+        Results are cached by (mode, text, icon, name, default_icon), so
+        editing a slot changes the key. PROP slots are cached once their
+        Blender property resolves.
+        """
+        key = (self.mode, self.text, self.icon, self.name, default_icon)
+        ret = self.parse_cache.get(key)
+        if ret is not None:
+            return ret
+
         icon, icon_only, hidden, use_cb = self.extract_flags()
         oicon = icon
         text = self.name
+        cache = True
 
         if icon_only:
             text = ""
@@ -257,6 +274,8 @@ class PMIItem(PropertyGroup):
                         and len(bl_prop.default_array) > 1
                     ):
                         text = ""
+                else:
+                    cache = False
 
             if (
                 icon[0] != CC.F_EXPAND
@@ -265,7 +284,12 @@ class PMIItem(PropertyGroup):
             ):
                 icon = 'CANCEL'
 
-        return text, icon, oicon, icon_only, hidden, use_cb
+        ret = text, icon, oicon, icon_only, hidden, use_cb
+        if cache:
+            if len(self.parse_cache) >= CC.MAX_PARSE_CACHE:
+                self.parse_cache.clear()
+            self.parse_cache[key] = ret
+        return ret
 
     def parse_edit(self):
         text, icon, oicon, icon_only, hidden, use_cb = self.parse()
@@ -321,6 +345,10 @@ class PMIItem(PropertyGroup):
         return self.expandable_props[prop]
 
 
+# Open PMItem.edit_data() blocks by pm pointer
+_data_edits = {}
+
+
 class PMItem(PropertyGroup):
     poll_methods = {}
     kmis_map = {}
@@ -367,6 +395,7 @@ class PMItem(PropertyGroup):
         try:
             if self.km_name != value:
                 self.km_name = value
+            menu_search.invalidate(self.name)
             if not self.ed.has_hotkey:
                 return
             self.unregister_hotkey()
@@ -403,7 +432,12 @@ class PMItem(PropertyGroup):
 
     pmis: CollectionProperty(type=PMIItem)
     mode: EnumProperty(items=CC.PM_ITEMS)
-    tag: StringProperty()
+
+    def update_tag(self, context):
+        tag_index.update_pm(self)
+        menu_search.invalidate(self.name)
+
+    tag: StringProperty(update=update_tag)
 
     # uid: Unique identifier for JSON Schema v2 (Phase 9-X)
     # Format: {mode_prefix}_{random_id}, e.g., "pm_9f7c2k3h"
@@ -461,6 +495,8 @@ class PMItem(PropertyGroup):
     )
 
     def update_keymap_item(self, context):
+        hotkey_index.update_pm(self)
+        menu_search.invalidate(self.name)
         if not self.ed.has_hotkey:
             return
 
@@ -556,6 +592,8 @@ class PMItem(PropertyGroup):
         pr = get_prefs()
         prev = PMItem._prev_key_mod_map.get(self.name, 'NONE')
         curr = self.key_mod
+        hotkey_index.update_pm(self)
+        menu_search.invalidate(self.name)
         if prev == curr or not self.enabled:
             PMItem._prev_key_mod_map[self.name] = curr
             return
@@ -592,13 +630,9 @@ class PMItem(PropertyGroup):
         if self.poll_cmd == CC.DEFAULT_POLL:
             self.poll_methods.pop(self.name, None)
         else:
-            try:
-                co = compile(
-                    "def poll(cls, context):" + self.poll_cmd, "<string>", "exec"
-                )
-                self.poll_methods[self.name] = co
-            except:
-                self.poll_methods[self.name] = None
+            self.poll_methods[self.name] = compile_cache.compile(
+                self.poll_cmd, 'exec', POLL_PREFIX
+            )[0]
 
     poll_cmd: StringProperty(
         description=SLOT_POLL,
@@ -612,18 +646,17 @@ class PMItem(PropertyGroup):
         self.ed.update_panel_group(self)
 
     def get_panel_context(self):
-        prop = schema.parse(self.data)
+        pg_context = self.get_data("pg_context")
         for item in PAU.panel_context_items(self, bpy.context):
-            if item[0] == prop.pg_context:
+            if item[0] == pg_context:
                 return item[4]
         return 0
 
     def set_panel_context(self, value):
         value = PAU.panel_context_items(self, bpy.context)[value][0]
-        prop = schema.parse(self.data)
-        if prop.pg_context == value:
+        if self.get_data("pg_context") == value:
             return
-        self.data = schema.encode(self.data, "pg_context", value)
+        self.set_data("pg_context", value)
         self.update_panel_group()
 
     panel_context: EnumProperty(
@@ -635,14 +668,12 @@ class PMItem(PropertyGroup):
     )
 
     def get_panel_category(self):
-        prop = schema.parse(self.data)
-        return prop.pg_category
+        return self.get_data("pg_category")
 
     def set_panel_category(self, value):
-        prop = schema.parse(self.data)
-        if prop.pg_category == value:
+        if self.get_data("pg_category") == value:
             return
-        self.data = schema.encode(self.data, "pg_category", value)
+        self.set_data("pg_category", value)
         self.update_panel_group()
 
     panel_category: StringProperty(
@@ -653,18 +684,17 @@ class PMItem(PropertyGroup):
     )
 
     def get_panel_region(self):
-        prop = schema.parse(self.data)
+        pg_region = self.get_data("pg_region")
         for item in CC.REGION_ITEMS:
-            if item[0] == prop.pg_region:
+            if item[0] == pg_region:
                 return item[4]
         return 0
 
     def set_panel_region(self, value):
         value = CC.REGION_ITEMS[value][0]
-        prop = schema.parse(self.data)
-        if prop.pg_region == value:
+        if self.get_data("pg_region") == value:
             return
-        self.data = schema.encode(self.data, "pg_region", value)
+        self.set_data("pg_region", value)
         self.update_panel_group()
 
     panel_region: EnumProperty(
@@ -676,18 +706,17 @@ class PMItem(PropertyGroup):
     )
 
     def get_panel_space(self):
-        prop = schema.parse(self.data)
+        pg_space = self.get_data("pg_space")
         for item in CC.SPACE_ITEMS:
-            if item[0] == prop.pg_space:
+            if item[0] == pg_space:
                 return item[4]
         return 0
 
     def set_panel_space(self, value):
         value = CC.SPACE_ITEMS[value][0]
-        prop = schema.parse(self.data)
-        if prop.pg_space == value:
+        if self.get_data("pg_space") == value:
             return
-        self.data = schema.encode(self.data, "pg_space", value)
+        self.set_data("pg_space", value)
         self.update_panel_group()
 
     panel_space: EnumProperty(
@@ -862,21 +891,22 @@ class PMItem(PropertyGroup):
         if old_value:
             extend_manager.unregister(pm_uid)
 
-        # Set new value
-        self.set_data(f"{prefix}_extend_target", value)
+        with self.edit_data():
+            # Set new value
+            self.set_data(f"{prefix}_extend_target", value)
 
-        # Set default extend_side if target is set and side is empty
-        if value:
-            current_side = self.get_data(f"{prefix}_extend_side") or ""
-            if not current_side:
-                self.set_data(f"{prefix}_extend_side", "append")
+            # Set default extend_side if target is set and side is empty
+            if value:
+                current_side = self.get_data(f"{prefix}_extend_side") or ""
+                if not current_side:
+                    self.set_data(f"{prefix}_extend_side", "append")
 
-            # Register to new target
-            extend_manager.register(self)
-        else:
-            # Clear extend settings when target is cleared
-            self.set_data(f"{prefix}_extend_side", "")
-            self.set_data(f"{prefix}_extend_order", 0)
+                # Register to new target
+                extend_manager.register(self)
+            else:
+                # Clear extend settings when target is cleared
+                self.set_data(f"{prefix}_extend_side", "")
+                self.set_data(f"{prefix}_extend_order", 0)
 
     extend_target: StringProperty(
         name="Extend Target",
@@ -910,14 +940,15 @@ class PMItem(PropertyGroup):
         from .infra.extend import extend_manager
         pm_uid = self.uid if self.uid else self.name
 
-        # Update pm.data first
-        self.set_data(f"{prefix}_extend_side", new_side)
+        # Side and order of self are encoded once
+        with self.edit_data():
+            self.set_data(f"{prefix}_extend_side", new_side)
 
-        # Use ExtendManager.change_side() to handle all updates
-        changes = extend_manager.change_side(pm_uid, new_side)
-        if changes:
-            # Sync pm.data for all affected pms (including self)
-            extend_manager.sync_pm_data_orders(changes)
+            # Use ExtendManager.change_side() to handle all updates
+            changes = extend_manager.change_side(pm_uid, new_side)
+            if changes:
+                # Sync pm.data for all affected pms (including self)
+                extend_manager.sync_pm_data_orders(changes)
         tag_redraw()
 
     extend_side: EnumProperty(
@@ -1014,6 +1045,8 @@ class PMItem(PropertyGroup):
         if self.name not in self.kmis_map:
             self.kmis_map[self.name] = None
 
+        hotkey_index.update_pm(self)
+
         if self.key == 'NONE' or not self.enabled:
             return
 
@@ -1082,6 +1115,8 @@ class PMItem(PropertyGroup):
         if self.name in self.kmis_map:
             del self.kmis_map[self.name]
 
+        hotkey_index.remove_pm(self.name)
+
     def filter_by_mode(self, pr):
         return self.mode in pr.mode_filter
 
@@ -1093,32 +1128,29 @@ class PMItem(PropertyGroup):
         )
 
     def has_tag(self, tag):
-        if not self.tag:
-            return tag == CC.UNTAGGED
-        tags = {t.strip() for t in self.tag.split(",")}
-        return tag in tags
+        return tag_index.has_tag(self, tag)
 
     def get_tags(self):
-        if not self.tag:
+        tags = tag_index.get_tags(self)
+        if not tags:
             return None
-        return [t.strip() for t in self.tag.split(",")]
+        return list(tags)
 
     def add_tag(self, tag):
         tag = tag.strip()
         if not tag or tag == CC.UNTAGGED:
             return
 
-        if self.tag:
-            tags = {t.strip() for t in self.tag.split(",")}
-        else:
-            tags = set()
+        tags = set(tag_index.get_tags(self))
+        if tag in tags:
+            return
         tags.add(tag)
         self.tag = ", ".join(sorted(tags))
 
     def remove_tag(self, tag):
-        if not self.tag:
+        tags = set(tag_index.get_tags(self))
+        if tag not in tags:
             return False
-        tags = {t.strip() for t in self.tag.split(",")}
         tags.discard(tag)
         self.tag = ", ".join(sorted(tags))
 
@@ -1129,29 +1161,64 @@ class PMItem(PropertyGroup):
         d = {}
         return d
 
-    def to_hotkey(self, use_key_names=False):
-        return KH.to_hotkey(
+    @property
+    def hotkey_code(self):
+        """Packed hotkey (keymap_helper.encode_hotkey), 0 if there is no key."""
+        return KH.encode_hotkey(
             self.key,
             self.ctrl,
             self.shift,
             self.alt,
             self.oskey,
-            self.key_mod,
             self.any,
-            use_key_names=use_key_names,
-            chord=self.chord,
+            self.key_mod,
+        )
+
+    def to_hotkey(self, use_key_names=False):
+        return KH.format_hotkey(
+            self.hotkey_code, use_key_names=use_key_names, chord=self.chord
         )
 
     def get_data(self, key):
-        value = getattr(schema.parse(self.data), key)
-        return value
+        edit = _data_edits.get(self.as_pointer())
+        if edit and key in edit:
+            return edit.get(key)
+        return getattr(schema.parse(self.data), key)
 
     def set_data(self, key, value):
+        edit = _data_edits.get(self.as_pointer())
+        if edit:
+            edit.set(key, value)
+            return
         self.data = schema.encode(self.data, key, value)
 
     def clear_data(self, *args):
+        edit = _data_edits.get(self.as_pointer())
+        if edit:
+            edit.clear(*args)
+            return
         self.data = schema.clear(self.data, *args)
 
+    @contextmanager
+    def edit_data(self):
+        """Batch get_data/set_data/clear_data changes.
+
+        pm.data is encoded once when the outermost block exits. Code inside
+        the block must read pm.data through get_data() to see the changes.
+        """
+        key = self.as_pointer()
+        if key in _data_edits:
+            yield _data_edits[key]
+            return
+
+        edit = _data_edits[key] = DataEdit()
+        try:
+            yield edit
+        finally:
+            del _data_edits[key]
+            if edit.values:
+                self.data = edit.encode(self.data)
+
     @property
     def ed(self):
         # Guard: editors may not be registered yet during initialization
@@ -21,7 +21,6 @@ from bpy.types import (
     Panel,
     PropertyGroup,
     UIList,
-    UILayout,
     UI_UL_list,
     USERPREF_PT_addons,
     # WM_MT_button_context: use getattr() at runtime for portable Blender compatibility
@@ -67,7 +66,6 @@ from .infra.debug import *
 from .ui.panels import (
     hide_panel,
     unhide_panel,
-    add_panel,
     hidden_panel,
     rename_panel_group,
     remove_panel_group,
@@ -82,7 +80,7 @@ from . import addon
 from . import keymap_helper
 from . import pme
 from . import operator_utils
-from .infra.compat import fix_json, fix
+from .infra.compat import fix
 from .infra.io import (
     read_import_file,
     write_export_file,
@@ -100,12 +98,15 @@ from .keymap_helper import (
     to_key_name,
     to_ui_hotkey,
 )
-from .infra.previews import ph
+from .infra.previews import ph, get_blender_icon_index
 from .infra.overlay import OverlayPrefs
 from .ui import tag_redraw, draw_addons_maximized, is_userpref_maximized
 from .ui.utils import get_pme_menu_class, execute_script
 from .infra import utils as U
 from .infra.property import PropertyData, to_py_value
+from .infra.tag_index import tag_index
+from .infra.menu_search import menu_search
+from .infra import invalidation as INV
 from .pme_types import Tag, PMItem, PMIItem, PMLink, EdProperties, UserProperties
 # Editor operators (moved to operators/ed/ in Phase 5-A)
 from .operators.ed import (
@@ -236,6 +237,7 @@ class PMEPreferences(AddonPreferences):
             # Valid index only - guard for initialization phase
             ed = self.selected_pm.ed
             if ed:
+                addon.load_editor(ed.id)
                 ed.on_pm_select(self.selected_pm)
 
     active_pie_menu_idx: IntProperty(
@@ -309,8 +311,11 @@ class PMEPreferences(AddonPreferences):
     expand_item_menu: BoolProperty(
         name="Expand Slot Tools", description="Expand slot tools"
     )
+    def icon_filter_update(self, context):
+        temp_prefs().icons_page = 1
+
     icon_filter: StringProperty(
-        description="Filter", options={'TEXTEDIT_UPDATE'}
+        description="Filter", options={'TEXTEDIT_UPDATE'}, update=icon_filter_update
     )
     hotkey: PointerProperty(type=keymap_helper.Hotkey)
     hold_time: IntProperty(
@@ -359,7 +364,8 @@ class PMEPreferences(AddonPreferences):
     )
 
     def update_tree(self, context=None):
-        self.tree.update()
+        """Rebuild the tree on the next tick, see infra/invalidation."""
+        INV.invalidation.invalidate(INV.TREE, INV.REDRAW)
 
     # def update_show_keymap_names(self, context=None):
     #     if self.tree_mode:
@@ -734,16 +740,17 @@ class PMEPreferences(AddonPreferences):
         # Phase 9-X (#97): Set extend_target, extend_side, extend_order BEFORE on_pm_add()
         # This eliminates the need to parse from pm.name
         if extend_target and extend_side:
-            if mode == 'DIALOG':
-                pm.set_data("pd_extend_target", extend_target)
-                pm.set_data("pd_extend_side", extend_side)
-                pm.set_data("pd_extend_order", extend_order)
-                pm.set_data("pd_extend_is_right", extend_is_right)
-            elif mode == 'RMENU':
-                pm.set_data("rm_extend_target", extend_target)
-                pm.set_data("rm_extend_side", extend_side)
-                pm.set_data("rm_extend_order", extend_order)
-                # RMENU doesn't use is_right (Menu has no right region)
+            with pm.edit_data():
+                if mode == 'DIALOG':
+                    pm.set_data("pd_extend_target", extend_target)
+                    pm.set_data("pd_extend_side", extend_side)
+                    pm.set_data("pd_extend_order", extend_order)
+                    pm.set_data("pd_extend_is_right", extend_is_right)
+                elif mode == 'RMENU':
+                    pm.set_data("rm_extend_target", extend_target)
+                    pm.set_data("rm_extend_side", extend_side)
+                    pm.set_data("rm_extend_order", extend_order)
+                    # RMENU doesn't use is_right (Menu has no right region)
 
         if duplicate:
             apm = pr.pie_menus[name]
@@ -771,7 +778,10 @@ class PMEPreferences(AddonPreferences):
                 Tag.filter()
 
         pm.register_hotkey()
+        tag_index.update_pm(pm)
+        menu_search.update_pm(pm)
 
+        addon.load_editor(pm.mode)
         pm.ed.on_pm_select(pm)
 
         return pm
@@ -822,6 +832,8 @@ class PMEPreferences(AddonPreferences):
         if apm.name in self.old_pms:
             self.old_pms.remove(apm.name)
 
+        tag_index.remove_pm(apm.name)
+        menu_search.remove_pm(apm.name)
         self.pie_menus.remove(idx)
 
         if new_idx >= idx:
@@ -1138,7 +1150,7 @@ class PMEPreferences(AddonPreferences):
             lh.box(layout)
             lh.column()
             for error in data.errors:
-                lh.label(error, icon='INFO')
+                lh.label(data.error_text(error), icon='INFO')
             for info in data.infos:
                 lh.label(info, icon='QUESTION')
 
@@ -1174,13 +1186,12 @@ class PMEPreferences(AddonPreferences):
 
         lh.operator(WM_OT_pmi_icon_select.bl_idname, "Cancel", idx=-1)
 
-        icon_filter = pr.icon_filter.upper()
-
         layout = layout.column(align=True)
         row = layout.row(align=True)
         row.prop(tpr, "icons_tab", expand=True)
 
-        if tpr.icons_tab == 'CUSTOM':
+        custom = tpr.icons_tab == 'CUSTOM'
+        if custom:
             # row.prop(
             #     pr, "show_custom_icons", text="Custom Icons", toggle=True)
 
@@ -1191,74 +1202,48 @@ class PMEPreferences(AddonPreferences):
             p = row.operator("wm.path_open", text="", icon=ic('FILE_FOLDER'))
             p.filepath = get_user_icons_dir(create=True)
 
-        if tpr.icons_tab == 'BLENDER':
-            box = layout.box()
-            column = box.column(align=True)
-            row = column.row(align=True)
-            row.alignment = 'CENTER'
-            idx = 0
+            icons = ph.get_index().filter(pr.icon_filter)
+        else:
+            icons = get_blender_icon_index().filter(pr.icon_filter.upper())
 
-            for k, i in (
-                UILayout.bl_rna.functions["prop"]
-                .parameters["icon"]
-                .enum_items.items()
-            ):
-                icon = i.identifier
-                if k == 'NONE':
-                    continue
-                if icon_filter != "" and icon_filter not in icon:
-                    continue
+        # Only build buttons for the visible page
+        num_cols = pr.num_icons_per_row
+        page_size = num_cols * CC.ICON_PAGE_ROWS
+        PMEData.num_icon_pages = max(1, -(-len(icons) // page_size))
+        start = (tpr.icons_page - 1) * page_size
 
-                p = row.operator(
-                    WM_OT_pmi_icon_select.bl_idname,
-                    text="",
-                    icon=ic(icon),
-                    emboss=False,
-                )
-                p.idx = pme.context.edit_item_idx
-                p.icon = icon
-                idx += 1
-                if idx > pr.num_icons_per_row - 1:
-                    idx = 0
-                    row = column.row(align=True)
-                    row.alignment = 'CENTER'
-
-            if idx != 0:
-                while idx < pr.num_icons_per_row:
-                    row.label(text="", icon=ic('BLANK1'))
-                    idx += 1
-
-        elif tpr.icons_tab == 'CUSTOM':
-            icon_filter = pr.icon_filter
-
-            box = layout.box()
-            column = box.column(align=True)
+        box = layout.box()
+        column = box.column(align=True)
+        for row_start in range(start, min(start + page_size, len(icons)), num_cols):
             row = column.row(align=True)
             row.alignment = 'CENTER'
-            idx = 0
+            row_icons = icons[row_start : row_start + num_cols]
+            for icon in row_icons:
+                if custom:
+                    p = row.operator(
+                        WM_OT_pmi_icon_select.bl_idname,
+                        text="",
+                        icon_value=ph.get_icon(icon),
+                        emboss=False,
+                    )
+                    p.icon = CC.F_CUSTOM_ICON + icon
+                else:
+                    p = row.operator(
+                        WM_OT_pmi_icon_select.bl_idname,
+                        text="",
+                        icon=ic(icon),
+                        emboss=False,
+                    )
+                    p.icon = icon
+                p.idx = pme.context.edit_item_idx
 
-            for icon in sorted(ph.get_names()):
-                if icon_filter != "" and icon_filter not in icon:
-                    continue
+            for _ in range(num_cols - len(row_icons)):
+                row.label(text="", icon=ic('BLANK1'))
 
-                p = row.operator(
-                    WM_OT_pmi_icon_select.bl_idname,
-                    text="",
-                    icon_value=ph.get_icon(icon),
-                    emboss=False,
-                )
-                p.idx = pme.context.edit_item_idx
-                p.icon = CC.F_CUSTOM_ICON + icon
-                idx += 1
-                if idx > pr.num_icons_per_row - 1:
-                    idx = 0
-                    row = column.row(align=True)
-                    row.alignment = 'CENTER'
-
-            if idx != 0:
-                while idx < pr.num_icons_per_row:
-                    row.label(text="", icon=ic('BLANK1'))
-                    idx += 1
+        if PMEData.num_icon_pages > 1:
+            row = layout.row(align=True)
+            row.prop(tpr, "icons_page", text="Page")
+            row.label(text="of %d (%d icons)" % (PMEData.num_icon_pages, len(icons)))
 
         layout.prop(pr, "num_icons_per_row", slider=True)
 
@@ -1835,6 +1820,10 @@ def register():
 
     add_rmb_menu()
 
+    INV.invalidation.add_handler(INV.TAGS, Tag.filter)
+    INV.invalidation.add_handler(INV.TREE, lambda: get_prefs().tree.update())
+    INV.invalidation.add_handler(INV.REDRAW, tag_redraw)
+
     pr = get_prefs()
     pr.tree.lock()
     # NOTE: init_menus() and pr.ed() moved to deferred_init()
@@ -1946,4 +1935,6 @@ def deferred_init():
         pr.backup_menus()
 
     pr.ed('DIALOG').update_default_pmi_data()
+    # Later selections load their editor in update_active_pie_menu_idx()
+    addon.load_editor(pr.selected_pm.mode)
     pr.selected_pm.ed.register_props(pr.selected_pm)
@@ -19,6 +19,9 @@ from bpy.types import Operator, UILayout
 from ..addon import get_prefs, temp_prefs
 from ..bl_utils import ConfirmBoxHandler
 from ..keymap_helper import to_key_name
+from ..infra import invalidation as INV
+from ..infra.invalidation import invalidation
+from ..infra.menu_search import menu_search
 from ..pme_types import Tag
 from ..ui import tag_redraw
 from ..ui.layout import lh
@@ -41,9 +44,9 @@ class WM_OT_pm_duplicate(Operator):
         pm = pr.add_pm(apm.mode, apm_name, True)
 
         pm.ed.on_pm_duplicate(apm, pm)
+        menu_search.invalidate(pm.name)
 
-        Tag.filter()
-        pr.update_tree()
+        invalidation.invalidate(INV.TAGS, INV.TREE)
 
         return {'FINISHED'}
 
@@ -57,18 +57,20 @@ class PMIData(PropertyGroup):
     - 編集バッファ: mode, cmd, custom, prop, menu, icon, name, sname,
                     key, ctrl, shift, alt, oskey, key_mod, any,
                     expand_menu, use_cb, use_frame, cmd_ctx, cmd_undo
-    - エフェメラル: errors, infos (バリデーション結果)
+    - エフェメラル: errors, infos, diagnostics (バリデーション結果)
     - ランタイム: _kmi (オペレーター引数編集用)
 
     設計ノート:
     - _kmi は KeymapHelper 経由で生成される一時的な KeyMapItem
     - errors/infos はクラス変数（複数インスタンス間で共有）
+    - diagnostics はエラー文字列 -> core.syntax.Diagnostic（行/列範囲）
     - update_data() は temp_data.py の update_pmi_data() を呼び出す
     """
 
     _kmi = None
     errors = []
     infos = []
+    diagnostics = {}
 
     @property
     def kmi(self):
@@ -194,6 +196,16 @@ class PMIData(PropertyGroup):
         else:
             self.errors.clear()
             self.infos.clear()
+            self.diagnostics.clear()
+
+    def error_text(self, text):
+        diagnostic = self.diagnostics.get(text)
+        if diagnostic:
+            location = diagnostic.location()
+            if location:
+                return "%s (%s): %s" % (text, location, diagnostic.message)
+            return "%s: %s" % (text, diagnostic.message)
+        return text
 
     def has_info(self):
         return self.errors or self.infos
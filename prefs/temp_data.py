@@ -38,9 +38,10 @@ from bpy.types import PropertyGroup
 
 from ..addon import get_prefs, temp_prefs
 from ..core import constants as CC
-from ..infra.collections import BaseCollectionItem, sort_collection
+from ..infra.collections import BaseCollectionItem
 from ..infra.modal import encode_modal_data
 from ..infra.property import PropertyData
+from ..infra.tag_index import tag_index
 from ..pme_types import Tag, PMLink, EdProperties
 from .. import keymap_helper
 from .. import operator_utils
@@ -251,6 +252,9 @@ class PMEData(PropertyGroup):
         description="Settings",
         default=CC.SETTINGS_TAB_DEFAULT,
     )
+    def icons_tab_update(self, context):
+        self.icons_page = 1
+
     icons_tab: EnumProperty(
         name="Icons",
         description="Icons",
@@ -258,22 +262,35 @@ class PMEData(PropertyGroup):
             ('BLENDER', "Blender", ""),
             ('CUSTOM', "Custom", ""),
         ),
+        update=icons_tab_update,
+    )
+
+    # Set by the icon picker when it draws
+    num_icon_pages = 1
+
+    def icons_page_get(self):
+        return max(1, min(self.get("icons_page", 1), PMEData.num_icon_pages))
+
+    def icons_page_set(self, value):
+        self["icons_page"] = value
+
+    icons_page: IntProperty(
+        name="Page",
+        description="Icon page",
+        min=1,
+        default=1,
+        get=icons_page_get,
+        set=icons_page_set,
     )
 
     def init_tags(self):
         pr = get_prefs()
-        tpr = temp_prefs()
+        tag_index.sync(pr.pie_menus)
+
         self.tags.clear()
-        for pm in pr.pie_menus:
-            tags = pm.get_tags()
-            if not tags:
-                continue
-            for t in tags:
-                if t in self.tags:
-                    continue
-                tag = self.tags.add()
-                tag.name = t
-        sort_collection(tpr.tags, lambda t: t.name)
+        for t in tag_index.tags():
+            tag = self.tags.add()
+            tag.name = t
         Tag.filter()
 
     def update_pie_menus(self):
@@ -35,6 +35,7 @@ from ..infra.debug import DBG_TREE, logh, logi
 from ..infra import utils as U
 from ..keymap_helper import to_key_name, to_ui_hotkey
 from ..pme_types import PMLink
+from ..infra.tag_index import tag_index
 from ..ui import tag_redraw
 from ..ui.layout import lh
 
@@ -223,8 +224,8 @@ class PME_UL_pm_tree(UIList):
 
         for pm in pms:
             if pr.group_by == 'TAG':
-                if pm.tag:
-                    tags = [s.strip() for s in pm.tag.split(",") if s.strip()]
+                tags = tag_index.get_tags(pm)
+                if tags:
                     for t in tags:
                         if t not in groups:
                             groups[t] = []
@@ -0,0 +1,19 @@
+# tests/addon_package.py - pytest plugin, loaded with -p from pyproject.toml
+#
+# The repository root is the addon package, and its __init__ imports bpy.
+# pytest imports a package's __init__ to set up every test below it, so the
+# root is collected as a plain directory instead. Tests import what they
+# need without going through the package.
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collect_directory(path, parent):
+    if path == ROOT:
+        return pytest.Dir.from_parent(parent, path=path)
+    return None
@@ -0,0 +1,118 @@
+# tests/test_migrations.py - core/migrations.py outside Blender
+#
+# Imported as a top-level module from core/, like tests/test_validator.py.
+# Menus are raw export lists:
+# [name, km_name, hotkey, items, mode, data, open_mode, poll_cmd]
+
+import os
+import sys
+
+CORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+sys.path.insert(0, CORE_DIR)
+
+import migrations  # noqa: E402
+
+
+def _menu(name, mode, data="", km_name="Window", poll_cmd=""):
+    return [name, km_name, "", [], mode, data, "PRESS", poll_cmd]
+
+
+def test_keymap_splitter_1_17_1():
+    pie = _menu("Pie", 'PMENU', km_name="3D View,Mesh,Object Mode")
+    panel = _menu("Panel", 'PANEL', km_name="3D View,Mesh")
+
+    migrations.migrate_json([pie, panel], (1, 17, 0))
+
+    assert pie[1] == "3D View; Mesh; Object Mode"
+    assert panel[1] == "3D View,Mesh"
+
+
+def test_modal_prefix_2_0_0():
+    modal = _menu("Modal", 'MODAL', "md?confirm=True&block_ui=False&lock=True")
+
+    migrations.migrate_json([modal], (1, 19, 0))
+
+    assert modal[5] == "md?md_confirm=True&md_block_ui=False&md_lock=True"
+
+    # Already migrated data is left alone
+    migrations.migrate_json([modal], (1, 19, 0))
+    assert modal[5] == "md?md_confirm=True&md_block_ui=False&md_lock=True"
+
+
+def test_property_prefix_2_0_0():
+    prop = _menu(
+        "Prop", 'PROPERTY',
+        "prop?vector=3&mulsel=True&hor_exp=False&exp=True&save=True",
+        poll_cmd='INT',
+    )
+    legacy = _menu("Legacy", 'PROPERTY', poll_cmd="return True")
+
+    migrations.migrate_json([prop, legacy], (1, 19, 0))
+
+    assert prop[5] == (
+        "pr?pr_prop_type=INT&pr_vector=3&pr_mulsel=True"
+        "&pr_hor_exp=False&pr_exp=True&pr_save=True"
+    )
+    assert prop[7] == ""
+    # menu[7] is not a property type: BOOL, and the default poll
+    assert legacy[5] == "pr?pr_prop_type=BOOL"
+    assert legacy[7] == ""
+
+
+def test_extend_target_2_0_0():
+    prepend = _menu("VIEW3D_PT_tools_pre", 'DIALOG', "pd?pd_panel=1")
+    right = _menu("TOPBAR_HT_upper_bar_right", 'DIALOG')
+    rmenu = _menu("VIEW3D_MT_add", 'RMENU')
+    popup = _menu("My Popup", 'DIALOG', "pd?pd_panel=1")
+
+    migrations.migrate_json([prepend, right, rmenu, popup], (1, 19, 0))
+
+    assert prepend[5] == (
+        "pd?pd_extend_target=VIEW3D_PT_tools&pd_extend_side=prepend"
+        "&pd_extend_order=0&pd_panel=1"
+    )
+    assert right[5] == (
+        "pd?pd_extend_target=TOPBAR_HT_upper_bar&pd_extend_side=append"
+        "&pd_extend_order=0&pd_extend_is_right=True"
+    )
+    assert rmenu[5] == (
+        "rm?rm_extend_target=VIEW3D_MT_add&rm_extend_side=append&rm_extend_order=0"
+    )
+    assert popup[5] == "pd?pd_panel=1"
+
+
+def test_current_version_is_untouched():
+    modal = _menu("Modal", 'MODAL', "md?confirm=True", km_name="3D View,Mesh")
+
+    migrations.migrate_json([modal], (2, 0, 0))
+
+    assert modal[1] == "3D View,Mesh"
+    assert modal[5] == "md?confirm=True"
+
+
+def test_pending_bounds():
+    pending = migrations.JSON_MIGRATIONS.pending
+
+    assert pending((1, 17, 0)) == [
+        migrations.fix_json_1_17_1, migrations.fix_json_2_0_0,
+    ]
+    # from_version is exclusive, to_version inclusive
+    assert pending((1, 17, 1)) == [migrations.fix_json_2_0_0]
+    assert pending([1, 17, 0], [1, 17, 1]) == [migrations.fix_json_1_17_1]
+    assert pending((1, 17, 1), (1, 19, 0)) == []
+    assert pending((2, 0, 0)) == []
+
+
+def test_registry_order():
+    registry = migrations.MigrationRegistry()
+    calls = []
+
+    for version, name in (((2, 0, 0), "b"), ((1, 0, 0), "a"), ((2, 0, 0), "c")):
+        registry.register(*version)(lambda name=name: calls.append(name))
+
+    for func in registry.pending((0, 0, 0)):
+        func()
+
+    assert len(registry) == 3
+    # Sorted by version, same versions in registration order
+    assert calls == ["a", "b", "c"]
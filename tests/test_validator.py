@@ -0,0 +1,116 @@
+# tests/test_validator.py - core/validator.py outside Blender
+#
+# The addon package __init__ imports bpy, so the engine is imported as a
+# top-level module from core/, the same way spawned workers import it.
+
+import json
+import os
+import subprocess
+import sys
+
+CORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+sys.path.insert(0, CORE_DIR)
+
+import validator  # noqa: E402
+
+
+def _uid(i):
+    digits = "abcdefghijklmnopqrstuvwxyz234567"
+    return "pm_" + "".join(digits[(i >> (5 * k)) & 31] for k in range(8))
+
+
+def _library(count):
+    """PME2 library with one issue of each cross-shard kind."""
+    menus = []
+    for i in range(count):
+        target = _uid(i + 1) if i + 1 < count else "pm_missing0"
+        menus.append({
+            "uid": _uid(i),
+            "name": f"Menu {i}",
+            "mode": "PMENU",
+            "items": [{"action": {"type": "menu", "value": target}}],
+        })
+
+    menus[3]["uid"] = "bad uid"  # E302, and E601 from menus[2]
+    menus[-1]["name"] = menus[0]["name"]  # W102
+    menus[-1]["items"][0]["action"]["value"] = _uid(count - 2)  # E602
+    return {"$schema": "pme2", "schema_version": "2.0", "menus": menus}
+
+
+def test_panel_ids_are_not_menu_refs():
+    pme1 = {
+        "version": "1.19.0",
+        "menus": [
+            # PANEL/HPANEL slots hold Blender panel IDs
+            ["Panels", "", "", [["Tools", "MENU", "", "VIEW3D_PT_tools"]], "PANEL"],
+            ["Hidden", "", "", [["Light", "MENU", "", "DATA_PT_light"]], "HPANEL"],
+            ["Pie", "", "", [
+                ["Add", "MENU", "", "@VIEW3D_MT_add"],
+                ["Header", "MENU", "", "VIEW3D_HT_header"],
+                ["Missing", "MENU", "", "No Such Menu"],
+            ], "PMENU"],
+        ],
+    }
+    pme2 = {
+        "$schema": "pme2",
+        "schema_version": "2.0",
+        "menus": [{
+            "uid": _uid(0),
+            "name": "Pie",
+            "mode": "PMENU",
+            "items": [{"action": {"type": "menu", "value": "VIEW3D_MT_add"}}],
+        }],
+    }
+
+    refs = [i.path for i in validator.iter_issues(pme1) if i.code == "E601"]
+    assert refs == ["menus[2][3][2][3]"]
+    assert not [i for i in validator.iter_issues(pme2) if i.code == "E601"]
+
+
+def test_imports_without_bpy():
+    code = (
+        "import sys; sys.path.insert(0, %r); import validator; "
+        "print('bpy' in sys.modules, validator._in_blender())" % CORE_DIR
+    )
+    ret = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=60,
+    )
+
+    assert ret.returncode == 0, ret.stderr
+    assert ret.stdout.split() == ["False", "False"]
+
+
+def test_spawn_pool_matches_serial(monkeypatch):
+    pools = []
+
+    class Executor(validator.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs["mp_context"].get_start_method())
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(validator, "ProcessPoolExecutor", Executor)
+    # The suite may run with bpy stubs installed
+    monkeypatch.setattr(validator, "_in_blender", lambda: False)
+
+    data = _library(validator.SHARD_SIZE * 3 + 10)
+    serial = list(validator.iter_issues(data, workers=1))
+    pooled = list(validator.iter_issues(data, workers=3))
+
+    assert pools == ["spawn"]
+    assert pooled == serial
+    codes = {issue.code for issue in serial}
+    assert {"E302", "E601", "W102", "E602"} <= codes
+
+
+def test_cli(tmp_path):
+    path = tmp_path / "library.json"
+    path.write_text(json.dumps(_library(validator.SHARD_SIZE + 1)), encoding="utf-8")
+
+    ret = subprocess.run(
+        [sys.executable, os.path.join(CORE_DIR, "validator.py"), str(path), "--workers", "2"],
+        capture_output=True, text=True, timeout=120,
+    )
+
+    assert ret.returncode == 1, ret.stderr
+    assert "E302" in ret.stdout
+    assert "Traceback" not in ret.stderr
@@ -324,9 +324,8 @@ class LayoutHelper:
         if isinstance(icon, str) and icon.startswith(F_CUSTOM_ICON):
             icon_id = 'CANCEL'
             if self.ph:
-                icon = icon[1:]
-                if self.ph.has_icon(icon):
-                    icon_value = self.ph.get_icon(icon)
+                icon_value = self.ph.get_icon(icon[1:])
+                if icon_value:
                     icon_id = 'NONE'
 
         return icon_id, icon_value
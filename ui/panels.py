@@ -22,10 +22,11 @@ from itertools import chain
 from types import MethodType
 from ..addon import get_prefs, get_uprefs, print_exc, ic
 from ..core import constants as CC
+from ..core.search import SubstringIndex
 from .. import c_utils as CTU
 from bl_ui import space_userpref
 from ..bl_utils import bl_context, PopupOperator
-from ..ui import utitle
+from ..ui import utitle, tag_redraw_windows
 from ..infra.debug import *
 from .. import pme
 
@@ -64,6 +65,7 @@ def hide_panel(tp_name):
         tp = getattr(bpy_types, tp_name)
         bpy.utils.unregister_class(tp)
         _hidden_panels[tp_name] = tp
+        panel_index.set_hidden(tp_name, True)
 
 
 def unhide_panel(tp_name):
@@ -75,6 +77,7 @@ def unhide_panel(tp_name):
 
         bpy.utils.register_class(tp)
         del _hidden_panels[tp_name]
+        panel_index.set_hidden(tp_name, False)
 
     else:
         pass
@@ -155,56 +158,123 @@ def gen_panel_tp_name(name, idx, id):
     return "PME_PT_%s_%s_%d" % (to_valid_name(name), to_valid_name(id), idx)
 
 
-def add_panel_group(pm, draw_pme_panel, poll_pme_panel):
-    last_parent = None
+def panel_group_specs(pm):
+    """Desired panels of the group: [(spec, parent index)].
+
+    A spec is everything a panel class is built from except its name and
+    parent, so unchanged items can keep their registered classes.
+    """
+    space = pm.panel_space
+    region = pm.panel_region
+    context = pm.panel_context
+    category = pm.panel_category
+
+    ret = []
+    last_parent = -1
     for i, pmi in enumerate(pm.pmis):
-        if pmi.icon == "sub":
-            parent = last_parent if pmi.icon == "sub" else None
+        if pmi.icon == CC.PANEL_FILE:
+            parent = last_parent
         else:
-            parent = None
-            last_parent = gen_panel_tp_name(pm.name, i, pmi.text)
+            parent = -1
+            last_parent = i
 
-        add_panel(
-            pm.name,
-            i,
+        spec = (
             pmi.text,
-            pmi.name,
-            pm.panel_space,
-            pm.panel_region,
-            pm.panel_context,
-            pm.panel_category,
+            pmi.name or "PME Panel",
+            space,
+            region,
+            context,
+            category,
+            parent != -1,
+        )
+        ret.append((spec, parent))
+
+    return ret
+
+
+def add_panel_group(pm, draw_pme_panel, poll_pme_panel):
+    """Register the group's panels, re-registering only what changed.
+
+    Blender appends registered panel types to the region's list and draws
+    new panels in that order. Registered classes are kept for the longest
+    prefix of the desired panels that appears in the same order among the
+    current ones (with the same parent); the remaining panels are created
+    and registered after it. Classes that are not kept are unregistered
+    first, children before parents. Removing panels or editing the tail of
+    a group no longer re-registers the whole group.
+    """
+    name = pm.name
+    old = _panels.get(name, [])
+    specs = panel_group_specs(pm)
+
+    # Keep the longest prefix that is an ordered subsequence of old
+    panels = []
+    kept = set()
+    j = 0
+    for spec, parent in specs:
+        parent_id = panels[parent].__name__ if parent != -1 else None
+        while j < len(old):
+            tp = old[j]
+            j += 1
+            if (
+                getattr(tp, "pme_spec", None) == spec
+                and getattr(tp, "bl_parent_id", None) == parent_id
+            ):
+                panels.append(tp)
+                kept.add(tp)
+                break
+        else:
+            break
+
+    removed = [tp for tp in old if tp not in kept]
+    if not removed and len(panels) == len(specs):
+        _panels[name] = panels
+        return
+
+    for tp in reversed(removed):
+        try:
+            bpy.utils.unregister_class(tp)
+        except RuntimeError as e:
+            logw(f"PME: Warning: Failed to unregister panel {tp}: {e}")
+
+    used = {tp.__name__ for tp in panels}
+    for i in range(len(panels), len(specs)):
+        spec, parent = specs[i]
+        tp_name = gen_panel_tp_name(name, i, spec[0])
+        base_name, n = tp_name, 1
+        while tp_name in used:
+            tp_name = "%s_%d" % (base_name, n)
+            n += 1
+        used.add(tp_name)
+
+        tp = new_panel_type(
+            tp_name,
+            name,
+            spec,
             draw_pme_panel,
             poll_pme_panel,
-            parent,
+            panels[parent].__name__ if parent != -1 else None,
         )
+        try:
+            bpy.utils.register_class(tp)
+        except:
+            print_exc()
+            break
+        panels.append(tp)
 
+    _panels[name] = panels
+    tag_redraw_windows(pm.panel_space, pm.panel_region)
 
-def add_panel(
-    name,
-    idx,
-    id,
-    label,
-    space,
-    region,
-    context=None,
-    category=None,
-    draw=None,
-    poll=None,
-    parent=None,
-):
-    if name not in _panels:
-        _panels[name] = []
 
-    if not label:
-        label = "PME Panel"
-
-    tp_name = gen_panel_tp_name(name, idx, id)
+def new_panel_type(tp_name, name, spec, draw=None, poll=None, parent=None):
+    id, label, space, region, context, category, _ = spec
     defs = {
         "bl_label": label,
         "bl_space_type": space,
         "bl_region_type": region,
         "pm_name": name,
         "pme_data": id,
+        "pme_spec": spec,
         "draw": draw,
         "poll": classmethod(poll),
     }
@@ -218,14 +288,7 @@ def add_panel(
 
     base = Header if region == 'HEADER' else Panel
 
-    tp = type(tp_name, (base,), defs)
-
-    try:
-        bpy.utils.register_class(tp)
-        _panels[name].insert(idx, tp)
-    except:
-        print_exc()
-        pass
+    return type(tp_name, (base,), defs)
 
 
 def remove_panel(name, idx):
@@ -385,6 +448,134 @@ def bl_panel_types():
     return ret
 
 
+class PanelIndex:
+    """Faceted index over Blender panel types (PME panels excluded).
+
+    Each facet maps a value to the set of panel type names:
+
+      space:    bl_space_type
+      region:   bl_region_type
+      context:  bl_context
+      category: bl_category
+
+    Labels are indexed lowercase for mask filtering. find() intersects the
+    facet sets with the visible (not hidden, non-PREFERENCES) panels, so
+    filtering and counting no longer test every panel type.
+    hide_panel/unhide_panel keep the visible set up to date; build() rescans
+    bpy.types for panels registered since the last build.
+    """
+
+    FACETS = (
+        ("space", "bl_space_type"),
+        ("region", "bl_region_type"),
+        ("context", "bl_context"),
+        ("category", "bl_category"),
+    )
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._types = {}
+        self._facets = {facet: {} for facet, _ in self.FACETS}
+        self._labels = {}
+        self._label_index = None
+        self._hideable = set()
+        self._visible = set()
+        self._last = None
+        self._valid = False
+
+    def build(self):
+        self.clear()
+        panel_tp = Panel
+        for tp_name in chain(dir(bpy_types), _hidden_panels.keys()):
+            tp = (
+                _hidden_panels[tp_name]
+                if tp_name in _hidden_panels
+                else getattr(bpy_types, tp_name, None)
+            )
+            if not tp or not isclass(tp):
+                continue
+
+            if tp is panel_tp or not issubclass(tp, panel_tp) or hasattr(tp, "pme_data"):
+                continue
+
+            self._types[tp_name] = tp
+            for facet, attr in self.FACETS:
+                value = getattr(tp, attr, None)
+                if value is not None:
+                    self._facets[facet].setdefault(value, set()).add(tp_name)
+
+            label = getattr(tp, "bl_label", None)
+            if label:
+                self._labels.setdefault(label.lower(), set()).add(tp_name)
+
+            if getattr(tp, "bl_space_type", None) != 'PREFERENCES':
+                self._hideable.add(tp_name)
+
+        self._label_index = SubstringIndex(self._labels)
+        self._visible = self._hideable - _hidden_panels.keys()
+        self._valid = True
+
+    def _ensure(self):
+        if not self._valid:
+            self.build()
+
+    def set_hidden(self, tp_name, hidden):
+        if not self._valid or tp_name not in self._hideable:
+            return
+
+        if hidden:
+            self._visible.discard(tp_name)
+        else:
+            self._visible.add(tp_name)
+        self._last = None
+
+    def values(self, facet):
+        """Sorted values of the facet."""
+        self._ensure()
+        return sorted(self._facets[facet])
+
+    def _find_mask(self, mask):
+        ret = set()
+        for label in self._label_index.filter(mask.lower()):
+            ret |= self._labels[label]
+        return ret
+
+    def find(self, space='ANY', region='ANY', context='ANY', category='ANY', mask=""):
+        """Names of the visible panel types matching the filter.
+        Do not modify the result."""
+        self._ensure()
+        key = (space, region, context, category, mask)
+        if self._last and self._last[0] == key:
+            return self._last[1]
+
+        sets = []
+        facets = (space, region, context, category)
+        for (facet, _), value in zip(self.FACETS, facets, strict=True):
+            if value != 'ANY':
+                sets.append(self._facets[facet].get(value, ()))
+        if mask:
+            sets.append(self._find_mask(mask))
+
+        if sets:
+            sets.sort(key=len)
+            ret = self._visible.intersection(*sets)
+        else:
+            ret = set(self._visible)
+
+        self._last = (key, ret)
+        return ret
+
+    def panel_types(self, tp_names):
+        """Panel types for the names, sorted by name."""
+        self._ensure()
+        return [self._types[name] for name in sorted(tp_names)]
+
+
+panel_index = PanelIndex()
+
+
 def bl_panel_enum_items(include_hidden=True):
     ret = []
     panel_tp = Panel
@@ -1060,6 +1251,7 @@ def register():
 def unregister():
     unhide_panels()
     _hidden_panels.clear()
+    panel_index.clear()
 
     for panels in _panels.values():
         for panel in panels:
@@ -3,9 +3,10 @@
 #
 # 責務:
 #   - find_area, find_region, find_window, find_screen: Blenderオブジェクト検索
-#   - ContextOverride, get_override_args: コンテキストオーバーライド
+#   - ContextOverride, build_override, get_override_args: コンテキストオーバーライド
 #   - focus_area, override_context: エリアフォーカス・コンテキスト切替
 #   - toggle_header, move_header, toggle_sidebar: UI領域の表示切替
+#   - ScreenLayout, get_screen_layout: エリア隣接グラフ (レイアウト署名でキャッシュ)
 #
 # Moved from: screen_utils.py (PME2 layer separation)
 
@@ -92,6 +93,186 @@ def move_header(area=None, top=None, visible=None, auto=None):
     return True
 
 
+# ======================================================
+# Screen layout index
+# ======================================================
+#
+# Area lookups and neighbour detection are derived from the same cached
+# index. The index is rebuilt only when the layout signature of the screen
+# changes (area added/removed/resized or area type switched).
+
+AREA_MATCH_TOLERANCE = 5  # px, max size/position mismatch of aligned areas
+MAX_LEARNED_GAP = 50  # px, larger gaps are not treated as area borders
+
+_layouts: Dict[int, "ScreenLayout"] = {}
+
+
+def layout_signature(screen: bpy.types.Screen) -> tuple:
+    """Return a cheap fingerprint of the area layout of a screen."""
+    return tuple(
+        (a.as_pointer(), a.type, a.x, a.y, a.width, a.height) for a in screen.areas
+    )
+
+
+def _sweep_pairs(rects, pos_idx, size_idx, tolerance=AREA_MATCH_TOLERANCE):
+    """Yield index pairs of rects whose position and size both match.
+
+    Rects are swept in position order, so each rect is only compared with
+    the rects inside its tolerance band instead of with every other rect.
+    """
+    order = sorted(range(len(rects)), key=lambda i: rects[i][pos_idx])
+    num = len(order)
+    for n in range(num):
+        i = order[n]
+        pos = rects[i][pos_idx]
+        size = rects[i][size_idx]
+        for m in range(n + 1, num):
+            j = order[m]
+            if rects[j][pos_idx] - pos > tolerance:
+                break
+            if abs(rects[j][size_idx] - size) <= tolerance:
+                yield (i, j) if i < j else (j, i)
+
+
+def _gap_pattern(gaps):
+    if not gaps:
+        return None
+
+    gaps = sorted(gaps)
+    return {
+        "gaps": gaps,
+        "median": gaps[len(gaps) // 2],
+        "mean": sum(gaps) / len(gaps),
+        "min": gaps[0],
+        "max": gaps[-1],
+        "count": len(gaps),
+    }
+
+
+class ScreenLayout:
+    """Area adjacency graph of a screen.
+
+    ``rows[i]`` holds the areas aligned horizontally with area ``i``
+    (same y and height), ``cols[i]`` the areas aligned vertically
+    (same x and width). Both lists keep the screen order of the areas.
+    """
+
+    def __init__(self, screen: bpy.types.Screen, signature: tuple):
+        self.signature = signature
+        self.areas = list(screen.areas)
+        self.by_type: Dict[str, list] = {}
+        self.rows = [[] for _ in self.areas]
+        self.cols = [[] for _ in self.areas]
+        self._index = {}
+        self._regions = {}
+
+        rects = [s[2:] for s in signature]
+        for i, a in enumerate(self.areas):
+            self._index[signature[i][0]] = i
+            self.by_type.setdefault(a.type, []).append(a)
+
+        h_gaps = []
+        for i, j in _sweep_pairs(rects, 1, 3):
+            self.rows[i].append(j)
+            self.rows[j].append(i)
+            gap = self._gap(rects[i][0], rects[i][2], rects[j][0], rects[j][2])
+            if 0 < gap < MAX_LEARNED_GAP:
+                h_gaps.append(gap)
+
+        v_gaps = []
+        for i, j in _sweep_pairs(rects, 0, 2):
+            self.cols[i].append(j)
+            self.cols[j].append(i)
+            gap = self._gap(rects[i][1], rects[i][3], rects[j][1], rects[j][3])
+            if 0 < gap < MAX_LEARNED_GAP:
+                v_gaps.append(gap)
+
+        for lst in self.rows:
+            lst.sort()
+        for lst in self.cols:
+            lst.sort()
+
+        self.h_gap_pattern = _gap_pattern(h_gaps)
+        self.v_gap_pattern = _gap_pattern(v_gaps)
+
+    @staticmethod
+    def _gap(pos_a, size_a, pos_b, size_b):
+        if pos_a < pos_b:
+            return pos_b - (pos_a + size_a)
+        return pos_a - (pos_b + size_b)
+
+    def index(self, area: bpy.types.Area) -> Optional[int]:
+        return self._index.get(area.as_pointer())
+
+    def _neighbours(self, area, graph, pos_attr, size_attr):
+        idx = self.index(area)
+        if idx is not None:
+            return [self.areas[i] for i in graph[idx]]
+
+        # Area from another screen: compare against every area
+        pos = getattr(area, pos_attr)
+        size = getattr(area, size_attr)
+        return [
+            a for a in self.areas
+            if a != area
+            and abs(getattr(a, pos_attr) - pos) <= AREA_MATCH_TOLERANCE
+            and abs(getattr(a, size_attr) - size) <= AREA_MATCH_TOLERANCE
+        ]
+
+    def row_neighbours(self, area: bpy.types.Area) -> list:
+        """Areas that can be left/right neighbours of the area."""
+        return self._neighbours(area, self.rows, "y", "height")
+
+    def col_neighbours(self, area: bpy.types.Area) -> list:
+        """Areas that can be top/bottom neighbours of the area."""
+        return self._neighbours(area, self.cols, "x", "width")
+
+    def find_area(self, area_type: str) -> Optional[bpy.types.Area]:
+        areas = self.by_type.get(area_type)
+        return areas[0] if areas else None
+
+    def find_region(
+        self, area: bpy.types.Area, region_type: str
+    ) -> Optional[bpy.types.Region]:
+        regions = area.regions
+        key = (area.as_pointer(), region_type)
+        cached = self._regions.get(key)
+        if cached and cached[0] == len(regions):
+            return cached[1]
+
+        region = None
+        for r in regions:
+            if r.type == region_type:
+                region = r
+                break
+
+        self._regions[key] = (len(regions), region)
+        return region
+
+
+def get_screen_layout(
+    screen: Optional[bpy.types.Screen] = None,
+) -> Optional[ScreenLayout]:
+    """Return the cached layout index of the screen, rebuilding it if stale."""
+    screen = screen or bpy.context.screen
+    if screen is None:
+        return None
+
+    key = screen.as_pointer()
+    signature = layout_signature(screen)
+    layout = _layouts.get(key)
+    if layout is None or layout.signature != signature:
+        if len(_layouts) > 32:
+            _layouts.clear()
+        layout = _layouts[key] = ScreenLayout(screen, signature)
+
+    return layout
+
+
+def clear_layout_cache():
+    _layouts.clear()
+
+
 def find_area(
     area_or_type: Union[str, bpy.types.Area, None],
     screen_or_name: Union[str, bpy.types.Screen, None] = None
@@ -105,14 +286,11 @@ def find_area(
         return area_or_type
 
     screen = find_screen(screen_or_name, bpy.context)
-    if screen is None:
-        screen = bpy.context.screen
+    layout = get_screen_layout(screen)
+    if layout is None:
+        return None
 
-    for a in screen.areas:
-        if a.type == area_or_type:
-            return a
-
-    return None
+    return layout.find_area(area_or_type)
 
 
 def find_region(
@@ -127,15 +305,26 @@ def find_region(
     if isinstance(region_or_type, bpy.types.Region):
         return region_or_type
 
-    area = find_area(area_or_type, screen_or_name)
+    layout = None
+    area = area_or_type
+    if not isinstance(area, bpy.types.Area):
+        layout = get_screen_layout(find_screen(screen_or_name, bpy.context))
+        area = layout.find_area(area) if layout and area else None
+
+    return _find_region(layout, area or bpy.context.area, region_or_type)
+
+
+def _find_region(layout, area, region_type):
+    """Find a region of the area, reusing layout if the area belongs to it."""
     if area is None:
-        area = bpy.context.area
+        return None
 
-    for r in area.regions:
-        if r.type == region_or_type:
-            return r
+    if layout is None or layout.index(area) is None:
+        layout = get_screen_layout(area.id_data)
+        if layout is None:
+            return None
 
-    return None
+    return layout.find_region(area, region_type)
 
 
 def find_window(
@@ -207,12 +396,9 @@ class ContextOverride:
     ) -> Dict[str, Any]:
 
         # Resolve all fields
-        w = find_window(self.window, context)
-        sc = find_screen(self.screen, context)
-        a = find_area(self.area, sc)
-        r = find_region(self.region, self.area, sc)
-        # bd = self.blend_data  # or context.blend_data
-
+        w, sc, a, r = build_override(
+            context, self.window, self.screen, self.area, self.region
+        )
         base_dict = {
             "window": w,
             "screen": sc,
@@ -239,6 +425,49 @@ class ContextOverride:
         )
 
 
+def build_override(
+    context: bpy.types.Context,
+    window: Union[str, bpy.types.Window, None] = None,
+    screen: Union[str, bpy.types.Screen, None] = None,
+    area: Union[str, bpy.types.Area, None] = None,
+    region: Union[str, bpy.types.Region, None] = None,
+    use_context: bool = False,
+) -> tuple:
+    """Resolve (window, screen, area, region) override targets.
+
+    Areas and regions are looked up in the cached ScreenLayout of the
+    screen (or of the window's screen), which is fetched and its
+    signature checked once per call.
+    With use_context, unresolved targets fall back to the context and the
+    region to the last region of the area.
+    """
+    w = find_window(window, context)
+    sc = find_screen(screen, context)
+    # Areas of another window are looked up in that window's screen
+    lookup_screen = sc or (w.screen if w else None) or context.screen
+    if use_context:
+        w = w or context.window
+        sc = lookup_screen
+
+    layout = None
+    a = area
+    if not isinstance(a, bpy.types.Area):
+        layout = get_screen_layout(lookup_screen)
+        a = layout.find_area(a) if layout and a else None
+
+    if use_context:
+        a = a or context.area
+
+    r = region
+    if r is not None and not isinstance(r, bpy.types.Region):
+        r = _find_region(layout, a or context.area, r)
+
+    if use_context and r is None and a and a.regions:
+        r = a.regions[-1]
+
+    return w, sc, a, r
+
+
 def get_override_args(
     area: Union[str, bpy.types.Area] = None,
     region: Union[str, bpy.types.Region] = "WINDOW",
@@ -292,10 +521,9 @@ def focus_area(area, center=False, cmd=None):
 def override_context(
     area, screen=None, window=None, region='WINDOW', enter=True, **kwargs):
     context = bpy.context
-    window = find_window(window, context) or context.window
-    screen = find_screen(screen, context) or context.screen
-    area = find_area(area, screen) or context.area
-    region = find_region(region, area, screen) or area.regions[-1]
+    window, screen, area, region = build_override(
+        context, window, screen, area, region, use_context=True
+    )
 
     if all(v is None for v in (window, screen, area, region)):
         oc = context.temp_override()
@@ -337,12 +565,8 @@ def exec_with_override(cmd, window=None, screen=None, area=None, region=None, **
     """Execute a command with a temporary bl_context"""
     try:
         context = bpy.context
-        window = find_window(window, context) or context.window
-        screen = find_screen(screen, context) or context.screen
-        area = find_area(area, screen) or context.area
-        region = (
-            find_region(region, area, screen)
-            or (area.regions[-1] if area and area.regions else None)
+        window, screen, area, region = build_override(
+            context, window, screen, area, region, use_context=True
         )
 
         override_args = {
@@ -380,3 +604,7 @@ def register():
     pme.context.add_global("override_context", override_context)
     pme.context.add_global("redraw_screen", redraw_screen)
     pme.context.add_global("exec_with_override", exec_with_override)
+
+
+def unregister():
+    clear_layout_cache()
@@ -13,12 +13,15 @@ LAYER = "ui"
 
 import bpy
 import os
+import re
 import sys
 import marshal
 import py_compile
+import threading
 from traceback import format_exc
 from errno import ENOENT
 from ..addon import ADDON_PATH, get_prefs, print_exc
+from ..infra.debug import DBG_RUNTIME, dbg_log
 from ..infra.io import get_user_scripts_dir, get_system_scripts_dir
 from .. import pme
 from ..core.schema import schema
@@ -157,7 +160,12 @@ def header_menu(areas):
     return True
 
 
-def execute_script(path, **kwargs):
+SCRIPT_POLL_INTERVAL = 2.0
+
+re_execute_script = re.compile(r"""execute_script\(\s*r?(["'])(.+?)\1""")
+
+
+def resolve_script_path(path):
     if not os.path.isabs(path):
         # For relative paths starting with "scripts/", search user dir first
         if path.startswith("scripts/") or path.startswith("scripts\\"):
@@ -177,52 +185,178 @@ def execute_script(path, **kwargs):
     if not os.path.isfile(path):
         raise OSError(ENOENT, os.strerror(ENOENT), path)
 
-    exec_globals = pme.context.gen_globals()
-    exec_globals["kwargs"] = kwargs
-    exec_globals["__file__"] = path
+    return path
 
-    pr = get_prefs()
-    if pr.cache_scripts:
-        name = os.path.basename(path)
-        name, _, _ = name.rpartition(".")
-        cname = name + ".cpython-%d%d.pyc" % (sys.version_info[0], sys.version_info[1])
-        cpath = os.path.join(os.path.dirname(path), "__pycache__", cname)
-
-        try:
-            if os.path.isfile(cpath):
-                cmod_time = os.stat(cpath).st_mtime
-                mod_time = os.stat(path).st_mtime
-                if mod_time > cmod_time:
-                    cpath = py_compile.compile(path)
-            else:
-                cpath = py_compile.compile(path)
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class ScriptCache:
+    """Compiled external scripts for execute_script.
+
+    paths maps the path passed to execute_script to the resolved file,
+    codes maps resolved files to ((mtime, size), code object).
+
+    With cache_scripts enabled a hit touches no files; a bpy.app.timers
+    poll re-resolves the paths and drops entries whose source changed.
+    Set poll_interval to None to turn polling off. Without cache_scripts
+    every call resolves and stats the file but recompiles only when the
+    stamp changed.
+    """
+
+    def __init__(self):
+        self.paths = {}
+        self.codes = {}
+        self.poll_interval = SCRIPT_POLL_INTERVAL
+
+    def clear(self):
+        self.paths.clear()
+        self.codes.clear()
+        if bpy.app.timers.is_registered(self.poll):
+            bpy.app.timers.unregister(self.poll)
+
+    def compile(self, path, use_pyc):
+        stamp = _stamp(path)
+        if use_pyc:
+            name = os.path.basename(path)
+            name, _, _ = name.rpartition(".")
+            cname = name + ".cpython-%d%d.pyc" % (sys.version_info[0], sys.version_info[1])
+            cpath = os.path.join(os.path.dirname(path), "__pycache__", cname)
+
+            if not os.path.isfile(cpath) or os.stat(cpath).st_mtime_ns < stamp[0]:
+                cpath = py_compile.compile(path, doraise=True)
 
             with open(cpath, "rb") as f:
-                if sys.version_info >= (3, 7, 0):
-                    f.read(16)
-                else:
-                    f.read(12)
-
-                exec(marshal.load(f), exec_globals)
-        except Exception:
-            if pr.show_error_trace:
-                s = format_exc()
-                print(f"[PME] Script error in: {path}")
-                print(s)
-                if pme.context.exec_operator:
-                    pme.context.exec_operator.report({'ERROR'}, s)
-
-    else:
-        try:
+                f.read(16)
+                code = marshal.load(f)
+        else:
             with open(path) as f:
-                exec(f.read(), exec_globals)
-        except Exception:
-            if pr.show_error_trace:
-                s = format_exc()
-                print(f"[PME] Script error in: {path}")
-                print(s)
-                if pme.context.exec_operator:
-                    pme.context.exec_operator.report({'ERROR'}, s)
+                code = compile(f.read(), path, 'exec')
+
+        self.codes[path] = (stamp, code)
+        return code
+
+    def get(self, path, cached):
+        if cached:
+            resolved = self.paths.get(path)
+            if resolved is None:
+                resolved = self.paths[path] = resolve_script_path(path)
+                self._start_polling()
+
+            entry = self.codes.get(resolved)
+            if entry:
+                return resolved, entry[1]
+            return resolved, None
+
+        resolved = resolve_script_path(path)
+        entry = self.codes.get(resolved)
+        if entry and entry[0] == _stamp(resolved):
+            return resolved, entry[1]
+        return resolved, None
+
+    def _start_polling(self):
+        if self.poll_interval and not bpy.app.timers.is_registered(self.poll):
+            bpy.app.timers.register(
+                self.poll, first_interval=self.poll_interval, persistent=True
+            )
+
+    def poll(self):
+        for path, resolved in list(self.paths.items()):
+            try:
+                if resolve_script_path(path) != resolved:
+                    del self.paths[path]
+            except OSError:
+                del self.paths[path]
+
+        for resolved, (stamp, _) in list(self.codes.items()):
+            try:
+                if _stamp(resolved) == stamp:
+                    continue
+            except OSError:
+                pass
+            del self.codes[resolved]
+            DBG_RUNTIME and dbg_log("runtime", f"Script changed: {resolved}")
+
+        if not self.paths or not self.poll_interval:
+            return None
+        return self.poll_interval
+
+    def warm(self, paths, use_pyc):
+        """Compile scripts in a background thread."""
+        resolved = []
+        for path in paths:
+            try:
+                if path not in self.paths:
+                    self.paths[path] = resolve_script_path(path)
+                resolved.append(self.paths[path])
+            except OSError:
+                pass
+
+        if not resolved:
+            return
+
+        self._start_polling()
+
+        def run():
+            for path in resolved:
+                if path in self.codes:
+                    continue
+                try:
+                    self.compile(path, use_pyc)
+                except Exception:
+                    pass
+
+        threading.Thread(target=run, name="pme_script_warm", daemon=True).start()
+
+
+script_cache = ScriptCache()
+
+
+def find_menu_scripts(pie_menus):
+    """Script paths passed to execute_script by enabled menus."""
+    ret = []
+    for pm in pie_menus:
+        if not pm.enabled:
+            continue
+        for pmi in pm.pmis:
+            if pmi.mode not in {'COMMAND', 'CUSTOM'} or "execute_script" not in pmi.text:
+                continue
+            for mo in re_execute_script.finditer(pmi.text):
+                path = mo.group(2)
+                if path not in ret:
+                    ret.append(path)
+    return ret
+
+
+def warm_scripts():
+    pr = get_prefs()
+    if pr.cache_scripts:
+        script_cache.warm(find_menu_scripts(pr.pie_menus), True)
+    return None
+
+
+def execute_script(path, **kwargs):
+    pr = get_prefs()
+    path, code = script_cache.get(path, pr.cache_scripts)
+
+    exec_globals = pme.context.gen_globals()
+    exec_globals["kwargs"] = kwargs
+    exec_globals["__file__"] = path
+
+    try:
+        if code is None:
+            code = script_cache.compile(path, pr.cache_scripts)
+
+        exec(code, exec_globals)
+    except Exception:
+        if pr.show_error_trace:
+            s = format_exc()
+            print(f"[PME] Script error in: {path}")
+            print(s)
+            if pme.context.exec_operator:
+                pme.context.exec_operator.report({'ERROR'}, s)
 
     return exec_globals.get("return_value", True)
 
@@ -329,8 +463,15 @@ def register():
     pme.context.add_global("execute_script", execute_script)
     pme.context.add_global("toggle_menu", toggle_menu)
 
+    # Menus are restored after the modules are registered
+    bpy.app.timers.register(warm_scripts, first_interval=1.0)
+
 
 def unregister():
+    if bpy.app.timers.is_registered(warm_scripts):
+        bpy.app.timers.unregister(warm_scripts)
+    script_cache.clear()
+
     for cl in pme_menu_classes.values():
         bpy.utils.unregister_class(cl)
 